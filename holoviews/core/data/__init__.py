@@ -19,6 +19,7 @@ from .array import ArrayInterface
 from .dictionary import DictInterface
 from .grid import GridInterface
 from .multipath import MultiInterface         # noqa (API import)
+from .ragged import RaggedArray, RaggedInterface # noqa (API import)
 from .image import ImageInterface             # noqa (API import)
 
 default_datatype = 'dictionary'
@@ -53,6 +54,8 @@ if 'array' not in datatypes:
     datatypes.append('array')
 if 'multitabular' not in datatypes:
     datatypes.append('multitabular')
+if 'ragged' not in datatypes:
+    datatypes.append('ragged')
 
 
 def concat(datasets, datatype=None):
@@ -216,6 +219,62 @@ class Dataset(Element):
         self.redim = Redim(self, mode='dataset')
 
 
+    def _cached(self, key, compute):
+        """
+        Returns the value computed from the data for the supplied key,
+        calling compute the first time it is requested. The cached
+        values are discarded whenever the data object is replaced.
+
+        Since the cache is keyed on the identity of the data object,
+        modifying the data in place leaves the cached values (e.g. the
+        ranges) stale; assign a new data object or clear the cache by
+        setting _data_cache to None after mutating the data.
+        """
+        cache = self._data_cache_dict()
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
+
+
+    def __getstate__(self):
+        "Drops values cached from the data before pickling."
+        state = super(Dataset, self).__getstate__()
+        state.pop('_data_cache', None)
+        return state
+
+
+    def _data_cache_dict(self):
+        cache = getattr(self, '_data_cache', None)
+        if cache is None or cache[0] is not self.data:
+            cache = (self.data, {})
+            self._data_cache = cache
+        return cache[1]
+
+
+    def _cache_ranges(self, dimensions, factors=[]):
+        """
+        Computes the data ranges of the supplied dimensions and the
+        unique values of the dimensions listed in factors with a
+        single batched call to the interface, caching the results so
+        subsequent range lookups do not touch the data again.
+        """
+        if not self:
+            return
+        cache = self._data_cache_dict()
+        dims = self.dimensions()
+        dimensions = [self.get_dimension(d) for d in dimensions]
+        dimensions = [d for d in dimensions if d in dims and ('range', d.name) not in cache]
+        factors = [self.get_dimension(d) for d in factors]
+        factors = [d for d in factors if d in dims and ('factors', d.name) not in cache]
+        if not dimensions and not factors:
+            return
+        ranges, uniques = self.interface.ranges(self, dimensions, factors)
+        for d, drange in zip(dimensions, ranges):
+            cache[('range', d.name)] = drange
+        for d, values in zip(factors, uniques):
+            cache[('factors', d.name)] = util.unique_array(values)
+
+
     def closest(self, coords=[], **kwargs):
         """Snaps coordinate(s) to closest coordinate in Dataset
 
@@ -286,7 +345,8 @@ class Dataset(Element):
         elif all(util.isfinite(v) for v in dim.range) and dimension_range:
             return dim.range
         elif dim in self.dimensions() and data_range and bool(self):
-            lower, upper = self.interface.range(self, dim)
+            lower, upper = self._cached(('range', dim.name),
+                                        lambda: self.interface.range(self, dim))
         else:
             lower, upper = (np.NaN, np.NaN)
         if not dimension_range:
@@ -153,16 +153,6 @@ class ArrayInterface(Interface):
                  if kdim not in dimensions]
         vdims = dataset.vdims
 
-        # Find unique entries along supplied dimensions
-        # by creating a view that treats the selected
-        # groupby keys as a single object.
-        indices = data[:, dim_idxs].copy()
-        group_shape = indices.dtype.itemsize * indices.shape[1]
-        view = indices.view(np.dtype((np.void, group_shape)))
-        _, idx = np.unique(view, return_index=True)
-        idx.sort()
-        unique_indices = indices[idx]
-
         # Get group
         group_kwargs = {}
         if group_type != 'raw' and issubclass(group_type, Element):
@@ -170,15 +160,16 @@ class ArrayInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Iterate over the unique entries building masks
-        # to apply the group selection
+        # Sort the rows into contiguous runs of unique keys along the
+        # supplied dimensions and slice out each group
         grouped_data = []
         col_idxs = [dataset.get_dimension_index(d) for d in dataset.dimensions()
                     if d not in dimensions]
-        for group in unique_indices:
-            mask = np.logical_and.reduce([data[:, d_idx] == group[i]
-                                          for i, d_idx in enumerate(dim_idxs)])
-            group_data = data[mask][:, col_idxs]
+        order, offsets = util.group_indices([data[:, i] for i in dim_idxs])
+        sorted_data = data[order][:, col_idxs]
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            group = data[order[start], dim_idxs]
+            group_data = sorted_data[start:end]
             if not group_type == 'raw':
                 if issubclass(group_type, dict):
                     group_data = {d.name: group_data[:, i] for i, d in
@@ -197,7 +188,7 @@ class ArrayInterface(Interface):
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
+            selection_mask = cls.select_index(dataset, selection)
         indexed = cls.indexed(dataset, selection)
         data = np.atleast_2d(dataset.data[selection_mask, :])
         if len(data) == 1 and indexed and len(dataset.vdims) == 1:
@@ -233,11 +224,23 @@ class ArrayInterface(Interface):
     @classmethod
     def aggregate(cls, dataset, dimensions, function, **kwargs):
         reindexed = dataset.reindex(dimensions)
-        grouped = (cls.groupby(reindexed, dimensions, list, 'raw')
-                   if len(dimensions) else [((), reindexed.data)])
+        data, ndims = reindexed.data, len(dimensions)
+        if ndims:
+            order, offsets = util.group_indices([data[:, i] for i in range(ndims)])
+            data = data[order]
+        else:
+            offsets = np.array([0, len(data)])
+        keys = data[offsets[:-1], :ndims]
+        values = data[:, ndims:]
+
+        # Apply common reductions to all groups at once
+        reduced = util.reduce_groups(function, values, offsets, **kwargs)
+        if reduced is not None:
+            return np.column_stack([keys, reduced]), []
 
         rows = []
-        for k, group in grouped:
+        for k, start, end in zip(keys, offsets[:-1], offsets[1:]):
+            group = values[start:end]
             if isinstance(function, np.ufunc):
                 reduced = function.reduce(group, axis=0, **kwargs)
             else:
@@ -84,6 +84,38 @@ class DaskInterface(PandasInterface):
         else:
             return dd.compute(column.min(), column.max())
 
+    @classmethod
+    def ranges(cls, dataset, dimensions, factors=[]):
+        """
+        Computes the ranges and factors of all requested dimensions
+        as a single dask graph, i.e. in one pass over the partitions.
+        """
+        import dask.dataframe as dd
+        dimensions = [dataset.get_dimension(d, strict=True).name for d in dimensions]
+        factors = [dataset.get_dimension(d, strict=True).name for d in factors]
+        lazy = OrderedDict()
+        for d in dimensions:
+            column = dataset.data[d]
+            if column.dtype.kind == 'O':
+                lazy[('unique', d)] = column.unique()
+            else:
+                lazy[('min', d)] = column.min()
+                lazy[('max', d)] = column.max()
+        for d in factors:
+            if ('unique', d) not in lazy:
+                lazy[('unique', d)] = dataset.data[d].unique()
+        computed = dict(zip(lazy, dd.compute(*lazy.values())))
+
+        ranges = []
+        for d in dimensions:
+            if ('min', d) in computed:
+                ranges.append((computed[('min', d)], computed[('max', d)]))
+                continue
+            column = computed[('unique', d)]
+            column = np.sort(column[column.notnull()].values)
+            ranges.append((column[0], column[-1]) if len(column) else (None, None))
+        return ranges, [computed[('unique', d)].values for d in factors]
+
     @classmethod
     def sort(cls, dataset, by=[], reverse=False):
         dataset.param.warning('Dask dataframes do not support sorting')
@@ -166,8 +198,8 @@ class DaskInterface(PandasInterface):
 
         data = []
         group_by = [d.name for d in index_dims]
-        groupby = dataset.data.groupby(group_by)
         if len(group_by) == 1:
+            groupby = dataset.data.groupby(group_by)
             column = dataset.data[group_by[0]]
             if column.dtype.name == 'category':
                 try:
@@ -176,22 +208,62 @@ class DaskInterface(PandasInterface):
                     indices = ((ind,) for ind in column.unique().compute())
             else:
                 indices = ((ind,) for ind in column.unique().compute())
+            groups = ((coord, groupby.get_group(coord[0])) for coord in indices)
         else:
-            group_tuples = dataset.data[group_by].itertuples()
-            indices = util.unique_iterator(ind[1:] for ind in group_tuples)
-        for coord in indices:
+            groups = cls._partitioned_groups(dataset.data, group_by)
+        for coord, group_data in groups:
             if any(isinstance(c, float) and np.isnan(c) for c in coord):
                 continue
             if len(coord) == 1:
                 coord = coord[0]
-            group = group_type(groupby.get_group(coord), **group_kwargs)
-            data.append((coord, group))
+            data.append((coord, group_type(group_data, **group_kwargs)))
         if issubclass(container_type, NdMapping):
             with item_check(False), sorted_context(False):
                 return container_type(data, kdims=index_dims)
         else:
             return container_type(data)
 
+    @classmethod
+    def _partitioned_groups(cls, data, group_by):
+        """
+        Returns lazy groups of a dask DataFrame along multiple
+        columns. The unique keys (in order of appearance) are computed
+        in a single pass, after which the data is shuffled once by a
+        sort key combining the group code of each row with its
+        position. The known divisions of the sort key place each
+        group in a single partition, so each group is a lazy slice of
+        the shuffled data retaining the original row order. Computing
+        the groups together performs the shuffle only once. Groups
+        with missing key values are skipped.
+        """
+        import dask
+        keys, total = dask.compute(data[group_by].drop_duplicates(), data.index.size)
+        keys = keys.dropna()
+        if not len(keys):
+            return
+        index = pd.MultiIndex.from_frame(keys)
+        ngroups = len(index)
+
+        def group_codes(df):
+            codes = index.get_indexer(pd.MultiIndex.from_frame(df))
+            return pd.Series(codes, index=df.index)
+
+        def ones(df):
+            return pd.Series(1, index=df.index, dtype='int64')
+
+        codes = data[group_by].map_partitions(group_codes, meta=(None, 'int64'))
+        position = data.map_partitions(ones, meta=(None, 'int64')).cumsum() - 1
+        sort_key = codes * total + position
+        valid = codes >= 0
+
+        nparts = min(ngroups, data.npartitions)
+        bounds = np.unique(np.linspace(0, ngroups, nparts+1).astype(int))
+        divisions = [int(b*total) for b in bounds[:-1]] + [int(ngroups*total-1)]
+        shuffled = data[valid].set_index(sort_key[valid], divisions=divisions)
+        for code, key in enumerate(keys.itertuples(index=False)):
+            group = shuffled.loc[code*total:(code+1)*total-1]
+            yield tuple(key), group.reset_index(drop=True)
+
     @classmethod
     def aggregate(cls, dataset, dimensions, function, **kwargs):
         data = dataset.data
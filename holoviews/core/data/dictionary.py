@@ -267,6 +267,21 @@ class DictInterface(Interface):
                             for d in dimensions])
 
 
+    @classmethod
+    def _group_indices(cls, dataset, dimensions):
+        """
+        Returns the order and offsets of the rows grouped along the
+        supplied dimensions (see util.group_indices), scalar columns
+        forming a single group.
+        """
+        arrays = [dataset.data[dataset.get_dimension(d).name] for d in dimensions]
+        arrays = [arr for arr in arrays if not isscalar(arr)]
+        if arrays:
+            return util.group_indices(arrays)
+        length = len(dataset)
+        return np.arange(length), np.array([0, length] if length else [0])
+
+
     @classmethod
     def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
         # Get dimensions information
@@ -282,18 +297,19 @@ class DictInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Find all the keys along supplied dimensions
-        keys = (tuple(dataset.data[d.name] if isscalar(dataset.data[d.name])
-                      else dataset.data[d.name][i] for d in dimensions)
-                for i in range(len(dataset)))
+        # Sort the rows into contiguous runs of unique keys
+        order, offsets = cls._group_indices(dataset, dimensions)
+        columns = [(d.name, dataset.data[d.name] if isscalar(dataset.data[d.name])
+                    else np.asarray(dataset.data[d.name])[order])
+                   for d in kdims+vdims]
 
-        # Iterate over the unique entries applying selection masks
+        # Iterate over the unique entries slicing out each group
         grouped_data = []
-        for unique_key in util.unique_iterator(keys):
-            mask = cls.select_mask(dataset, dict(zip(dimensions, unique_key)))
-            group_data = OrderedDict(((d.name, dataset.data[d.name] if isscalar(dataset.data[d.name])
-                                       else dataset.data[d.name][mask])
-                                      for d in kdims+vdims))
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            unique_key = tuple(dataset.data[d.name] if isscalar(dataset.data[d.name])
+                               else dataset.data[d.name][order[start]] for d in dimensions)
+            group_data = OrderedDict(((d, vals if isscalar(vals) else vals[start:end])
+                                      for d, vals in columns))
             group_data = group_type(group_data, **group_kwargs)
             grouped_data.append((unique_key, group_data))
 
@@ -307,7 +323,7 @@ class DictInterface(Interface):
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
+            selection_mask = cls.select_index(dataset, selection)
         indexed = cls.indexed(dataset, selection)
         data = OrderedDict((k, v if isscalar(v) else v[selection_mask])
                            for k, v in dataset.data.items())
@@ -335,28 +351,38 @@ class DictInterface(Interface):
     def aggregate(cls, dataset, kdims, function, **kwargs):
         kdims = [dataset.get_dimension(d, strict=True).name for d in kdims]
         vdims = dataset.dimensions('value', label='name')
-        groups = cls.groupby(dataset, kdims, list, OrderedDict)
-        aggregated = OrderedDict([(k, []) for k in kdims+vdims])
+        order, offsets = cls._group_indices(dataset, kdims)
+        firsts = order[offsets[:-1]]
+        aggregated = OrderedDict()
+        for kdim in kdims:
+            column = dataset.data[kdim]
+            aggregated[kdim] = ([column]*len(firsts) if isscalar(column)
+                                else np.asarray(column)[firsts])
 
         dropped = []
-        for key, group in groups:
-            key = key if isinstance(key, tuple) else (key,)
-            for kdim, val in zip(kdims, key):
-                aggregated[kdim].append(val)
-            for vdim, arr in group.items():
-                if vdim in dataset.vdims:
-                    if isscalar(arr):
-                        aggregated[vdim].append(arr)
-                        continue
+        for vdim in vdims:
+            column = dataset.data[vdim]
+            if isscalar(column):
+                aggregated[vdim] = [column]*len(firsts)
+                continue
+            values = np.asarray(column)[order]
+
+            # Apply common reductions to all groups at once
+            reduced = util.reduce_groups(function, values, offsets, **kwargs)
+            if reduced is None:
+                reduced = []
+                for start, end in zip(offsets[:-1], offsets[1:]):
+                    arr = values[start:end]
                     try:
                         if isinstance(function, np.ufunc):
-                            reduced = function.reduce(arr, **kwargs)
+                            reduced.append(function.reduce(arr, **kwargs))
                         else:
-                            reduced = function(arr, **kwargs)
-                        aggregated[vdim].append(reduced)
+                            reduced.append(function(arr, **kwargs))
                     except TypeError:
                         dropped.append(vdim)
-        return aggregated, list(util.unique_iterator(dropped))
+                        break
+            aggregated[vdim] = reduced
+        return aggregated, dropped
 
 
     @classmethod
@@ -222,6 +222,16 @@ class GridInterface(DictInterface):
                 data = cls._infer_interval_breaks(data, axis=0)
             return data
 
+        key = ('coords', dim.name, ordered, edges, tuple(dataset.dimensions('key', True)))
+        return dataset._cached(key, lambda: cls._coords(dataset, dim, ordered, edges))
+
+
+    @classmethod
+    def _coords(cls, dataset, dim, ordered=False, edges=False):
+        """
+        Computes the 1D coordinates along a regularly sampled dimension,
+        which are cached by the coords method.
+        """
         data = dataset.data[dim.name]
         if ordered and np.all(data[1:] < data[:-1]):
             data = data[::-1]
@@ -341,8 +351,8 @@ class GridInterface(DictInterface):
     def values(cls, dataset, dim, expanded=True, flat=True, compute=True):
         dim = dataset.get_dimension(dim, strict=True)
         if dim in dataset.vdims or dataset.data[dim.name].ndim > 1:
-            data = dataset.data[dim.name]
-            data = cls.canonicalize(dataset, data)
+            key = ('canonical', dim.name, tuple(dataset.dimensions('key', True)))
+            data = dataset._cached(key, lambda: cls.canonicalize(dataset, dataset.data[dim.name]))
             da = dask_array_module()
             if compute and da and isinstance(data, da.Array):
                 data = data.compute()
@@ -380,33 +390,26 @@ class GridInterface(DictInterface):
         group_kwargs.update(kwargs)
 
         drop_dim = any(d not in group_kwargs['kdims'] for d in kdims)
+        remaining = [kd for kd in dataset.kdims if kd not in dimensions]
 
-        # Find all the keys along supplied dimensions
+        # Find all the keys along supplied dimensions, since the keys
+        # map directly onto array axes each group is a basic index
+        # into the underlying arrays, i.e. a view rather than a copy
         keys = [cls.coords(dataset, d.name) for d in dimensions]
-        transpose = [dataset.ndims-dataset.kdims.index(kd)-1 for kd in kdims]
-        transpose += [i for i in range(dataset.ndims) if i not in transpose]
-
-        # Iterate over the unique entries applying selection masks
+        positions = [np.arange(len(k)) for k in keys]
         grouped_data = []
-        for unique_key in zip(*util.cartesian_product(keys)):
-            select = dict(zip(dim_names, unique_key))
-            if drop_dim:
-                group_data = dataset.select(**select)
-                group_data = group_data if np.isscalar(group_data) else group_data.columns()
-            else:
-                group_data = cls.select(dataset, **select)
-
-            if np.isscalar(group_data) or (isinstance(group_data, get_array_types()) and group_data.shape == ()):
-                group_data = {dataset.vdims[0].name: np.atleast_1d(group_data)}
+        for unique_key, pos in zip(zip(*util.cartesian_product(keys)),
+                                   zip(*util.cartesian_product(positions))):
+            if len(dimensions) == dataset.ndims:
+                group_data = {vd.name: np.atleast_1d(cls._group_values(dataset, vd, pos, dim_names))
+                              for vd in dataset.vdims}
                 for dim, v in zip(dim_names, unique_key):
                     group_data[dim] = np.atleast_1d(v)
-            elif not drop_dim:
-                if isinstance(group_data, get_array_types()):
-                    group_data = {dataset.vdims[0].name: group_data}
-                for vdim in dataset.vdims:
-                    data = group_data[vdim.name]
-                    data = data.transpose(transpose[::-1])
-                    group_data[vdim.name] = np.squeeze(data)
+            elif drop_dim:
+                group_data = cls._group_grid(dataset, dim_names, pos, remaining)
+                group_data = dataset.clone(group_data, kdims=remaining).columns()
+            else:
+                group_data = cls._group_grid(dataset, dim_names, pos, kdims)
             group_data = group_type(group_data, **group_kwargs)
             grouped_data.append((tuple(unique_key), group_data))
 
@@ -417,6 +420,42 @@ class GridInterface(DictInterface):
             return container_type(grouped_data)
 
 
+    @classmethod
+    def _group_values(cls, dataset, dim, positions, dim_names):
+        """
+        Indexes the array of the supplied dimension at the integer
+        positions along the grouped axes, leaving all other axes
+        intact. Only integers and slices are used so the result is
+        a view into the underlying array.
+        """
+        index = [slice(None)]*dataset.ndims
+        for name, pos in zip(dim_names, positions):
+            index[dataset.ndims-dataset.get_dimension_index(name)-1] = pos
+        return dataset.data[dim.name][tuple(index)]
+
+
+    @classmethod
+    def _group_grid(cls, dataset, dim_names, positions, kdims):
+        """
+        Returns the gridded data of a single group, transposing the
+        value arrays to match the order of the supplied kdims.
+        """
+        kdims = [dataset.get_dimension(kd, strict=True) for kd in kdims]
+        axes = [dataset.ndims-dataset.get_dimension_index(kd)-1 for kd in dataset.kdims
+                if kd.name not in dim_names][::-1]
+        order = [dataset.ndims-dataset.get_dimension_index(kd)-1 for kd in kdims[::-1]]
+        transpose = [axes.index(ax) for ax in order]
+        data = OrderedDict([(kd.name, dataset.data[kd.name]) for kd in kdims])
+        for d in dataset.dimensions():
+            if d in dataset.kdims and not cls.irregular(dataset, d):
+                continue
+            arr = cls._group_values(dataset, d, positions, dim_names)
+            if transpose != sorted(transpose):
+                arr = arr.transpose(transpose+list(range(len(transpose), arr.ndim)))
+            data[d.name] = arr
+        return data
+
+
     @classmethod
     def key_select_mask(cls, dataset, values, ind):
         if isinstance(ind, tuple):
@@ -433,10 +472,7 @@ class GridInterface(DictInterface):
             if mask is True:
                 mask = np.ones(values.shape, dtype=np.bool)
         elif isinstance(ind, (set, list)):
-            iter_slcs = []
-            for ik in ind:
-                iter_slcs.append(values == ik)
-            mask = np.logical_or.reduce(iter_slcs)
+            mask = util.isin(values, ind)
         elif callable(ind):
             mask = ind(values)
         elif ind is None:
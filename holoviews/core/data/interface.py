@@ -1,5 +1,6 @@
 from __future__ import absolute_import
 
+import numbers
 import warnings
 
 import param
@@ -303,12 +304,7 @@ class Interface(param.Parameterized):
                     if k.stop is not None:
                         mask &= arr < k.stop
             elif isinstance(k, (set, list)):
-                iter_slcs = []
-                for ik in k:
-                    with warnings.catch_warnings():
-                        warnings.filterwarnings('ignore', r'invalid value encountered')
-                        iter_slcs.append(arr == ik)
-                mask &= np.logical_or.reduce(iter_slcs)
+                mask &= util.isin(arr, k)
             elif callable(k):
                 mask &= k(arr)
             else:
@@ -322,6 +318,59 @@ class Interface(param.Parameterized):
         return mask
 
 
+    @classmethod
+    def select_index(cls, dataset, selection):
+        """
+        Given a Dataset object and a dictionary of selections (see
+        select_mask) return an index of the rows in the Dataset that
+        have been selected. Ranges along dimensions with sorted values
+        are resolved to contiguous slices using a binary search, so
+        if all selections are such ranges a slice is returned,
+        otherwise a boolean mask is returned.
+        """
+        start, stop = 0, len(dataset)
+        masked = {}
+        for dim, k in selection.items():
+            slc = cls._sorted_slice(dataset, dim, k)
+            if slc is None:
+                masked[dim] = k
+            else:
+                start, stop = max(start, slc.start), min(stop, slc.stop)
+        stop = max(start, stop)
+        if not masked:
+            return slice(start, stop)
+        mask = cls.select_mask(dataset, masked)
+        if start > 0 or stop < len(mask):
+            mask[:start] = False
+            mask[stop:] = False
+        return mask
+
+
+    @classmethod
+    def _sorted_slice(cls, dataset, dim, k):
+        """
+        Resolves a range selection along a dimension with numeric
+        values sorted in ascending order to a slice, returning None
+        if the selection cannot be expressed as a slice.
+        """
+        if isinstance(k, tuple):
+            k = slice(*k)
+        if not isinstance(k, slice) or not all(
+                isinstance(b, numbers.Number) and not isinstance(b, bool) and b == b
+                for b in (k.start, k.stop) if b is not None):
+            return None
+        dim = dataset.get_dimension(dim)
+        if dim is None:
+            return None
+        arr = cls.values(dataset, dim)
+        if (not isinstance(arr, np.ndarray) or arr.ndim != 1 or arr.dtype.kind not in 'iuf' or
+            not dataset._cached(('sorted', dim.name), lambda: util.is_sorted(arr))):
+            return None
+        start = 0 if k.start is None else np.searchsorted(arr, k.start, 'left')
+        stop = len(arr) if k.stop is None else np.searchsorted(arr, k.stop, 'left')
+        return slice(int(start), int(stop))
+
+
     @classmethod
     def indexed(cls, dataset, selection):
         """
@@ -338,6 +387,29 @@ class Interface(param.Parameterized):
     @classmethod
     def range(cls, dataset, dimension):
         column = dataset.dimension_values(dimension)
+        return cls._column_range(column)
+
+    @classmethod
+    def ranges(cls, dataset, dimensions, factors=[]):
+        """
+        Computes the ranges of the supplied dimensions along with the
+        unique values (factors) of the dimensions listed in factors.
+        Interfaces wrapping lazy data may override this method to
+        compute all the requested values in a single pass over the
+        data.
+
+        Returns:
+            Tuple of the list of ranges and the list of factors
+        """
+        return ([cls.range(dataset, d) for d in dimensions],
+                [cls.values(dataset, d, expanded=False) for d in factors])
+
+    @classmethod
+    def _column_range(cls, column):
+        """
+        Computes the range of a flat array of values ignoring NaNs,
+        falling back to sorting for non-numeric values.
+        """
         if column.dtype.kind == 'M':
             return column.min(), column.max()
         elif len(column) == 0:
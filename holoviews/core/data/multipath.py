@@ -258,6 +258,20 @@ class MultiInterface(Interface):
             length += ds.interface.length(ds)
         return length+len(dataset.data)-1
 
+    @classmethod
+    def path_lengths(cls, dataset):
+        """
+        Returns the number of rows in each subpath.
+        """
+        if not dataset.data:
+            return np.array([], dtype='int64')
+        ds = cls._inner_dataset_template(dataset)
+        lengths = []
+        for d in dataset.data:
+            ds.data = d
+            lengths.append(ds.interface.length(ds))
+        return np.array(lengths, dtype='int64')
+
     @classmethod
     def dtype(cls, dataset, dimension):
         if not dataset.data:
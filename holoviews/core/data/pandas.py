@@ -265,7 +265,7 @@ class PandasInterface(Interface):
     def select(cls, dataset, selection_mask=None, **selection):
         df = dataset.data
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
+            selection_mask = cls.select_index(dataset, selection)
         indexed = cls.indexed(dataset, selection)
         df = df.iloc[selection_mask]
         if indexed and len(df) == 1 and len(dataset.vdims) == 1:
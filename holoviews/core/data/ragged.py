@@ -0,0 +1,576 @@
+from __future__ import absolute_import
+
+import numpy as np
+
+from .. import util
+from ..dimension import dimension_name
+from ..element import Element
+from ..ndmapping import OrderedDict, NdMapping, item_check, sorted_context
+from .interface import Interface, DataError
+
+
+def _gather(offsets, index):
+    """
+    Given the offsets delimiting a number of contiguous runs and an
+    index into those runs returns the offsets of the selected runs
+    once concatenated and the flat indices of the rows they contain.
+    """
+    starts, ends = offsets[:-1][index], offsets[1:][index]
+    lengths = ends - starts
+    new_offsets = np.zeros(len(lengths)+1, dtype='int64')
+    np.cumsum(lengths, out=new_offsets[1:])
+    rows = (np.arange(new_offsets[-1], dtype='int64') +
+            np.repeat(starts - new_offsets[:-1], lengths))
+    return new_offsets, rows
+
+
+def _separated(values, offsets):
+    """
+    Concatenates the runs of the supplied flat array delimited by the
+    offsets, inserting a NaN separator between each non-empty run.
+    """
+    lengths = np.diff(offsets)
+    nonempty = lengths > 0
+    count = nonempty.sum()
+    if not count:
+        return np.array([])
+    values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind in 'fcMm':
+        dtype = values.dtype
+    elif kind in 'iub':
+        dtype = np.float64
+    else:
+        dtype = object
+    sep = np.datetime64('NaT') if kind == 'M' else np.timedelta64('NaT') if kind == 'm' else np.NaN
+    out = np.full(len(values)+count-1, sep, dtype=dtype)
+    rank = np.cumsum(nonempty)-1
+    out[np.arange(len(values)) + np.repeat(rank, lengths)] = values
+    return out
+
+
+class RaggedArray(object):
+    """
+    RaggedArray stores a collection of geometries in flat columnar
+    form. Values varying along the geometries (e.g. the coordinates)
+    are concatenated into a single array per column and delimited by
+    an offsets array, i.e. the rows of the ith geometry are given by
+    offsets[i]:offsets[i+1]. Values which are constant across a
+    geometry are stored once per geometry as scalar columns.
+
+    Polygon holes may optionally be declared using the hole_offsets,
+    which delimit the hole rings belonging to each geometry, the
+    ring_offsets, which delimit the rows of each ring in the flat
+    hole_coords array, and the ring_parts, which declare the index of
+    the NaN-separated sub-geometry each ring belongs to.
+    """
+
+    def __init__(self, columns, offsets, scalars=None, hole_coords=None,
+                 hole_offsets=None, ring_offsets=None, ring_parts=None):
+        self.columns = OrderedDict((k, np.asarray(v)) for k, v in columns.items())
+        self.offsets = np.asarray(offsets, dtype='int64')
+        self.scalars = OrderedDict((k, np.asarray(v)) for k, v in (scalars or {}).items())
+        self.hole_coords = hole_coords
+        self.hole_offsets = hole_offsets
+        self.ring_offsets = ring_offsets
+        self.ring_parts = ring_parts
+
+    @classmethod
+    def from_paths(cls, paths, dimensions, hole_key=None):
+        """
+        Builds a RaggedArray from a list of tabular geometries, which
+        may be declared as 2D arrays, dataframes or dictionaries of
+        columns. Columns which are scalar across all geometries are
+        stored as scalar columns.
+        """
+        geometries = []
+        for path in paths:
+            if isinstance(path, np.ndarray):
+                path = OrderedDict((d, path[:, i]) for i, d in
+                                   enumerate(dimensions[:path.shape[1]]))
+            elif util.is_dataframe(path):
+                path = OrderedDict((d, path[d].values) for d in dimensions if d in path)
+            elif isinstance(path, tuple):
+                path = OrderedDict(zip(dimensions, path))
+            elif not isinstance(path, dict):
+                raise ValueError('RaggedArray geometries must be declared as '
+                                 'arrays, dataframes or dictionaries, found %s.'
+                                 % type(path).__name__)
+            geometries.append(path)
+
+        lengths = []
+        for geom in geometries:
+            arrays = [v for k, v in geom.items() if k in dimensions and not util.isscalar(v)]
+            lengths.append(len(arrays[0]) if arrays else 1)
+        offsets = np.zeros(len(lengths)+1, dtype='int64')
+        np.cumsum(lengths, out=offsets[1:])
+
+        columns, scalars = OrderedDict(), OrderedDict()
+        for d in dimensions:
+            values = [geom[d] for geom in geometries if d in geom]
+            if not values and geometries:
+                continue
+            elif all(util.isscalar(v) for v in values):
+                scalars[d] = np.array(values)
+            else:
+                columns[d] = np.concatenate([
+                    np.full(n, v) if util.isscalar(v) else np.asarray(v)
+                    for v, n in zip(values, lengths)])
+
+        holes = {}
+        if hole_key and any(hole_key in geom for geom in geometries):
+            rings, parts, counts = [], [], []
+            for geom in geometries:
+                geom_holes = geom.get(hole_key, [])
+                counts.append(sum(len(hs) for hs in geom_holes))
+                for i, hs in enumerate(geom_holes):
+                    rings += [np.asarray(h) for h in hs]
+                    parts += [i]*len(hs)
+            ring_offsets = np.zeros(len(rings)+1, dtype='int64')
+            np.cumsum([len(r) for r in rings], out=ring_offsets[1:])
+            hole_offsets = np.zeros(len(counts)+1, dtype='int64')
+            np.cumsum(counts, out=hole_offsets[1:])
+            holes = dict(
+                hole_coords=np.concatenate(rings) if rings else np.empty((0, 2)),
+                hole_offsets=hole_offsets, ring_offsets=ring_offsets,
+                ring_parts=np.array(parts, dtype='int64'))
+        return cls(columns, offsets, scalars, **holes)
+
+    def __len__(self):
+        return len(self.offsets)-1
+
+    @property
+    def lengths(self):
+        "The number of rows in each geometry."
+        return np.diff(self.offsets)
+
+    @property
+    def has_holes(self):
+        return self.ring_offsets is not None and len(self.ring_offsets) > 1
+
+    def geometry_index(self):
+        "Returns the index of the geometry each flat row belongs to."
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def geometry_values(self, name):
+        """
+        Returns an array of the first value of the named column in each
+        geometry, which for scalar columns is simply the stored value.
+        """
+        if name in self.scalars:
+            return self.scalars[name]
+        column = self.columns[name]
+        if not len(column):
+            return np.full(len(self), np.NaN)
+        return column[np.minimum(self.offsets[:-1], len(column)-1)]
+
+    def clone(self, columns=None, offsets=None, scalars=None, **holes):
+        holes = dict(dict(hole_coords=self.hole_coords, hole_offsets=self.hole_offsets,
+                          ring_offsets=self.ring_offsets, ring_parts=self.ring_parts),
+                     **holes)
+        return type(self)(self.columns if columns is None else columns,
+                          self.offsets if offsets is None else offsets,
+                          self.scalars if scalars is None else scalars, **holes)
+
+    def take(self, index, names=None):
+        """
+        Selects a subset of the geometries given an integer index,
+        boolean mask or slice, optionally restricting the selection
+        to the named columns.
+        """
+        if isinstance(index, slice) and index.step in (None, 1):
+            start, stop, _ = index.indices(len(self))
+            stop = max(start, stop)
+            offsets = self.offsets[start:stop+1] - self.offsets[start]
+            rows = slice(self.offsets[start], self.offsets[stop])
+            geoms = np.arange(start, stop)
+        else:
+            geoms = np.arange(len(self))[index]
+            offsets, rows = _gather(self.offsets, geoms)
+        columns = OrderedDict((k, v[rows]) for k, v in self.columns.items()
+                              if names is None or k in names)
+        scalars = OrderedDict((k, v[geoms]) for k, v in self.scalars.items()
+                              if names is None or k in names)
+        holes = {}
+        if self.hole_offsets is not None:
+            hole_offsets, rings = _gather(self.hole_offsets, geoms)
+            ring_offsets, coords = _gather(self.ring_offsets, rings)
+            holes = dict(hole_coords=self.hole_coords[coords], hole_offsets=hole_offsets,
+                         ring_offsets=ring_offsets, ring_parts=self.ring_parts[rings])
+        return self.clone(columns, offsets, scalars, **holes)
+
+    def compress(self, mask):
+        """
+        Selects the flat rows matching the boolean mask while retaining
+        all geometries, even if they end up empty.
+        """
+        counts = np.bincount(self.geometry_index()[mask], minlength=len(self))
+        offsets = np.zeros(len(self)+1, dtype='int64')
+        np.cumsum(counts, out=offsets[1:])
+        columns = OrderedDict((k, v[mask]) for k, v in self.columns.items())
+        return self.clone(columns, offsets)
+
+    def holes(self, parts):
+        """
+        Returns the list-of-lists-of-lists of hole arrays given the
+        number of sub-geometries in each geometry.
+        """
+        holes = [[[] for _ in range(n)] for n in parts]
+        if not self.has_holes:
+            return holes
+        rings = np.split(self.hole_coords, self.ring_offsets[1:-1])
+        geoms = np.repeat(np.arange(len(self)), np.diff(self.hole_offsets))
+        for ring, geom, part in zip(rings, geoms, self.ring_parts):
+            holes[geom][part].append(ring)
+        return holes
+
+    def __repr__(self):
+        return '%s(%d geometries, columns=%s, scalars=%s)' % (
+            type(self).__name__, len(self), list(self.columns), list(self.scalars))
+
+
+
+class RaggedInterface(Interface):
+    """
+    RaggedInterface stores a collection of path or polygon geometries
+    as a RaggedArray, i.e. as flat coordinate columns delimited by an
+    offsets array along with per-geometry scalar columns. Unlike the
+    MultiInterface, which wraps a list of separate tabular datasets,
+    selection, indexing, ranges, splitting and the NaN-separated
+    values are computed as vectorized operations on the flat arrays,
+    which keeps large collections of geometries responsive.
+
+    Just like the MultiInterface the data is presented as a single
+    array of concatenated geometries separated by NaN values, while
+    iloc and select_paths index the geometries themselves.
+    """
+
+    types = (RaggedArray,)
+
+    datatype = 'ragged'
+
+    multi = True
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        if kdims is None:
+            kdims = eltype.kdims
+        if vdims is None:
+            vdims = eltype.vdims
+
+        dimensions = [dimension_name(d) for d in kdims + vdims]
+        if isinstance(data, list):
+            data = RaggedArray.from_paths(data, dimensions,
+                                          getattr(eltype, '_hole_key', None))
+        elif not isinstance(data, RaggedArray):
+            raise ValueError('RaggedInterface expects a RaggedArray or a '
+                             'list of tabular geometries.')
+        return data, {'kdims': kdims, 'vdims': vdims}, {}
+
+    @classmethod
+    def validate(cls, dataset, vdims=True):
+        data = dataset.data
+        if not len(data):
+            return
+        dim_types = 'all' if vdims else 'key'
+        dimensions = dataset.dimensions(dim_types, label='name')
+        not_found = [d for d in dimensions if d not in data.columns and d not in data.scalars]
+        if not_found:
+            raise DataError('Following columns specified as dimensions '
+                            'but not found in data: %s' % not_found, cls)
+        lengths = {len(v) for v in data.columns.values()}
+        if lengths and lengths != {data.offsets[-1]}:
+            raise DataError('RaggedArray columns must match the length '
+                            'declared by the offsets.', cls)
+        if any(len(v) != len(data) for v in data.scalars.values()):
+            raise DataError('RaggedArray scalar columns must declare one '
+                            'value per geometry.', cls)
+
+    @classmethod
+    def _column(cls, dataset, dim):
+        name = dataset.get_dimension(dim, strict=True).name
+        data = dataset.data
+        return data.scalars[name] if name in data.scalars else data.columns[name]
+
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        if not len(dataset.data):
+            return float
+        return cls._column(dataset, dim).dtype.type
+
+    @classmethod
+    def dtype(cls, dataset, dimension):
+        if not len(dataset.data):
+            return np.dtype('float')
+        return cls._column(dataset, dimension).dtype
+
+    @classmethod
+    def range(cls, dataset, dim):
+        if not len(dataset.data):
+            return (None, None)
+
+        # Backward compatibility for Contours/Polygons level
+        level = getattr(dataset, 'level', None)
+        dim = dataset.get_dimension(dim)
+        if level is not None and dim is dataset.vdims[0]:
+            return (level, level)
+        return cls._column_range(cls._column(dataset, dim))
+
+    @classmethod
+    def has_holes(cls, dataset):
+        return dataset.data.has_holes
+
+    @classmethod
+    def holes(cls, dataset):
+        data = dataset.data
+        if not len(data):
+            return []
+        coords = data.columns.get(dataset.kdims[0].name)
+        if coords is None:
+            parts = np.ones(len(data), dtype='int64')
+        else:
+            nans = np.isnan(coords.astype('float'))
+            parts = np.bincount(data.geometry_index()[nans], minlength=len(data))+1
+        return data.holes(parts)
+
+    @classmethod
+    def isscalar(cls, dataset, dim):
+        """
+        Tests if dimension is scalar in each geometry.
+        """
+        data = dataset.data
+        name = dataset.get_dimension(dim, strict=True).name
+        if not len(data) or name in data.scalars:
+            return True
+        codes, _ = util.factorize(data.columns[name])
+        geoms = data.geometry_index()
+        return not ((codes[1:] != codes[:-1]) & (geoms[1:] == geoms[:-1])).any()
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        """
+        Applies the selection to the rows of all geometries, where the
+        selection mask applies to the NaN-separated representation.
+        """
+        data = dataset.data
+        if not len(data):
+            return data
+        if selection_mask is None:
+            selection_mask = cls.select_mask(dataset, selection)
+        lengths = data.lengths
+        rank = np.cumsum(lengths > 0)-1
+        rows = np.arange(data.offsets[-1]) + np.repeat(rank, lengths)
+        return data.compress(np.asarray(selection_mask)[rows])
+
+    @classmethod
+    def select_paths(cls, dataset, selection):
+        """
+        Allows selecting paths with usual NumPy slicing index.
+        """
+        return dataset.data.take(selection)
+
+    @classmethod
+    def iloc(cls, dataset, index):
+        """
+        Indexes the geometries and columns of the data, returning the
+        value directly if a single scalar column of a single geometry
+        is selected.
+        """
+        rows, cols = index
+        scalar = util.isscalar(cols) and util.isscalar(rows)
+        if util.isscalar(cols):
+            cols = [dataset.get_dimension(cols, strict=True)]
+        elif isinstance(cols, slice):
+            cols = dataset.dimensions()[cols]
+        else:
+            cols = [dataset.get_dimension(d, strict=True) for d in cols]
+
+        data = dataset.data
+        if scalar and cols[0].name in data.scalars:
+            return data.scalars[cols[0].name][rows]
+        if util.isscalar(rows):
+            rows = [rows]
+        return data.take(rows, [d.name for d in cols])
+
+    @classmethod
+    def aggregate(cls, dataset, dimensions, function, **kwargs):
+        raise NotImplementedError('Aggregation currently not implemented')
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        # Get dimensions information
+        dimensions = [dataset.get_dimension(d) for d in dimensions]
+        kdims = [kdim for kdim in dataset.kdims if kdim not in dimensions]
+
+        # Update the kwargs appropriately for Element group types
+        group_kwargs = {}
+        group_type = list if group_type == 'raw' else group_type
+        if issubclass(group_type, Element):
+            group_kwargs.update(util.get_param_values(dataset))
+            group_kwargs['kdims'] = kdims
+        group_kwargs.update(kwargs)
+
+        # Find the value of each geometry along supplied dimensions
+        values = []
+        for d in dimensions:
+            if not cls.isscalar(dataset, d):
+                raise ValueError('RaggedInterface can only apply groupby '
+                                 'on scalar dimensions, %s dimension '
+                                 'is not scalar' % d)
+            values.append(dataset.data.geometry_values(d.name))
+
+        # Select the geometries in each group at once
+        grouped_data = []
+        if len(dataset.data):
+            order, offsets = util.group_indices(values)
+            for start, end in zip(offsets[:-1], offsets[1:]):
+                index = order[start:end]
+                unique_key = tuple(vals[index[0]] for vals in values)
+                group_data = group_type(dataset.data.take(index), **group_kwargs)
+                grouped_data.append((unique_key, group_data))
+
+        if issubclass(container_type, NdMapping):
+            with item_check(False), sorted_context(False):
+                return container_type(grouped_data, kdims=dimensions)
+        else:
+            return container_type(grouped_data)
+
+    @classmethod
+    def sample(cls, dataset, samples=[]):
+        raise NotImplementedError('Sampling operation on subpaths not supported')
+
+    @classmethod
+    def shape(cls, dataset):
+        """
+        Returns the shape of all geometries, making it appear like a
+        single array of concatenated geometries separated by NaN values.
+        """
+        return cls.length(dataset), len(dataset.dimensions())
+
+    @classmethod
+    def length(cls, dataset):
+        """
+        Returns the length of the geometries making it appear like a
+        single array of concatenated geometries separated by NaN values.
+        """
+        data = dataset.data
+        if not len(data):
+            return 0
+        nonempty = (data.lengths > 0).sum()
+        return data.offsets[-1] + max(nonempty-1, 0)
+
+    @classmethod
+    def path_lengths(cls, dataset):
+        """
+        Returns the number of rows in each geometry.
+        """
+        return dataset.data.lengths
+
+    @classmethod
+    def nonzero(cls, dataset):
+        return bool(len(dataset.data))
+
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        data = dataset.data
+        columns, scalars = [OrderedDict((dimensions[k].name if k in dimensions else k, v)
+                                        for k, v in mapping.items())
+                            for mapping in (data.columns, data.scalars)]
+        return data.clone(columns, scalars=scalars)
+
+    @classmethod
+    def values(cls, dataset, dimension, expanded=True, flat=True, compute=True):
+        """
+        Returns a single concatenated array of all geometries separated
+        by NaN values. If expanded keyword is False the unique values
+        of each geometry are concatenated instead.
+        """
+        data = dataset.data
+        if not len(data):
+            return np.array([])
+        name = dataset.get_dimension(dimension, strict=True).name
+        if name in data.scalars:
+            scalars = data.scalars[name]
+            if not expanded:
+                return scalars
+            return _separated(np.repeat(scalars, data.lengths), data.offsets)
+
+        column = data.columns[name]
+        if expanded:
+            return _separated(column, data.offsets)
+
+        # Concatenate unique values of each geometry in order of appearance
+        codes, _ = util.factorize(column)
+        geoms = data.geometry_index()
+        order = np.lexsort((codes, geoms))
+        codes, geoms = codes[order], geoms[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (codes[1:] != codes[:-1]) | (geoms[1:] != geoms[:-1])
+        return column[np.sort(order[first])]
+
+    @classmethod
+    def split(cls, dataset, start, end, datatype, **kwargs):
+        """
+        Splits a ragged Dataset into regular Datasets using regular
+        tabular interfaces, slicing the flat columns in one pass.
+        """
+        data = dataset.data.take(slice(start, end))
+        if not len(data):
+            return []
+
+        if datatype is None:
+            dims = dataset.dimensions(label='name')
+        else:
+            dims = kwargs.get('dimensions') or dataset.dimensions()
+            dims = [dataset.get_dimension(d, strict=True).name for d in dims]
+        splits = data.offsets[1:-1]
+
+        if datatype == 'array':
+            arrays = [np.repeat(data.scalars[d], data.lengths) if d in data.scalars
+                      else data.columns[d] for d in dims]
+            return np.split(np.column_stack(arrays), splits)
+        elif datatype not in (None, 'dataframe', 'columns'):
+            raise ValueError("%s datatype not support" % datatype)
+
+        columns = [(d, np.split(data.columns[d], splits)) for d in dims if d in data.columns]
+        scalars = [(d, data.scalars[d]) for d in dims if d in data.scalars]
+        hole_key = getattr(dataset, '_hole_key', None)
+        holes = cls.holes(dataset.clone(data)) if data.has_holes and hole_key else None
+
+        objs = []
+        for i in range(len(data)):
+            geom = OrderedDict([(d, vals[i]) for d, vals in columns] +
+                               [(d, vals[i]) for d, vals in scalars])
+            if holes is not None:
+                geom[hole_key] = holes[i]
+            if datatype == 'dataframe':
+                geom.pop(hole_key, None)
+                obj = util.pd.DataFrame(geom, columns=dims)
+            elif datatype == 'columns':
+                obj = geom
+            else:
+                obj = dataset.clone(geom, datatype=['dictionary'])
+            objs.append(obj)
+        return objs
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        data = dataset.data
+        if not len(data):
+            return data
+        dim = dimension_name(dimension)
+        columns, scalars = OrderedDict(data.columns), OrderedDict(data.scalars)
+        if values is None or util.isscalar(values):
+            scalars[dim] = np.array([values]*len(data))
+        elif len(values) == len(data):
+            scalars[dim] = np.asarray(values)
+        elif len(values) == data.offsets[-1]:
+            columns[dim] = np.asarray(values)
+        else:
+            raise ValueError('Added dimension values must be scalar or '
+                             'match the number of geometries or rows.')
+        return data.clone(columns, scalars=scalars)
+
+
+
+Interface.register(RaggedInterface)
@@ -215,10 +215,38 @@ class XArrayInterface(GridInterface):
         da = dask_array_module()
         if da and isinstance(dmin, da.Array):
             dmin, dmax = da.compute(dmin, dmax)
+        return cls._range_scalars(dmin, dmax)
+
+    @classmethod
+    def _range_scalars(cls, dmin, dmax):
         dmin = dmin if np.isscalar(dmin) or isinstance(dmin, util.datetime_types) else dmin.item()
         dmax = dmax if np.isscalar(dmax) or isinstance(dmax, util.datetime_types) else dmax.item()
         return dmin, dmax
 
+    @classmethod
+    def ranges(cls, dataset, dimensions, factors=[]):
+        """
+        Computes the ranges of all requested dimensions backed by dask
+        arrays in a single dask computation, falling back to the
+        regular range computation for all other dimensions.
+        """
+        da = dask_array_module()
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        ranges, lazy = {}, OrderedDict()
+        for dim in dimensions:
+            data = dataset.data[dim.name]
+            if (da is None or (dataset._binned and dim in dataset.kdims) or
+                not len(data) or not isinstance(data.data, da.Array)):
+                ranges[dim.name] = cls.range(dataset, dim)
+            else:
+                lazy[dim.name] = (data.min().data, data.max().data)
+        if lazy:
+            computed = da.compute(*[v for minmax in lazy.values() for v in minmax])
+            for i, name in enumerate(lazy):
+                ranges[name] = cls._range_scalars(*computed[i*2:i*2+2])
+        return ([ranges[dim.name] for dim in dimensions],
+                [cls.values(dataset, d, expanded=False) for d in factors])
+
 
     @classmethod
     def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
@@ -240,17 +268,35 @@ class XArrayInterface(GridInterface):
 
         drop_dim = any(d not in group_kwargs['kdims'] for d in element_dims)
 
-        # XArray 0.7.2 does not support multi-dimensional groupby
-        # Replace custom implementation when
-        # https://github.com/pydata/xarray/pull/818 is merged.
         group_by = [d.name for d in index_dims]
         data = []
-        if len(dimensions) == 1:
+        if all(d in dataset.data.dims for d in group_by):
+            # Grouped dimensions map directly onto array axes so
+            # groups are selected by integer position, which returns
+            # views into the underlying arrays
+            keys, positions = [], []
+            for d in group_by:
+                coords = cls.coords(dataset, d)
+                inds = np.arange(len(coords))
+                if len(coords) > 1 and np.all(coords[1:] < coords[:-1]):
+                    coords, inds = coords[::-1], inds[::-1]
+                keys.append(coords)
+                positions.append(inds)
+            for k, inds in zip(zip(*util.cartesian_product(keys)),
+                               zip(*util.cartesian_product(positions))):
+                sel = dataset.data.isel(**dict(zip(group_by, inds)))
+                if drop_dim:
+                    sel = sel.to_dataframe().reset_index()
+                data.append((k, group_type(sel, **group_kwargs)))
+        elif len(dimensions) == 1:
             for k, v in dataset.data.groupby(index_dims[0].name):
                 if drop_dim:
                     v = v.to_dataframe().reset_index()
                 data.append((k, group_type(v, **group_kwargs)))
         else:
+            # XArray 0.7.2 does not support multi-dimensional groupby
+            # Replace custom implementation when
+            # https://github.com/pydata/xarray/pull/818 is merged.
             unique_iters = [cls.values(dataset, d, False) for d in group_by]
             indexes = zip(*util.cartesian_product(unique_iters))
             for k in indexes:
@@ -305,20 +351,13 @@ class XArrayInterface(GridInterface):
     @classmethod
     def values(cls, dataset, dim, expanded=True, flat=True, compute=True):
         dim = dataset.get_dimension(dim, strict=True)
-        data = dataset.data[dim.name].data
         irregular = cls.irregular(dataset, dim) if dim in dataset.kdims else False
-        irregular_kdims = [d for d in dataset.kdims if cls.irregular(dataset, d)]
-        if irregular_kdims:
-            virtual_coords = list(dataset.data[irregular_kdims[0].name].coords.dims)
-        else:
-            virtual_coords = []
         if dim in dataset.vdims or irregular:
-            data_coords = list(dataset.data[dim.name].dims)
+            key = ('canonical', dim.name, tuple(dataset.dimensions('key', True)))
+            data = dataset._cached(key, lambda: cls._canonical_values(dataset, dim))
             da = dask_array_module()
             if compute and da and isinstance(data, da.Array):
                 data = data.compute()
-            data = cls.canonicalize(dataset, data, data_coords=data_coords,
-                                    virtual_coords=virtual_coords)
             return data.T.flatten() if flat else data
         elif expanded:
             data = cls.coords(dataset, dim.name, expanded=True)
@@ -327,6 +366,23 @@ class XArrayInterface(GridInterface):
             return cls.coords(dataset, dim.name, ordered=True)
 
 
+    @classmethod
+    def _canonical_values(cls, dataset, dim):
+        """
+        Returns the array of values along the supplied dimension in
+        canonical orientation, which is cached by the values method.
+        """
+        irregular_kdims = [d for d in dataset.kdims if cls.irregular(dataset, d)]
+        if irregular_kdims:
+            virtual_coords = list(dataset.data[irregular_kdims[0].name].coords.dims)
+        else:
+            virtual_coords = []
+        data_coords = list(dataset.data[dim.name].dims)
+        return cls.canonicalize(dataset, dataset.data[dim.name].data,
+                                data_coords=data_coords,
+                                virtual_coords=virtual_coords)
+
+
     @classmethod
     def aggregate(cls, dataset, dimensions, function, **kwargs):
         reduce_dims = [d.name for d in dataset.kdims if d not in dimensions]
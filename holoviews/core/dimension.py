@@ -422,6 +422,51 @@ class Dimension(param.Parameterized):
                     return formatter % value
         return unicode(bytes_to_unicode(value))
 
+    def pprint_values(self, values):
+        """Applies the applicable formatter to an array of values.
+
+        Equivalent to calling pprint_value on each value but formats
+        each unique value only once, using vectorized NumPy string
+        formatting for numeric values where possible.
+
+        Args:
+            values: Array of dimension values to format
+
+        Returns:
+            List of formatted dimension values
+        """
+        values = np.asarray(values)
+        if not len(values):
+            return []
+        elif values.dtype.kind == 'O':
+            # Object arrays may mix types and missing values, so
+            # formatted values are cached by type and value instead
+            cache, formatted = {}, []
+            for v in values:
+                try:
+                    key = (type(v), v)
+                    if key not in cache:
+                        cache[key] = self.pprint_value(v)
+                    formatted.append(cache[key])
+                except TypeError:
+                    formatted.append(self.pprint_value(v))
+            return formatted
+        codes, _ = util.factorize(values)
+        _, first = np.unique(codes, return_index=True)
+        uniques = values[first]
+        formatter = self.value_format
+        if not formatter:
+            own_type = type(uniques[0]) if self.type is None else self.type
+            formatter = self.type_formatters.get(own_type)
+        if uniques.dtype.kind in 'biuf' and not formatter:
+            formatted = uniques.astype(unicode)
+        elif (uniques.dtype.kind in 'iuf' and isinstance(formatter, basestring)
+              and not re.findall(r"\{(\w+)\}", formatter)):
+            formatted = np.char.mod(formatter, uniques)
+        else:
+            formatted = [self.pprint_value(v) for v in uniques]
+        return np.asarray(formatted, dtype=object)[codes].tolist()
+
     def pprint_value_string(self, value):
         """Pretty print the dimension value and unit.
 
@@ -4,6 +4,7 @@ map types. The former class only allows indexing whereas the latter
 also enables slicing over multiple dimension ranges.
 """
 
+from bisect import bisect_right
 from itertools import cycle
 from operator import itemgetter
 import numpy as np
@@ -13,7 +14,7 @@ import param
 from . import util
 from .dimension import OrderedDict, Dimension, Dimensioned, ViewableElement, asdim
 from .util import (config, unique_iterator, sanitize_identifier, dimension_sort,
-                   basestring, wrap_tuple, process_ellipses, get_ndmapping_label)
+                   dimension_sort_key, basestring, wrap_tuple, process_ellipses, get_ndmapping_label)
 
 class item_check(object):
     """
@@ -79,6 +80,11 @@ class MultiDimensionalMapping(Dimensioned):
     useful slicing methods for selecting subsets of the data. Even so,
     keeping the slicing support separate from the indexing and data
     storage methods helps make both classes easier to understand.
+
+    Items added one at a time are inserted into the sorted order
+    lazily, but when building a large mapping it is still cheapest to
+    supply all the items to the constructor or to the update method,
+    which sort the items once.
     """
 
     group = param.String(default='MultiDimensionalMapping', constant=True)
@@ -170,16 +176,21 @@ class MultiDimensionalMapping(Dimensioned):
                 raise KeyError('%s dimension value %s not in'
                                ' specified dimension values.' % (dim, repr(val)))
 
+        if dim_vals not in self._data:
+            self._key_index_cache = None
+
         # Updates nested data structures rather than simply overriding them.
-        if (update and (dim_vals in self.data)
-            and isinstance(self.data[dim_vals], (MultiDimensionalMapping, OrderedDict))):
-            self.data[dim_vals].update(data)
+        if (update and (dim_vals in self._data)
+            and isinstance(self._data[dim_vals], (MultiDimensionalMapping, OrderedDict))):
+            self._data[dim_vals].update(data)
+        elif sort and dim_vals not in self._data:
+            self._insert_sorted(dim_vals, data)
+        elif dim_vals in self._data:
+            # Replacing an existing item does not change the ordering
+            self._data[dim_vals] = data
         else:
             self.data[dim_vals] = data
 
-        if sort:
-            self._resort()
-
 
     def _apply_key_type(self, keys):
         """
@@ -245,7 +256,109 @@ class MultiDimensionalMapping(Dimensioned):
         return data
 
 
+    @property
+    def data(self):
+        """
+        The OrderedDict holding the items, which is brought into
+        sorted order first if keys were inserted out of order since
+        it was last accessed.
+        """
+        if self.__dict__.get('_unsorted'):
+            self._apply_sort_index()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._unsorted = False
+        self._sort_index_cache = None
+
+
+    def _sort_index(self):
+        """
+        Returns the sort keys of all items in sorted order along with
+        the corresponding item keys and the sort key function. The
+        lists are maintained as new keys are inserted and discarded
+        whenever the data is replaced.
+        Raises a TypeError if the keys cannot be compared.
+        """
+        data = self._data
+        cache = self.__dict__.get('_sort_index_cache')
+        if cache is None or cache[0] is not data or len(cache[1]) != len(data):
+            sort_key = dimension_sort_key(self.kdims, self.vdims, range(self.ndims))
+            keys = list(data)
+            sort_keys = [sort_key((k, None)) for k in keys]
+            order = sorted(range(len(keys)), key=sort_keys.__getitem__)
+            if order != list(range(len(keys))):
+                keys = [keys[i] for i in order]
+                sort_keys = [sort_keys[i] for i in order]
+                self._unsorted = True
+            cache = (data, sort_keys, keys, sort_key)
+            self._sort_index_cache = cache
+        return cache[1:]
+
+
+    def _apply_sort_index(self):
+        "Rebuilds the data in the order of the sort index."
+        sort_keys, keys, sort_key = self._sort_index()
+        data = self._data
+        self._data = OrderedDict((k, data[k]) for k in keys)
+        self._sort_index_cache = (self._data, sort_keys, keys, sort_key)
+        self._unsorted = False
+
+
+    def __getstate__(self):
+        "Stores the data in sorted order under its public name."
+        data = self.data
+        state = super(MultiDimensionalMapping, self).__getstate__()
+        for key in ('_data', '_unsorted', '_sort_index_cache'):
+            state.pop(key, None)
+        state['data'] = data
+        return state
+
+
+    def __setstate__(self, d):
+        d = dict(d)
+        d['_data'] = d.pop('data', OrderedDict())
+        d['_unsorted'] = False
+        d['_sort_index_cache'] = None
+        super(MultiDimensionalMapping, self).__setstate__(d)
+
+
+    def _insert_sorted(self, key, value):
+        """
+        Inserts a new item into the sorted data by bisecting the sort
+        keys of the existing items. Items inserted out of order are
+        appended and the data is only reordered the next time it is
+        accessed, so adding many items one at a time does not rebuild
+        the data on each insertion. Falls back to a full resort if
+        the keys cannot be compared.
+        """
+        try:
+            sort_keys, keys, sort_key = self._sort_index()
+            new_key = sort_key((key, value))
+            index = bisect_right(sort_keys, new_key)
+        except TypeError:
+            self._unsorted = False
+            self._sort_index_cache = None
+            self._data[key] = value
+            self._resort()
+            return
+        self._data[key] = value
+        sort_keys.insert(index, new_key)
+        keys.insert(index, key)
+        if index != len(keys)-1:
+            self._unsorted = True
+
+
     def _resort(self):
+        sort_key = dimension_sort_key(self.kdims, self.vdims, range(self.ndims))
+        try:
+            keys = [sort_key((k, None)) for k in self.data]
+            if all(not k2 < k1 for k1, k2 in zip(keys, keys[1:])):
+                return
+        except TypeError:
+            pass
         self.data = OrderedDict(dimension_sort(self.data, self.kdims, self.vdims,
                                                range(self.ndims)))
 
@@ -492,6 +605,10 @@ class MultiDimensionalMapping(Dimensioned):
     def update(self, other):
         """Merges other item with this object
 
+        All the items are added before the data is sorted once, making
+        this the preferred way of adding many items to an existing
+        mapping.
+
         Args:
             other: Object containing items to merge into this object
                 Must be a dictionary or NdMapping type
@@ -541,6 +658,7 @@ class MultiDimensionalMapping(Dimensioned):
     def pop(self, key, default=None):
         "Standard pop semantics for all mapping types"
         if not isinstance(key, tuple): key = (key,)
+        self._key_index_cache = None
         return self.data.pop(key, default)
 
 
@@ -577,7 +695,7 @@ class MultiDimensionalMapping(Dimensioned):
             return key in self.keys()
 
     def __len__(self):
-        return len(self.data)
+        return len(self._data)
 
     ######################
     #    Deprecations    #
@@ -662,13 +780,7 @@ class NdMapping(MultiDimensionalMapping):
                for el in map_slice):
             return self._dataslice(self.data[map_slice], data_slice)
         else:
-            conditions = self._generate_conditions(map_slice)
-            items = self.data.items()
-            for cidx, (condition, dim) in enumerate(zip(conditions, self.kdims)):
-                values = dim.values
-                items = [(k, v) for k, v in items
-                         if condition(values.index(k[cidx])
-                                      if values else k[cidx])]
+            items = self._select_items(map_slice)
             sliced_items = []
             for k, v in items:
                 val_slice = self._dataslice(v, data_slice)
@@ -680,14 +792,136 @@ class NdMapping(MultiDimensionalMapping):
                 return self.clone(sliced_items)
 
 
+    def _key_indexes(self):
+        """
+        Returns the list of keys along with a dictionary of lazily
+        built per-dimension indexes, which are discarded whenever
+        keys are added or removed.
+        """
+        cache = getattr(self, '_key_index_cache', None)
+        if cache is None or cache[0] is not self.data or len(cache[1]) != len(self.data):
+            cache = (self.data, list(self.data.keys()), {})
+            self._key_index_cache = cache
+        return cache[1], cache[2]
+
+
+    def _key_index(self, idx):
+        """
+        Returns a tuple of the sorted values along the key dimension
+        at the supplied index and the positions of the corresponding
+        keys. Returns None if the values cannot be ordered as an
+        array, e.g. because they have mixed types or contain NaNs.
+        """
+        keys, indexes = self._key_indexes()
+        if idx in indexes:
+            return indexes[idx]
+        dim = self.kdims[idx]
+        values = [k[idx] for k in keys]
+        if dim.values:
+            values = [dim.values.index(v) for v in values]
+        arr = np.asarray(values)
+        kind = arr.dtype.kind
+        if kind in 'SU':
+            valid = all(isinstance(v, basestring) for v in values)
+        else:
+            valid = kind in 'iu' or (kind == 'f' and not np.isnan(arr).any())
+        index = None
+        if valid and arr.ndim == 1:
+            order = np.argsort(arr, kind='mergesort')
+            index = (arr[order], order)
+        indexes[idx] = index
+        return index
+
+
+    def _index_positions(self, idx, dim_slice):
+        """
+        Resolves the selection along a key dimension to the positions
+        of the matching keys using binary search on the dimension
+        index. Returns None if the selection has to be evaluated by
+        applying the slicing conditions to each key instead.
+        """
+        if callable(dim_slice) or isinstance(dim_slice, tuple):
+            return None
+        index = self._key_index(idx)
+        if index is None:
+            return None
+        values, order = index
+        dim_values = self.kdims[idx].values
+        try:
+            if isinstance(dim_slice, slice):
+                start, stop = dim_slice.start, dim_slice.stop
+                if dim_values:
+                    start = None if start is None else dim_values.index(start)
+                    stop = None if stop is None else dim_values.index(stop)
+                lower = 0 if start is None else values.searchsorted(start, 'left')
+                upper = len(values) if stop is None else values.searchsorted(stop, 'left')
+                return order[lower:upper]
+            selection = dim_slice if isinstance(dim_slice, (set, list)) else [dim_slice]
+            if dim_values:
+                selection = [dim_values.index(v) for v in selection]
+            ranges = [order[values.searchsorted(v, 'left'):values.searchsorted(v, 'right')]
+                      for v in selection]
+        except (TypeError, ValueError):
+            return None
+        return np.concatenate(ranges) if ranges else order[:0]
+
+
+    def _select_items(self, map_slice):
+        """
+        Returns the items matching the supplied slice, resolving the
+        selection on each dimension using the sorted key indexes
+        where possible and applying the slicing conditions otherwise.
+        """
+        conditions = self._generate_conditions(map_slice)
+        keys, _ = self._key_indexes()
+        mask, remaining = None, []
+        for cidx, (dim_slice, condition) in enumerate(zip(map_slice, conditions)):
+            if dim_slice is Ellipsis or (isinstance(dim_slice, slice) and
+                                         dim_slice == slice(None)):
+                continue
+            positions = self._index_positions(cidx, dim_slice)
+            if positions is None:
+                remaining.append((cidx, condition))
+                continue
+            selected = np.zeros(len(keys), dtype=bool)
+            selected[positions] = True
+            mask = selected if mask is None else (mask & selected)
+        if mask is not None:
+            keys = [keys[i] for i in np.flatnonzero(mask)]
+        for cidx, condition in remaining:
+            values = self.kdims[cidx].values
+            keys = [k for k in keys if condition(values.index(k[cidx])
+                                                 if values else k[cidx])]
+        return [(k, self.data[k]) for k in keys]
+
+
     def _expand_slice(self, indices):
         """
         Expands slices containing steps into a list.
         """
-        keys = list(self.data.keys())
+        keys = None
         expanded = []
         for idx, ind in enumerate(indices):
             if isinstance(ind, slice) and ind.step is not None:
+                index = None
+                if idx == 0 and self.sort and not self.kdims[idx].values:
+                    index = self._key_index(idx)
+                if index is not None:
+                    # Keys are sorted along the first dimension so the
+                    # unique values may be sliced directly from the index
+                    values = index[0]
+                    if len(values):
+                        values = values[np.r_[True, values[1:] != values[:-1]]]
+                    try:
+                        lower = 0 if ind.start is None else values.searchsorted(ind.start)
+                        upper = len(values) if ind.stop is None else values.searchsorted(ind.stop)
+                    except TypeError:
+                        pass
+                    else:
+                        expanded.append(set(values[lower:upper][::int(ind.step)].tolist()))
+                        continue
+                if keys is None:
+                    keys = list(self.data.keys())
                 dim_ind = slice(ind.start, ind.stop)
                 if dim_ind == slice(None):
                     condition = self._all_condition()
@@ -1,6 +1,7 @@
 import itertools
 import types
 import inspect
+import time
 
 from numbers import Number
 from itertools import groupby
@@ -14,12 +15,12 @@ import param
 
 from . import traversal, util
 from .accessors import Opts, Redim
-from .dimension import OrderedDict, Dimension, ViewableElement
+from .dimension import OrderedDict, Dimension, Dimensioned, ViewableElement
 from .layout import Layout, AdjointLayout, NdLayout, Empty
 from .ndmapping import UniformNdMapping, NdMapping, item_check
 from .overlay import Overlay, CompositeOverlay, NdOverlay, Overlayable
 from .options import Store, StoreOptions
-from ..streams import Stream
+from ..streams import Stream, Buffer
 
 
 
@@ -597,11 +598,11 @@ class Callable(param.Parameterized):
     to a DynamicMap.
 
     Additionally, if the memoize attribute is True, a Callable will
-    memoize the last returned value based on the arguments to the
-    function and the state of all streams on its inputs, to avoid
-    calling the function unnecessarily. Note that because memoization
-    includes the streams found on the inputs it may be disabled if the
-    stream requires it and is triggering.
+    memoize the last memoize_size returned values based on the
+    arguments to the function and the state of all streams on its
+    inputs, to avoid calling the function unnecessarily. Note that
+    because memoization includes the streams found on the inputs it
+    may be disabled if the stream requires it and is triggering.
 
     A Callable may also specify a stream_mapping which specifies the
     objects that are associated with interactive (i.e linked) streams
@@ -643,6 +644,16 @@ class Callable(param.Parameterized):
          based on the call arguments and any streams attached to the
          inputs.""")
 
+    memoize_size = param.Integer(default=1, bounds=(1, None), doc="""
+         The number of return values to memoize, once exceeded the
+         least recently used value is discarded. Increasing the size
+         allows switching back and forth between recently seen
+         arguments and stream states without calling the function.""")
+
+    memoize_ttl = param.Number(default=None, allow_None=True, bounds=(0, None), doc="""
+         The time in seconds after which a memoized return value
+         expires. By default memoized values do not expire.""")
+
     stream_mapping = param.Dict(default={}, constant=True, doc="""
          Defines how streams should be mapped to objects returned by
          the Callable, e.g. when it returns a Layout.""")
@@ -650,7 +661,8 @@ class Callable(param.Parameterized):
     def __init__(self, callable, **params):
         super(Callable, self).__init__(callable=callable,
                                        **dict(params, name=util.callable_name(callable)))
-        self._memoized = {}
+        self._memoized = OrderedDict()
+        self._memoize_stats = dict(hits=0, misses=0)
         self._is_overlay = False
         self.args = None
         self.kwargs = None
@@ -684,6 +696,40 @@ class Callable(param.Parameterized):
         return self.__class__(callable, **params)
 
 
+    def memoize_info(self):
+        """Returns statistics about the memoized return values
+
+        Returns:
+            Dictionary containing the number of memoization hits and
+            misses, the hit rate, the current number of memoized values
+            and the memoize_size
+        """
+        hits, misses = self._memoize_stats['hits'], self._memoize_stats['misses']
+        hit_rate = float(hits)/(hits+misses) if hits+misses else 0.0
+        return dict(self._memoize_stats, hit_rate=hit_rate,
+                    size=len(self._memoized), maxsize=self.memoize_size)
+
+
+    def _memoized_value(self, hashed_key):
+        """
+        Looks up a memoized return value, discarding expired values.
+        Raises a KeyError if no valid value is memoized.
+        """
+        timestamp, ret = self._memoized.pop(hashed_key)
+        if self.memoize_ttl is not None and time.time()-timestamp > self.memoize_ttl:
+            raise KeyError(hashed_key)
+        self._memoized[hashed_key] = (timestamp, ret)
+        return ret
+
+
+    def _memoize(self, hashed_key, ret):
+        "Memoizes a return value, discarding the least recently used."
+        self._memoized.pop(hashed_key, None)
+        while len(self._memoized) >= self.memoize_size:
+            self._memoized.pop(next(iter(self._memoized)))
+        self._memoized[hashed_key] = (time.time(), ret)
+
+
     def __call__(self, *args, **kwargs):
         """Calls the callable function with supplied args and kwargs.
 
@@ -711,8 +757,15 @@ class Callable(param.Parameterized):
         key = args + kwarg_hash + values
 
         hashed_key = util.deephash(key) if self.memoize else None
-        if hashed_key is not None and memoize and hashed_key in self._memoized:
-            return self._memoized[hashed_key]
+        if hashed_key is not None:
+            if memoize and hashed_key in self._memoized:
+                try:
+                    ret = self._memoized_value(hashed_key)
+                    self._memoize_stats['hits'] += 1
+                    return ret
+                except KeyError:
+                    pass
+            self._memoize_stats['misses'] += 1
 
         if self.argspec.varargs is not None:
             # Missing information on positional argument names, cannot promote to keywords
@@ -746,7 +799,7 @@ class Callable(param.Parameterized):
             raise
 
         if hashed_key is not None:
-            self._memoized = {hashed_key : ret}
+            self._memoize(hashed_key, ret)
         return ret
 
 
@@ -912,6 +965,12 @@ class DynamicMap(HoloMap):
        cache where the least recently used item is overwritten once
        the cache is full.""")
 
+    cache_memory = param.Integer(default=None, allow_None=True, bounds=(0, None), doc="""
+       The maximum estimated memory in bytes used by the cached
+       entries, computed from the size of the arrays and DataFrames
+       each entry holds. Once exceeded the least recently used items
+       are evicted. By default only cache_size limits the cache.""")
+
     def __init__(self, callback, initial_items=None, streams=None, **params):
         streams = (streams or [])
 
@@ -936,6 +995,10 @@ class DynamicMap(HoloMap):
                    'are not Stream instances: {objs}')
             raise TypeError(msg.format(objs = ', '.join('%r' % el for el in invalid)))
 
+        # Recency ordered mapping of cached keys to their estimated size
+        self._cache_order = OrderedDict()
+        self._cache_stats = dict(hits=0, misses=0, evictions=0)
+
         super(DynamicMap, self).__init__(initial_items, callback=callback, streams=valid, **params)
 
         self.opts = Opts(self, mode='dynamicmap')
@@ -1098,7 +1161,11 @@ class DynamicMap(HoloMap):
 
         with dynamicmap_memoization(self.callback, self.streams):
             retval = self.callback(*args, **kwargs)
-        return self._style(retval)
+        retval = self._style(retval)
+        for stream in self.streams:
+            if isinstance(stream, Buffer):
+                stream._annotate(retval)
+        return retval
 
 
     def options(self, *args, **kwargs):
@@ -1184,9 +1251,26 @@ class DynamicMap(HoloMap):
     def reset(self):
         "Clear the DynamicMap cache"
         self.data = OrderedDict()
+        self._cache_order = OrderedDict()
+        self._cache_stats = dict(hits=0, misses=0, evictions=0)
         return self
 
 
+    def cache_info(self):
+        """Returns statistics about the DynamicMap cache
+
+        Returns:
+            Dictionary containing the number of cache hits, misses
+            and evictions, the current and maximum number of cached
+            items and the estimated memory used by the cached items
+            along with the cache_memory limit
+        """
+        self._sync_cache()
+        return dict(self._cache_stats, size=len(self.data),
+                    maxsize=self.cache_size, nbytes=sum(self._cache_order.values()),
+                    maxbytes=self.cache_memory)
+
+
     def _cross_product(self, tuple_key, cache, data_slice):
         """
         Returns a new DynamicMap if the key (tuple form) expresses a
@@ -1214,8 +1298,11 @@ class DynamicMap(HoloMap):
         for inner_key in product:
             key = util.wrap_tuple(inner_key)
             if key in cache:
+                self._cache_stats['hits'] += 1
+                self._touch_cache(key)
                 val = cache[key]
             else:
+                self._cache_stats['misses'] += 1
                 val = self._execute_callback(*key)
             if data_slice:
                 val = self._dataslice(val, data_slice)
@@ -1323,7 +1410,11 @@ class DynamicMap(HoloMap):
             return product
 
         # Not a cross product and nothing cached so compute element.
-        if cache is not None: return cache
+        if cache is not None:
+            self._cache_stats['hits'] += 1
+            self._touch_cache(tuple_key)
+            return cache
+        self._cache_stats['misses'] += 1
         val = self._execute_callback(*tuple_key)
         if data_slice:
             val = self._dataslice(val, data_slice)
@@ -1390,16 +1481,69 @@ class DynamicMap(HoloMap):
             return dmap
 
 
+    def _cache_key(self, key):
+        "Applies the key dimension types to a key as done on insertion."
+        return tuple(v if None in [kd.type, v] else kd.type(v)
+                     for kd, v in zip(self.kdims, util.wrap_tuple(key)))
+
+
+    def _nbytes(self, val):
+        "Estimates the memory used by the data of a cached item."
+        if not isinstance(val, Dimensioned):
+            return util.estimate_nbytes(val)
+        return sum(val.traverse(lambda x: util.estimate_nbytes(x.data),
+                                [lambda x: not x._deep_indexable]))
+
+
+    def _sync_cache(self):
+        """
+        Ensures the recency order tracks exactly the keys in the
+        cache, treating items added to the data directly as the
+        least recently used.
+        """
+        order = self._cache_order
+        for key in [k for k in order if k not in self.data]:
+            del order[key]
+        untracked = [k for k in self.data if k not in order]
+        if untracked:
+            tracked = list(order.items())
+            order.clear()
+            for key in untracked:
+                order[key] = self._nbytes(self.data[key])
+            order.update(tracked)
+
+
+    def _touch_cache(self, key):
+        "Marks a cached key as most recently used."
+        key = self._cache_key(key)
+        if key in self._cache_order:
+            self._cache_order[key] = self._cache_order.pop(key)
+
+
     def _cache(self, key, val):
         """
         Request that a key/value pair be considered for caching.
         """
         cache_size = (1 if util.dimensionless_contents(self.streams, self.kdims)
                       else self.cache_size)
-        if len(self) >= cache_size:
-            first_key = next(k for k in self.data)
-            self.data.pop(first_key)
+        key = self._cache_key(key)
+        nbytes = self._nbytes(val)
+        self._sync_cache()
+        order = self._cache_order
+        if key in order:
+            del order[key]
+            self.data.pop(key)
+
+        # Evict least recently used items until the new item fits
+        total = sum(order.values())
+        while order and (len(order) >= cache_size or (self.cache_memory is not None
+                                                      and total+nbytes > self.cache_memory)):
+            lru_key = next(iter(order))
+            total -= order.pop(lru_key)
+            self.data.pop(lru_key)
+            self._cache_stats['evictions'] += 1
         self[key] = val
+        order[key] = nbytes
 
 
     def map(self, map_fn, specs=None, clone=True, link_inputs=True):
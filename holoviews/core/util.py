@@ -1,6 +1,8 @@
 import sys, warnings, operator
 import json
 import time
+import weakref
+import hashlib
 import types
 import numbers
 import inspect
@@ -11,7 +13,7 @@ import datetime as dt
 
 from distutils.version import LooseVersion as _LooseVersion
 from functools import partial
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import contextmanager
 from threading import Thread, Event
 
@@ -149,6 +151,133 @@ class Config(param.ParameterizedFunction):
 
 config = Config()
 
+_hasher = getattr(hashlib, 'blake2b', hashlib.md5)
+
+# Digests of read-only arrays cached by identity
+_digest_cache = {}
+
+def _update_array_digest(hasher, arr):
+    """
+    Updates the hasher with the dtype, shape and memory buffer of an
+    array, hashing the elements of object arrays using pandas.
+    """
+    arr = np.asarray(arr)
+    hasher.update(('%s%s' % (arr.dtype.str, arr.shape)).encode('utf-8'))
+    if arr.dtype.kind == 'O':
+        if pd is None:
+            raise TypeError('Hashing object arrays requires pandas.')
+        arr = pd.util.hash_array(arr.ravel())
+    hasher.update(np.ascontiguousarray(arr).view(np.uint8))
+
+
+def _update_pandas_digest(hasher, obj):
+    "Updates the hasher with the columns and index of a pandas object."
+    columns = obj.items() if isinstance(obj, pd.DataFrame) else [(obj.name, obj)]
+    for name, column in columns:
+        hasher.update(repr(name).encode('utf-8'))
+        values = column.values
+        if not isinstance(values, np.ndarray):
+            # Extension arrays such as Categoricals
+            values = pd.util.hash_pandas_object(column, index=False).values
+        _update_array_digest(hasher, values)
+    index = obj.index
+    hasher.update(repr(index.names).encode('utf-8'))
+    if isinstance(index, pd.RangeIndex):
+        hasher.update(repr(index).encode('utf-8'))
+    elif isinstance(index, pd.MultiIndex):
+        for level in range(index.nlevels):
+            _update_array_digest(hasher, index.get_level_values(level).values)
+    else:
+        _update_array_digest(hasher, np.asarray(index.values))
+
+
+def is_xarray(data):
+    "Whether the data is an xarray DataArray or Dataset."
+    if 'xarray' not in sys.modules:
+        return False
+    import xarray as xr
+    return isinstance(data, (xr.DataArray, xr.Dataset))
+
+
+def _update_xarray_digest(hasher, obj):
+    "Updates the hasher with the variables of an xarray object."
+    import xarray as xr
+    if isinstance(obj, xr.DataArray):
+        hasher.update(repr(obj.name).encode('utf-8'))
+        variables = dict(obj.coords.variables, **{'__values__': obj.variable})
+    else:
+        variables = obj.variables
+    for name in sorted(variables, key=str):
+        var = variables[name]
+        hasher.update(('%r%r' % (name, var.dims)).encode('utf-8'))
+        if is_dask_array(var.data):
+            hasher.update(content_digest(var.data).encode('utf-8'))
+        else:
+            _update_array_digest(hasher, var.values)
+
+
+def _is_immutable_array(array):
+    """
+    Whether neither the array nor any array in its chain of base
+    objects is writeable, i.e. whether its contents cannot change.
+    """
+    while array is not None:
+        if isinstance(array, np.ndarray):
+            if array.flags.writeable:
+                return False
+            array = array.base
+        else:
+            return isinstance(array, bytes)
+    return True
+
+
+def content_digest(obj):
+    """
+    Computes a digest of the contents of NumPy arrays, pandas and
+    xarray objects directly from their memory buffers, including the
+    dtype, shape, column names and index. Dask collections are hashed
+    by their deterministic token without computing them. The digests
+    of read-only arrays are cached by identity, since they are assumed
+    not to be modified. Read-only views onto writeable memory are
+    never cached since the data may change through the base array.
+
+    Args:
+       obj: The object to compute the digest for
+
+    Returns:
+       Hex digest string or None if the type is not supported
+    """
+    if 'dask' in sys.modules:
+        from dask.base import is_dask_collection, tokenize
+        if is_dask_collection(obj):
+            return 'dask:%s' % tokenize(obj)
+
+    cacheable = isinstance(obj, np.ndarray) and _is_immutable_array(obj)
+    if cacheable:
+        cached = _digest_cache.get(id(obj))
+        if cached is not None and cached[0]() is obj:
+            return cached[1]
+
+    hasher = _hasher()
+    if isinstance(obj, np.ndarray):
+        _update_array_digest(hasher, obj)
+    elif pd and isinstance(obj, (pd.Series, pd.DataFrame)):
+        hasher.update(type(obj).__name__.encode('utf-8'))
+        _update_pandas_digest(hasher, obj)
+    elif is_xarray(obj):
+        hasher.update(type(obj).__name__.encode('utf-8'))
+        _update_xarray_digest(hasher, obj)
+    else:
+        return None
+    digest = '%s:%s' % (type(obj).__name__, hasher.hexdigest())
+
+    if cacheable:
+        key = id(obj)
+        ref = weakref.ref(obj, lambda r: _digest_cache.pop(key, None))
+        _digest_cache[key] = (ref, digest)
+    return digest
+
+
 class HashableJSON(json.JSONEncoder):
     """
     Extends JSONEncoder to generate a hashable string for as many types
@@ -162,7 +291,9 @@ class HashableJSON(json.JSONEncoder):
     tuples and dictionaries. In order to support other types such as
     sets, datetime objects and mutable objects such as pandas Dataframes
     or numpy arrays, HashableJSON has to convert these types to
-    datastructures that can normally be represented as JSON.
+    datastructures that can normally be represented as JSON. Arrays,
+    pandas, xarray and dask objects are represented by a digest of
+    their contents (see content_digest).
 
     Support for other object types may need to be introduced in
     future. By default, unrecognized object types are represented by
@@ -177,10 +308,14 @@ class HashableJSON(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, set):
             return hash(frozenset(obj))
+        try:
+            digest = content_digest(obj)
+        except TypeError:
+            digest = None
+        if digest is not None:
+            return digest
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
-        if pd and isinstance(obj, (pd.Series, pd.DataFrame)):
-            return obj.to_csv().encode('utf-8')
         elif isinstance(obj, self.string_hashable):
             return str(obj)
         elif isinstance(obj, self.repr_hashable):
@@ -1128,6 +1263,160 @@ def unique_array(arr):
         return arr[np.sort(uniq_inds)]
 
 
+def factorize(values):
+    """
+    Encodes the values of an array as integer codes numbered in the
+    order of first appearance. All missing values (e.g. NaN or NaT)
+    are assigned to a single code.
+
+    Args:
+       values (np.ndarray): The array to factorize
+
+    Returns:
+       Tuple of the integer codes and the number of unique values
+    """
+    values = np.asarray(values)
+    if pd:
+        codes, uniques = pd.factorize(values, sort=False)
+        missing = codes == -1
+        if not missing.any():
+            return codes.astype('int64', copy=False), len(uniques)
+        codes[missing] = len(uniques)
+        return _renumber_codes(codes.astype('int64', copy=False))
+
+    try:
+        if values.dtype.kind in 'fc':
+            missing = np.isnan(values)
+        elif values.dtype.kind in 'Mm':
+            missing = np.isnat(values)
+        else:
+            missing = None
+        valid = values if missing is None else values[~missing]
+        _, inverse = np.unique(valid, return_inverse=True)
+    except TypeError:
+        # Unorderable values fall back to hashing
+        lookup = {}
+        codes = np.array([lookup.setdefault(v, len(lookup)) for v in values],
+                         dtype='int64')
+        return codes, len(lookup)
+
+    if missing is None or not missing.any():
+        codes = inverse.astype('int64')
+    else:
+        codes = np.empty(len(values), dtype='int64')
+        codes[~missing] = inverse
+        codes[missing] = inverse.max()+1 if len(inverse) else 0
+    return _renumber_codes(codes)
+
+
+def _renumber_codes(codes):
+    """
+    Renumbers a dense array of integer codes in order of first
+    appearance, returning the new codes and the number of codes.
+    """
+    order = np.argsort(codes, kind='mergesort')
+    counts = np.bincount(codes)
+    counts = counts[counts > 0]
+    firsts = order[np.cumsum(counts)-counts]
+    ranks = np.empty(len(firsts), dtype='int64')
+    ranks[np.argsort(firsts, kind='mergesort')] = np.arange(len(firsts))
+    return ranks[codes], len(firsts)
+
+
+def group_indices(arrays):
+    """
+    Groups the rows defined by one or more equal length arrays. The
+    arrays are factorized into integer group codes once and stably
+    sorted, so the rows of each group form a contiguous run of the
+    sort order. This makes grouping O(N log N) irrespective of the
+    number of groups.
+
+    Args:
+       arrays (list): List of arrays to group by
+
+    Returns:
+       Tuple of the row order and group offsets, where the indices of
+       the rows in the ith group (in order of first appearance) are
+       given by order[offsets[i]:offsets[i+1]]
+    """
+    codes, ncodes = None, 1
+    for array in arrays:
+        array_codes, narray = factorize(array)
+        if codes is None:
+            codes, ncodes = array_codes, narray
+        else:
+            codes, ncodes = factorize(codes*narray+array_codes)
+    if codes is None:
+        raise ValueError('group_indices requires at least one array to group by.')
+    order = np.argsort(codes, kind='mergesort')
+    counts = np.bincount(codes, minlength=ncodes)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    return order, offsets
+
+
+_group_reductions = {
+    np.sum: 'sum', np.add: 'sum', np.mean: 'mean', np.size: 'count',
+    len: 'count', np.min: 'min', np.amin: 'min', np.minimum: 'min',
+    np.max: 'max', np.amax: 'max', np.maximum: 'max', np.std: 'std',
+    np.var: 'var'
+}
+
+def reduce_groups(function, values, offsets, **kwargs):
+    """
+    Applies a reduction to groups of rows which form contiguous runs
+    of the supplied values (e.g. sorted using group_indices) in one
+    vectorized operation. Supports sum, mean, count (np.size or len),
+    min, max, std and var, along with the ddof keyword for the latter.
+
+    Args:
+       function (callable): The reduction function
+       values (np.ndarray): 1D or 2D array with groups along axis 0
+       offsets (np.ndarray): Start offsets of each group and the end
+           offset of the last group
+       **kwargs: Keyword arguments to the reduction function
+
+    Returns:
+       Array of reduced values, one row per group, or None if the
+       reduction cannot be vectorized
+    """
+    try:
+        reduction = _group_reductions.get(function)
+    except TypeError:
+        return None
+    values = np.asarray(values)
+    ddof = kwargs.pop('ddof', 0) if reduction in ('std', 'var') else 0
+    if (reduction is None or kwargs or values.dtype.kind not in 'biuf'
+        or len(offsets) < 2 or offsets[-1] != len(values)):
+        return None
+
+    starts = offsets[:-1]
+    counts = np.diff(offsets).reshape((-1,)+(1,)*(values.ndim-1))
+    if reduction == 'count':
+        return np.broadcast_to(counts, (len(counts),)+values.shape[1:]).copy()
+    elif reduction == 'min':
+        return np.minimum.reduceat(values, starts, axis=0)
+    elif reduction == 'max':
+        return np.maximum.reduceat(values, starts, axis=0)
+
+    if values.dtype.kind == 'b':
+        values = values.astype('int64')
+    sums = np.add.reduceat(values, starts, axis=0)
+    if reduction == 'sum':
+        return sums
+    dtype = values.dtype if values.dtype.kind == 'f' else np.float64
+    means = sums / counts
+    if reduction == 'mean':
+        return means.astype(dtype, copy=False)
+    deviations = values - np.repeat(means, counts.flatten(), axis=0)
+    squares = np.add.reduceat(deviations*deviations, starts, axis=0)
+    dof = counts - ddof
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = np.where(dof > 0, squares / dof, np.NaN)
+    if reduction == 'std':
+        variance = np.sqrt(variance)
+    return variance.astype(dtype, copy=False)
+
+
 def match_spec(element, specification):
     """
     Matches the group.label specification of the supplied
@@ -1190,12 +1479,12 @@ def merge_dimensions(dimensions_list):
     return [d(values=dvalues.get(d.name, [])) for d in dimensions]
 
 
-def dimension_sort(odict, kdims, vdims, key_index):
+def dimension_sort_key(kdims, vdims, key_index):
     """
-    Sorts data by key using usual Python tuple sorting semantics
-    or sorts in categorical order for any categorical Dimensions.
+    Returns the key function used by dimension_sort to order
+    (key, value) items, mapping values of categorical Dimensions
+    to their position in the declared values.
     """
-    sortkws = {}
     ndims = len(kdims)
     dimensions = kdims+vdims
     indexes = [(dimensions[i], int(i not in range(ndims)),
@@ -1205,16 +1494,65 @@ def dimension_sort(odict, kdims, vdims, key_index):
 
     if len(set(key_index)) != len(key_index):
         raise ValueError("Cannot sort on duplicated dimensions")
-    else:
-       sortkws['key'] = lambda x: tuple(cached_values[dim.name].index(x[t][d])
-                                        if dim.values else x[t][d]
-                                        for i, (dim, t, d) in enumerate(indexes))
+    return lambda x: tuple(cached_values[dim.name].index(x[t][d])
+                           if dim.values else x[t][d]
+                           for i, (dim, t, d) in enumerate(indexes))
+
+
+def dimension_sort(odict, kdims, vdims, key_index):
+    """
+    Sorts data by key using usual Python tuple sorting semantics
+    or sorts in categorical order for any categorical Dimensions.
+    """
+    sortkws = {'key': dimension_sort_key(kdims, vdims, key_index)}
     if sys.version_info.major == 3:
         return python2sort(odict.items(), **sortkws)
     else:
         return sorted(odict.items(), **sortkws)
 
 
+def isin(array, values):
+    """
+    Returns a boolean mask of the elements in the array equal to any
+    of the supplied values, equivalent to combining the equality
+    masks of each value with a logical or. Uses sorting or hashing
+    based membership tests where the values are of a compatible type
+    and falls back to comparing against each value otherwise.
+
+    Args:
+       array (np.ndarray): The array to test
+       values (list or set): The values to test membership against
+
+    Returns:
+       Boolean mask of the same shape as the array
+    """
+    array = np.asarray(array)
+    values = list(values)
+    if not values:
+        return np.zeros(array.shape, dtype=bool)
+    keys = np.asarray(values)
+    kinds = (array.dtype.kind, keys.dtype.kind)
+    if keys.ndim == 1:
+        if kinds[0] in 'biuf' and kinds[1] in 'biuf' or kinds[0] in 'SU' and kinds[1] == kinds[0]:
+            return np.isin(array, keys)
+        elif pd and kinds[0] == 'O' and kinds[1] in 'SU' and array.ndim == 1:
+            return pd.Series(array).isin(values).values
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', r'invalid value encountered')
+        return np.logical_or.reduce([array == v for v in values])
+
+
+def is_sorted(array):
+    """
+    Whether the array is sorted in ascending order, which is never the
+    case for arrays containing NaNs.
+    """
+    array = np.asarray(array)
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', r'invalid value encountered')
+        return bool(np.all(array[1:] >= array[:-1]))
+
+
 # Copied from param should make param version public
 def is_number(obj):
     if isinstance(obj, numbers.Number): return True
@@ -1436,6 +1774,316 @@ def is_dask_array(data):
     return (da is not None and isinstance(data, da.Array))
 
 
+def estimate_nbytes(data):
+    """
+    Estimates the memory used by the arrays and DataFrames in the
+    supplied data, recursing into dictionaries, lists and tuples.
+    Object arrays are estimated by the size of their buffer and lazy
+    (e.g. dask) data only if the size is known without computing it.
+    """
+    if pd and isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=True, deep=False).sum())
+    elif hasattr(data, 'nbytes') and not isinstance(data, (dict, list, tuple)):
+        try:
+            return int(data.nbytes)
+        except Exception:
+            return 0
+    elif isinstance(data, dict):
+        return sum(estimate_nbytes(v) for v in data.values())
+    elif isinstance(data, (list, tuple)):
+        return sum(estimate_nbytes(v) for v in data)
+    return 0
+
+
+class RingBuffer(object):
+    """
+    Preallocated columnar storage holding the last ``length`` rows of
+    a list of arrays appended in chunks. Each column is stored in an
+    array holding twice the length, new rows are written after the
+    existing rows and once the storage is full the last rows are moved
+    to the start. Appending therefore costs amortized O(chunk) and the
+    ordered rows are always available as contiguous views.
+
+    The views are only valid until the next append, which may move or
+    overwrite the rows they reference.
+    """
+
+    def __init__(self, length):
+        self.length = length
+        self._columns = None
+        self._end = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        "Removes all rows from the buffer, keeping the storage."
+        self._end = 0
+        self._count = 0
+
+    def _allocate(self, arrays):
+        "Allocates storage matching or upcasting the supplied arrays."
+        capacity = max(2*self.length, 1)
+        if self._columns is None:
+            self._columns = [np.empty((capacity,)+arr.shape[1:], dtype=arr.dtype)
+                             for arr in arrays]
+            return
+        columns = []
+        for col, arr in zip(self._columns, arrays):
+            if col.shape[1:] != arr.shape[1:]:
+                raise ValueError('Appended array shape %s does not match '
+                                 'buffer shape %s.' % (arr.shape[1:], col.shape[1:]))
+            dtype = np.result_type(col.dtype, arr.dtype)
+            columns.append(col if dtype == col.dtype else col.astype(dtype))
+        self._columns = columns
+
+    def append(self, arrays):
+        """
+        Appends rows to the buffer discarding all but the last
+        ``length`` rows.
+
+        Args:
+           arrays (list): List of equal length arrays, one per column
+        """
+        arrays = [np.asarray(arr) for arr in arrays]
+        if self._columns is not None and len(arrays) != len(self._columns):
+            raise ValueError('Expected %d columns, got %d.'
+                             % (len(self._columns), len(arrays)))
+        self._allocate(arrays)
+        nrows = len(arrays[0]) if arrays else 0
+        if nrows >= self.length:
+            # Chunk replaces all existing rows
+            for col, arr in zip(self._columns, arrays):
+                col[:self.length] = arr[nrows-self.length:]
+            self._end = self._count = self.length
+            return
+
+        capacity = len(self._columns[0])
+        if self._end + nrows > capacity:
+            # Move the rows which are kept to the start of the storage
+            keep = min(self._count, self.length-nrows)
+            for col in self._columns:
+                col[:keep] = col[self._end-keep:self._end]
+            self._end = self._count = keep
+        for col, arr in zip(self._columns, arrays):
+            col[self._end:self._end+nrows] = arr
+        self._end += nrows
+        self._count = min(self._count+nrows, self.length)
+
+    def views(self):
+        "Returns contiguous views of the buffered rows of each column."
+        if self._columns is None:
+            return []
+        return [col[self._end-self._count:self._end] for col in self._columns]
+
+
+class SlidingRange(object):
+    """
+    Tracks the minimum and maximum of the last ``length`` values of a
+    numeric or datetime column appended in chunks, ignoring NaN and
+    NaT values. Uses monotonic deques of candidate extrema, so each
+    update costs amortized O(chunk) rather than O(length).
+    """
+
+    def __init__(self, length):
+        self.length = length
+        self.clear()
+
+    def clear(self):
+        "Discards all tracked values."
+        self._count = 0
+        self._min = deque()
+        self._max = deque()
+
+    @classmethod
+    def supports(cls, values):
+        "Whether the values are of a type that can be tracked."
+        return np.asarray(values).dtype.kind in 'biufMm'
+
+    def _push(self, extrema, values, keys, indices, accumulate, compare):
+        """
+        Pushes the values which are extrema of all later values in the
+        chunk onto the deque, first popping previous values they beat.
+        """
+        later = accumulate(keys[::-1])[::-1]
+        candidates = np.ones(len(keys), dtype=bool)
+        candidates[:-1] = compare(keys[:-1], later[1:])
+        for i in np.flatnonzero(candidates):
+            while extrema and not compare(extrema[-1][1], keys[i]):
+                extrema.pop()
+            extrema.append((indices[i], keys[i], values[i]))
+
+    def update(self, values):
+        """
+        Appends a chunk of values, discarding values which no longer
+        fall within the last ``length`` values.
+        """
+        values = np.asarray(values)
+        start = self._count
+        self._count += len(values)
+        indices = np.arange(start, self._count)
+        if len(values) > self.length:
+            values, indices = values[-self.length:], indices[-self.length:]
+
+        keys = values
+        if values.dtype.kind in 'Mm':
+            valid = ~np.isnat(values)
+            keys = values.view('i8')
+        elif values.dtype.kind in 'fc':
+            valid = ~np.isnan(values)
+        else:
+            valid = None
+        if valid is not None and not valid.all():
+            values, keys, indices = values[valid], keys[valid], indices[valid]
+
+        if len(values):
+            self._push(self._min, values, keys, indices, np.minimum.accumulate, np.less)
+            self._push(self._max, values, keys, indices, np.maximum.accumulate, np.greater)
+        for extrema in (self._min, self._max):
+            while extrema and extrema[0][0] < self._count-self.length:
+                extrema.popleft()
+
+    @property
+    def range(self):
+        "The minimum and maximum of the tracked values."
+        if not self._min:
+            return np.NaN, np.NaN
+        return self._min[0][2], self._max[0][2]
+
+
+def histogram_bins(values, edges, uniform=False, mask=None):
+    """
+    Computes the index of the bin each value falls into using the
+    same semantics as np.histogram, i.e. bins are half-open except
+    for the last bin which includes the right edge. Values outside
+    the edges, non-finite values and values excluded by the optional
+    mask are assigned an index of -1.
+
+    Args:
+       values: Array of numeric values
+       edges: Monotonically increasing array of bin edges
+       uniform (bool): Whether the edges are evenly spaced, allowing
+           the bins to be computed arithmetically
+       mask: Optional boolean array of values to include
+    """
+    values = np.asarray(values)
+    edges = np.asarray(edges)
+    nbins = len(edges)-1
+    first, last = edges[0], edges[-1]
+    with np.errstate(invalid='ignore'):
+        valid = (values >= first) & (values <= last)
+    if mask is not None:
+        valid &= mask
+    bins = np.full(len(values), -1, dtype=np.intp)
+    keep = values[valid]
+    if uniform and last > first:
+        # Mirrors the arithmetic binning and edge corrections in np.histogram
+        indices = ((keep-first)*(nbins/float(last-first))).astype(np.intp)
+        indices[indices == nbins] -= 1
+        indices[keep < edges[indices]] -= 1
+        indices[(keep >= edges[indices+1]) & (indices != nbins-1)] += 1
+    else:
+        indices = np.searchsorted(edges, keep, side='right')-1
+        indices[indices == nbins] = nbins-1
+    bins[valid] = indices
+    return bins
+
+
+def histogram_counts(values, edges, weights=None, mask=None, chunksize=2**20):
+    """
+    Computes the unweighted and optionally the weighted bin counts of
+    the values in a single pass over chunks of the data, ignoring
+    non-finite values and values excluded by the optional mask.
+
+    Returns:
+       Tuple of the unweighted and weighted counts (None if no
+       weights were supplied)
+    """
+    edges = np.asarray(edges)
+    nbins = len(edges)-1
+    steps = np.diff(edges)
+    uniform = bool(len(steps)) and np.allclose(steps, steps[0])
+    counts = np.zeros(nbins)
+    weighted = None if weights is None else np.zeros(nbins)
+    for start in range(0, len(values), chunksize):
+        chunk = slice(start, start+chunksize)
+        bins = histogram_bins(values[chunk], edges, uniform,
+                              None if mask is None else mask[chunk])
+        valid = bins >= 0
+        bins = bins[valid]
+        counts += np.bincount(bins, minlength=nbins)
+        if weights is not None:
+            chunk_weights = np.asarray(weights[chunk])[valid]
+            weighted += np.bincount(bins, weights=chunk_weights, minlength=nbins)
+    return counts, weighted
+
+
+class SlidingHistogram(object):
+    """
+    Tracks the bin counts over fixed edges of the last ``length``
+    values of a column appended in chunks. The bin of each value in
+    the window is retained so that values which fall out of the
+    window can be subtracted, so each update costs O(chunk) rather
+    than O(length).
+    """
+
+    def __init__(self, edges, length, weighted=False, nonzero=False):
+        self.edges = np.asarray(edges)
+        self.length = length
+        self.weighted = weighted
+        self.nonzero = nonzero
+        steps = np.diff(self.edges)
+        self._uniform = bool(len(steps)) and np.allclose(steps, steps[0])
+        self.clear()
+
+    def clear(self):
+        "Discards all tracked values."
+        nbins = len(self.edges)-1
+        self._chunks = deque()
+        self._size = 0
+        self.counts = np.zeros(nbins)
+        self.weighted_counts = np.zeros(nbins) if self.weighted else None
+
+    def _add(self, bins, weights, sign):
+        valid = bins >= 0
+        nbins = len(self.counts)
+        self.counts += sign*np.bincount(bins[valid], minlength=nbins)
+        if self.weighted:
+            self.weighted_counts += sign*np.bincount(bins[valid], weights=weights[valid],
+                                                     minlength=nbins)
+
+    def update(self, values, weights=None):
+        """
+        Appends a chunk of values and optionally their weights,
+        discarding values which no longer fall within the last
+        ``length`` values.
+        """
+        values = np.asarray(values)
+        start = max(len(values)-self.length, 0)
+        values = values[start:]
+        if self.weighted:
+            weights = np.asarray(weights, dtype='float64')[start:]
+        mask = None
+        if self.nonzero:
+            with np.errstate(invalid='ignore'):
+                mask = values > 0
+        bins = histogram_bins(values, self.edges, self._uniform, mask)
+        self._add(bins, weights, 1)
+        self._chunks.append((bins, weights))
+        self._size += len(bins)
+        while self._size > self.length:
+            bins, weights = self._chunks.popleft()
+            expired = self._size-self.length
+            if expired < len(bins):
+                self._chunks.appendleft((bins[expired:], None if weights is None
+                                         else weights[expired:]))
+                bins = bins[:expired]
+                weights = None if weights is None else weights[:expired]
+            self._add(bins, weights, -1)
+            self._size -= len(bins)
+
+
 def get_param_values(data):
     params = dict(kdims=data.kdims, vdims=data.vdims,
                   label=data.label)
@@ -5,13 +5,15 @@ import param
 import numpy as np
 
 from ..core import Dimension, Dataset, Element2D
+from ..core.data import RaggedArray
 from ..core.accessors import Redim
-from ..core.util import max_range, search_indices
+from ..core.util import OrderedDict, max_range, search_indices
 from ..core.operation import Operation
 from .chart import Points
 from .path import Path
-from .util import (split_path, pd, circular_layout, connect_edges,
-                   connect_edges_pd, quadratic_bezier)
+from .util import (split_path, pd, circular_layout, connect_edges, # noqa (API import)
+                   connect_edges_pd, connect_edges_buffer, quadratic_bezier,
+                   index_nodes)
 
 
 class RedimGraph(Redim):
@@ -281,16 +283,17 @@ class Graph(Dataset, Element2D):
         # Compute mask for edges if nodes were selected on
         nodemask = None
         if len(nodes) != len(self.nodes):
-            xdim, ydim = dimensions[:2]
-            indices = list(nodes.dimension_values(2, False))
+            node_codes, src_idx, tgt_idx = self._node_indices()
+            indices = nodes.dimension_values(2, False)
+            # Flag selected node codes, reserving the last entry for
+            # edges whose nodes could not be found (coded as -1)
+            selected = np.zeros(len(node_codes)+1, dtype=bool)
+            selected[node_codes[np.isin(self.nodes.dimension_values(2), indices)]] = True
             if selection_mode == 'edges':
-                mask1 = self.interface.select_mask(self, {xdim.name: indices})
-                mask2 = self.interface.select_mask(self, {ydim.name: indices})
-                nodemask = (mask1 | mask2)
+                nodemask = selected[src_idx] | selected[tgt_idx]
                 nodes = self.nodes
             else:
-                nodemask = self.interface.select_mask(self, {xdim.name: indices,
-                                                             ydim.name: indices})
+                nodemask = selected[src_idx] & selected[tgt_idx]
 
         # Compute mask for edge selection
         mask = None
@@ -315,7 +318,7 @@ class Graph(Dataset, Element2D):
                 nodes = new_graph.nodes[:, :, list(unique_nodes)]
             paths = None
             if self._edgepaths:
-                edgepaths = self._split_edgepaths
+                edgepaths = self.split_edgepaths
                 paths = edgepaths.clone(edgepaths.interface.select_paths(edgepaths, mask))
                 if len(self._edgepaths.data) == 1:
                     paths = paths.clone([paths.dframe() if pd else paths.array()])
@@ -325,8 +328,28 @@ class Graph(Dataset, Element2D):
         return self.clone((data, nodes, paths))
 
 
+    def _node_indices(self):
+        """
+        Returns integer codes for the nodes and for the start and end
+        node of each edge (see index_nodes), computed once and cached
+        until either the edge or node data is replaced.
+        """
+        nodes = self.nodes
+        cache = self._data_cache_dict()
+        cached = cache.get('node_indices')
+        if cached is None or cached[0] is not nodes.data:
+            indices = index_nodes(nodes.dimension_values(2), self.dimension_values(0),
+                                  self.dimension_values(1))
+            cached = cache['node_indices'] = (nodes.data,)+indices
+        return cached[1:]
+
+
     @property
-    def _split_edgepaths(self):
+    def split_edgepaths(self):
+        """
+        Returns the EdgePaths with one path per edge, splitting the
+        NaN separated path returned by edgepaths where necessary.
+        """
         if len(self) == len(self.edgepaths.data):
             return self.edgepaths
         else:
@@ -373,15 +396,14 @@ class Graph(Dataset, Element2D):
     def edgepaths(self):
         """
         Returns the fixed EdgePaths or computes direct connections
-        between supplied nodes.
+        between supplied nodes as a single NaN separated path. Use
+        split_edgepaths to obtain one path per edge.
         """
         if self._edgepaths:
             return self._edgepaths
-        if pd is None:
-            paths = connect_edges(self)
-        else:
-            paths = connect_edges_pd(self)
-        return self.edge_type(paths, kdims=self.nodes.kdims[:2])
+        paths = connect_edges_buffer(self)
+        return self.edge_type([paths] if len(paths) else [],
+                              kdims=self.nodes.kdims[:2])
 
 
     @classmethod
@@ -654,8 +676,7 @@ class layout_chords(Operation):
 
         # Compute connectivity matrix
         matrix = np.zeros((len(nodes), len(nodes)))
-        for s, t, v in zip(src_idx, tgt_idx, values):
-            matrix[s, t] += v
+        np.add.at(matrix, (src_idx, tgt_idx), values)
 
         # Compute weighted angular slice for each connection
         weights_of_areas = (matrix.sum(axis=0) + matrix.sum(axis=1))
@@ -671,40 +692,41 @@ class layout_chords(Operation):
         mxs = np.cos(midpoints)
         mys = np.sin(midpoints)
 
-        # Compute angles of chords in each edge
-        all_areas = []
-        for i in range(areas_in_radians.shape[0]):
-            n_conn = weights_of_areas[i]
-            p0, p1 = points[i], points[i+1]
-            angles = np.linspace(p0, p1, n_conn)
-            coords = list(zip(np.cos(angles), np.sin(angles)))
-            all_areas.append(coords)
-
-        # Draw each chord by interpolating quadratic splines
+        # Assign each chord endpoint the next free angle in the slice
+        # of its node, allocating angles from the end of each slice
+        n_chords = np.asarray(values, dtype='int64')
+        chord_edge = np.repeat(np.arange(len(n_chords)), n_chords)
+        endpoints = np.column_stack([src_idx[chord_edge], tgt_idx[chord_edge]]).flatten()
+        order = np.argsort(endpoints, kind='mergesort')
+        sorted_endpoints = endpoints[order]
+        allocated = np.empty(len(endpoints), dtype='int64')
+        allocated[order] = (np.arange(len(endpoints)) -
+                            np.searchsorted(sorted_endpoints, sorted_endpoints))
+        n_conns = weights_of_areas.astype('int64')[endpoints]
+        p0, p1 = points[endpoints], points[endpoints+1]
+        steps = (p1 - p0) / np.maximum(n_conns-1, 1)
+        angles = np.where((allocated == 0) & (n_conns > 1), p1, p0 + (n_conns-1-allocated)*steps)
+        xs, ys = np.cos(angles).reshape(-1, 2).T, np.sin(angles).reshape(-1, 2).T
+
+        # Draw all chords at once by interpolating quadratic splines
         # Separate chords in each edge by NaNs
-        empty = np.array([[np.NaN, np.NaN]])
-        paths = []
-        for i in range(len(element)):
-            sidx, tidx = src_idx[i], tgt_idx[i]
-            src_area, tgt_area = all_areas[sidx], all_areas[tidx]
-            n_conns = matrix[sidx, tidx]
-            subpaths = []
-            for _ in range(int(n_conns)):
-                if not src_area or not tgt_area:
-                    continue
-                x0, y0 = src_area.pop()
-                if not tgt_area:
-                    continue
-                x1, y1 = tgt_area.pop()
-                b = quadratic_bezier((x0, y0), (x1, y1), (x0/2., y0/2.),
-                                     (x1/2., y1/2.), steps=self.p.chord_samples)
-                subpaths.append(b)
-                subpaths.append(empty)
-            subpaths = [p for p in subpaths[:-1] if len(p)]
-            if subpaths:
-                paths.append(np.concatenate(subpaths))
-            else:
-                paths.append(np.empty((0, 2)))
+        (x0, x1), (y0, y1) = xs[..., None], ys[..., None]
+        samples = self.p.chord_samples
+        chords = np.full((len(chord_edge), samples+1, 2), np.NaN)
+        chords[:, :samples] = quadratic_bezier((x0, y0), (x1, y1), (x0/2., y0/2.),
+                                               (x1/2., y1/2.), steps=samples)
+        chords = chords.reshape(-1, 2)
+
+        # Drop the NaN separator trailing the last chord of each edge
+        ends = np.cumsum(n_chords*(samples+1))
+        keep = np.ones(len(chords), dtype=bool)
+        keep[ends[n_chords > 0]-1] = False
+        lengths = np.where(n_chords, n_chords*(samples+1)-1, 0)
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        chords = chords[keep]
+        xdim, ydim = EdgePaths.kdims
+        paths = RaggedArray(OrderedDict([(xdim.name, chords[:, 0]),
+                                         (ydim.name, chords[:, 1])]), offsets)
 
         # Construct Chord element from components
         if nodes_el:
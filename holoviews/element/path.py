@@ -28,7 +28,9 @@ class Path(Geometry):
     extensible list of interfaces. Natively, HoloViews provides the
     MultiInterface which allows representing paths as lists of regular
     columnar data objects including arrays, dataframes and
-    dictionaries of column arrays and scalars.
+    dictionaries of column arrays and scalars. Large collections of
+    paths may instead be stored as a RaggedArray of flat columns and
+    offsets using the 'ragged' datatype.
 
     The canonical representation is a list of dictionaries storing the
     x- and y-coordinates along with any other values:
@@ -56,7 +58,7 @@ class Path(Geometry):
     group = param.String(default="Path", constant=True)
 
     datatype = param.ObjectSelector(default=[
-        'multitabular', 'dataframe', 'dictionary', 'dask', 'array'])
+        'multitabular', 'dataframe', 'dictionary', 'dask', 'array', 'ragged'])
 
     def __init__(self, data, kdims=None, vdims=None, **params):
         if isinstance(data, tuple) and len(data) == 2:
@@ -76,6 +78,8 @@ class Path(Geometry):
                     path = path.redim(**redim)
                 if path.interface.multi and isinstance(path.data, list):
                     paths += path.data
+                elif path.interface.multi:
+                    paths += path.split(datatype='columns')
                 else:
                     paths.append(path.data)
             data = paths
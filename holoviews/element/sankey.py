@@ -1,13 +1,12 @@
 from __future__ import division
 
-from functools import cmp_to_key
 from itertools import cycle
 
 import param
 import numpy as np
 
 from ..core.dimension import Dimension
-from ..core.data import Dataset
+from ..core.data import Dataset, RaggedArray
 from ..core.operation import Operation
 from ..core.util import OrderedDict, unique_array, RecursionError, get_param_values
 from .graphs import Graph, Nodes, EdgePaths, redim_graph
@@ -40,19 +39,16 @@ class _layout_sankey(Operation):
 
     def layout(self, element, **params):
         self.p = param.ParamOverrides(self, params)
-        graph = {'nodes': [], 'links': []}
-        self.computeNodeLinks(element, graph)
+        graph = self.computeNodeLinks(element)
         self.computeNodeValues(graph)
         self.computeNodeDepths(graph)
         self.computeNodeBreadths(graph)
         self.computeLinkBreadths(graph)
-        paths = self.computePaths(graph)
+        paths = self.computePaths(graph, element.edge_type.kdims)
 
-        node_data = []
-        for node in graph['nodes']:
-            node_data.append((np.mean([node['x0'], node['x1']]),
-                              np.mean([node['y0'], node['y1']]),
-                              node['index'])+tuple(node['values']))
+        xs = (graph['x0'] + graph['x1']) / 2.
+        ys = (graph['y0'] + graph['y1']) / 2.
+        node_data = (xs, ys, graph['index']) + tuple(graph['values'])
         if element.nodes.ndims == 3:
             kdims = element.nodes.kdims
         elif element.nodes.ndims:
@@ -61,97 +57,76 @@ class _layout_sankey(Operation):
             kdims = element.node_type.kdims
         nodes = element.node_type(node_data, kdims=kdims, vdims=element.nodes.vdims)
         edges = element.edge_type(paths)
-        return nodes, edges, graph
-
-
-    def computePaths(self, graph):
-        paths = []
-        for link in graph['links']:
-            source, target = link['source'], link['target']
-            x0, y0 = source['x1'], link['y0']
-            x1, y1 = target['x0'], link['y1']
-            start = np.array([(x0, link['width']+y0),
-                              (x0, y0)])
-            src = (x0, y0)
-            ctr1 = ((x0+x1)/2., y0)
-            ctr2 = ((x0+x1)/2., y1)
-            tgt = (x1, y1)
-            bottom = quadratic_bezier(src, tgt, ctr1, ctr2)
-            mid = np.array([(x1, y1),
-                            (x1, y1+link['width'])])
-
-            xmid = (x0+x1)/2.
-            y0 = y0+link['width']
-            y1 = y1+link['width']
-            src = (x1, y1)
-            ctr1 = (xmid, y1)
-            ctr2 = (xmid, y0)
-            tgt = (x0, y0)
-            top = quadratic_bezier(src, tgt, ctr1, ctr2)
-            spline = np.concatenate([start, bottom, mid, top])
-            paths.append(spline)
-        return paths
+        return nodes, edges, self.graphDicts(graph)
 
 
     @classmethod
-    def weightedSource(cls, link):
-        return cls.nodeCenter(link['source']) * link['value']
-
-    @classmethod
-    def weightedTarget(cls, link):
-        return cls.nodeCenter(link['target']) * link['value']
-
-    @classmethod
-    def nodeCenter(cls, node):
-        return (node['y0'] + node['y1']) / 2
-
-    @classmethod
-    def ascendingBreadth(cls, a, b):
-        return int(a['y0'] - b['y0'])
-
-    @classmethod
-    def ascendingSourceBreadth(cls, a, b):
-        return cls.ascendingBreadth(a['source'], b['source']) | a['index'] - b['index']
-
-    @classmethod
-    def ascendingTargetBreadth(cls, a, b):
-        return cls.ascendingBreadth(a['target'], b['target']) | a['index'] - b['index']
+    def graphDicts(cls, graph):
+        """
+        Converts the arrays describing the layout into the lists of
+        node and link dictionaries exposed on the Sankey element.
+        """
+        node_values = list(zip(*graph['values'])) or cycle([tuple()])
+        node_keys = ['index', 'value', 'depth', 'height', 'x0', 'x1', 'y0', 'y1']
+        node_arrays = [graph['node_value'] if k == 'value' else graph[k] for k in node_keys]
+        nodes = [dict(zip(node_keys, vals), values=values)
+                 for vals, values in zip(zip(*node_arrays), node_values)]
+        links = [dict(index=i, source=nodes[src], target=nodes[tgt], value=value,
+                      width=width, y0=y0, y1=y1)
+                 for i, (src, tgt, value, width, y0, y1) in enumerate(zip(
+                     graph['source'], graph['target'], graph['value'],
+                     graph['width'], graph['link_y0'], graph['link_y1']))]
+        return {'nodes': nodes, 'links': links}
+
+
+    def computePaths(self, graph, dimensions):
+        """
+        Computes the outline of each link as a band bounded by two
+        bezier splines, computing the splines of all links at once and
+        returning them as a RaggedArray of the supplied dimensions.
+        """
+        src, tgt, width = graph['source'], graph['target'], graph['width'][:, None]
+        x0, y0 = graph['x1'][src][:, None], graph['link_y0'][:, None]
+        x1, y1 = graph['x0'][tgt][:, None], graph['link_y1'][:, None]
+        xmid = (x0+x1)/2.
+        bottom = quadratic_bezier((x0, y0), (x1, y1), (xmid, y0), (xmid, y1))
+        top = quadratic_bezier((x1, y1+width), (x0, y0+width),
+                               (xmid, y1+width), (xmid, y0+width))
+        start = np.stack([np.hstack([x0, x0]), np.hstack([y0+width, y0])], axis=-1)
+        mid = np.stack([np.hstack([x1, x1]), np.hstack([y1, y1+width])], axis=-1)
+        splines = np.concatenate([start, bottom, mid, top], axis=1)
+        offsets = np.arange(len(splines)+1) * splines.shape[1]
+        columns = OrderedDict((d.name, splines[..., i].flatten())
+                              for i, d in enumerate(dimensions))
+        return RaggedArray(columns, offsets)
 
     @classmethod
-    def computeNodeLinks(cls, element, graph):
+    def computeNodeLinks(cls, element):
         """
-        Populate the sourceLinks and targetLinks for each node.
-        Also, if the source and target are not objects, assume they are indices.
+        Looks up the source and target node of each link, returning a
+        graph dictionary holding the node and link arrays.
         """
         index = element.nodes.kdims[-1]
-        node_map = {}
-        if element.nodes.vdims:
-            values = zip(*(element.nodes.dimension_values(d)
-                           for d in element.nodes.vdims))
-        else:
-            values = cycle([tuple()])
-        for index, vals in zip(element.nodes.dimension_values(index), values):
-            node = {'index': index, 'sourceLinks': [], 'targetLinks': [], 'values': vals}
-            graph['nodes'].append(node)
-            node_map[index] = node
-
-        links = [element.dimension_values(d) for d in element.dimensions()[:3]]
-        for i, (src, tgt, value) in enumerate(zip(*links)):
-            source, target = node_map[src], node_map[tgt]
-            link = dict(index=i, source=source, target=target, value=value)
-            graph['links'].append(link)
-            source['sourceLinks'].append(link)
-            target['targetLinks'].append(link)
+        node_ids = element.nodes.dimension_values(index)
+        node_map = {idx: i for i, idx in enumerate(node_ids)}
+        values = [element.nodes.dimension_values(d) for d in element.nodes.vdims]
+        src, tgt, value = (element.dimension_values(d) for d in element.dimensions()[:3])
+        return {'index': node_ids, 'values': values,
+                'source': np.array([node_map[s] for s in src], dtype=int),
+                'target': np.array([node_map[t] for t in tgt], dtype=int),
+                'value': np.asarray(value)}
 
     @classmethod
     def computeNodeValues(cls, graph):
         """
         Compute the value (size) of each node by summing the associated links.
         """
-        for node in graph['nodes']:
-            source_val = np.sum([l['value'] for l in node['sourceLinks']])
-            target_val = np.sum([l['value'] for l in node['targetLinks']])
-            node['value'] = max([source_val, target_val])
+        n, value = len(graph['index']), graph['value']
+        dtype = value.dtype if len(value) else float
+        source_val, target_val = np.zeros(n, dtype=dtype), np.zeros(n, dtype=dtype)
+        np.add.at(source_val, graph['source'], value)
+        np.add.at(target_val, graph['target'], value)
+        graph['node_value'] = np.maximum(source_val, target_val)
 
     def computeNodeDepths(self, graph):
         """
@@ -159,142 +134,131 @@ class _layout_sankey(Operation):
         Nodes are assigned the maximum depth of incoming neighbors plus one;
         nodes with no incoming links are assigned depth zero, while
         nodes with no outgoing links are assigned the maximum depth.
+        Each iteration advances the frontier of all nodes at once.
         """
-        nodes = graph['nodes']
-        depth = 0
-        while nodes:
-            next_nodes = []
-            for node in nodes:
-                node['depth'] = depth
-                for link in node['sourceLinks']:
-                    if not any(link['target'] is node for node in next_nodes):
-                        next_nodes.append(link['target'])
-            nodes = next_nodes
-            depth += 1
-            if depth > 10000:
-                raise RecursionError('Sankey diagrams only support acyclic graphs.')
-
-        nodes = graph['nodes']
-        depth = 0
-        while nodes:
-            next_nodes = []
-            for node in nodes:
-                node['height'] = depth
-                for link in node['targetLinks']:
-                    if not any(link['source'] is node for node in next_nodes):
-                        next_nodes.append(link['source'])
-            nodes = next_nodes
-            depth += 1
-            if depth > 10000:
-                raise RecursionError('Sankey diagrams only support acyclic graphs.')
+        n = len(graph['index'])
+        src, tgt = graph['source'], graph['target']
+        for key, (start, end) in (('depth', (src, tgt)), ('height', (tgt, src))):
+            depths = np.zeros(n, dtype=int)
+            frontier = np.ones(n, dtype=bool)
+            depth = 0
+            while frontier.any():
+                depths[frontier] = depth
+                next_frontier = np.zeros(n, dtype=bool)
+                next_frontier[end[frontier[start]]] = True
+                frontier = next_frontier
+                depth += 1
+                if depth > 10000:
+                    raise RecursionError('Sankey diagrams only support acyclic graphs.')
+            graph[key] = depths
 
         x0, _, x1, _ = self.p.bounds
         dx = self.p.node_width
         kx = (x1 - x0 - dx) / (depth - 1)
-        for node in graph['nodes']:
-            d  = node['depth'] if node['sourceLinks'] else depth - 1
-            node['x0'] = x0 + max([0, min([depth-1, np.floor(d)]) * kx])
-            node['x1'] = node['x0'] + dx
+        has_source = np.bincount(src, minlength=n) > 0
+        d = np.where(has_source, graph['depth'], depth - 1)
+        graph['x0'] = x0 + np.maximum(0, np.minimum(depth-1, np.floor(d)) * kx)
+        graph['x1'] = graph['x0'] + dx
 
     def computeNodeBreadths(self, graph):
-        node_map = OrderedDict()
-        for n in graph['nodes']:
-            if n['x0'] not in node_map:
-                node_map[n['x0']] = []
-            node_map[n['x0']].append(n)
-
         _, y0, _, y1 = self.p.bounds
         py = self.p.node_padding
-
-        def initializeNodeBreadth():
-            kys = []
-            for nodes in node_map.values():
-                nsum = np.sum([node['value'] for node in nodes])
-                ky = (y1 - y0 - (len(nodes)-1) * py) / nsum
-                kys.append(ky)
-            ky = np.min(kys) if len(kys) else np.nan
-
-            for nodes in node_map.values():
-                for i, node in enumerate(nodes):
-                    node['y0'] = i
-                    node['y1'] = i + node['value'] * ky
-
-            for link in graph['links']:
-                link['width'] = link['value'] * ky
-
-        def relaxLeftToRight(alpha):
-            for nodes in node_map.values():
-                for node in nodes:
-                    if not node['targetLinks']:
-                        continue
-                    weighted = sum([self.weightedSource(l) for l in node['targetLinks']])
-                    tsum = sum([l['value'] for l in node['targetLinks']])
-                    center = self.nodeCenter(node)
-                    dy = (weighted/tsum - center)*alpha
-                    node['y0'] += dy
-                    node['y1'] += dy
-
-
-        def relaxRightToLeft(alpha):
-            for nodes in list(node_map.values())[::-1]:
-                for node in nodes:
-                    if not node['sourceLinks']:
-                        continue
-                    weighted = sum([self.weightedTarget(l) for l in node['sourceLinks']])
-                    tsum = sum([l['value'] for l in node['sourceLinks']])
-                    center = self.nodeCenter(node)
-                    dy = (weighted/tsum - center)*alpha
-                    node['y0'] += dy
-                    node['y1'] += dy
-
+        src, tgt, value = graph['source'], graph['target'], graph['value']
+        node_value = graph['node_value']
+
+        # Group the nodes into columns in the order they first appear
+        _, first, inverse = np.unique(graph['x0'], return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype=int)
+        rank[np.argsort(first)] = np.arange(len(first))
+        column = rank[inverse]
+        columns = [np.flatnonzero(column == c) for c in range(len(first))]
+        local = np.empty(len(column), dtype=int)
+        for nodes in columns:
+            local[nodes] = np.arange(len(nodes))
+        target_links = [np.flatnonzero(column[tgt] == c) for c in range(len(columns))]
+        source_links = [np.flatnonzero(column[src] == c) for c in range(len(columns))]
+
+        kys = [(y1 - y0 - (len(nodes)-1) * py) / np.sum(node_value[nodes])
+               for nodes in columns]
+        ky = np.min(kys) if len(kys) else np.nan
+        node_y0 = local.astype(float)
+        node_y1 = node_y0 + node_value * ky
+        graph['width'] = value * ky
+        orders = list(columns)
+
+        def relax(alpha, links, moved, other, cols):
+            """
+            Moves each node towards the weighted center of the nodes
+            it is linked to, processing one column at a time.
+            """
+            for c in cols:
+                if not len(links[c]):
+                    continue
+                nodes = columns[c]
+                inds = local[moved[links[c]]]
+                neighbors = other[links[c]]
+                centers = (node_y0[neighbors] + node_y1[neighbors]) / 2
+                vals = value[links[c]]
+                weighted = np.bincount(inds, centers*vals, len(nodes))
+                tsum = np.bincount(inds, vals, len(nodes))
+                linked = np.bincount(inds, minlength=len(nodes)) > 0
+                nodes = nodes[linked]
+                center = (node_y0[nodes] + node_y1[nodes]) / 2
+                dy = (weighted[linked]/tsum[linked] - center) * alpha
+                node_y0[nodes] += dy
+                node_y1[nodes] += dy
 
         def resolveCollisions():
-            for nodes in node_map.values():
-                y = y0
-                nodes.sort(key=cmp_to_key(self.ascendingBreadth))
-                for node in nodes:
-                    dy = y-node['y0']
-                    if dy > 0:
-                        node['y0'] += dy
-                        node['y1'] += dy
-                    y = node['y1'] + py
-
-                dy = y-py-y1
+            """
+            Pushes overlapping nodes in each column apart, then pushes
+            them back up if the bottom node extends beyond the bounds.
+            """
+            for c, nodes in enumerate(orders):
+                nodes = nodes[np.argsort(node_y0[nodes], kind='mergesort')]
+                orders[c] = nodes
+                heights = node_y1[nodes] - node_y0[nodes]
+                offsets = np.concatenate([[0], np.cumsum(heights + py)[:-1]])
+                tops = node_y0[nodes] - offsets
+                tops[0] = max(tops[0], y0)
+                tops = np.maximum.accumulate(tops) + offsets
+                dy = tops[-1] + heights[-1] - y1
                 if dy > 0:
-                    node['y0'] -= dy
-                    node['y1'] -= dy
-                    y = node['y0']
-                    for node in nodes[:-1][::-1]:
-                        dy = node['y1'] + py - y;
-                        if dy>0:
-                            node['y0'] -= dy
-                            node['y1'] -= dy
-                        y = node['y0']
-
-        initializeNodeBreadth()
+                    remaining = np.cumsum((heights + py)[::-1])[::-1]
+                    bottoms = tops + remaining
+                    bottoms[-1] -= dy
+                    tops = np.minimum.accumulate(bottoms[::-1])[::-1] - remaining
+                node_y0[nodes] = tops
+                node_y1[nodes] = tops + heights
+
         resolveCollisions()
         alpha = 1
+        cols = range(len(columns))
         for _ in range(self.p.iterations):
             alpha = alpha*0.99
-            relaxRightToLeft(alpha)
+            relax(alpha, source_links, src, tgt, cols[::-1])
             resolveCollisions()
-            relaxLeftToRight(alpha)
+            relax(alpha, target_links, tgt, src, cols)
             resolveCollisions()
+        graph['y0'], graph['y1'] = node_y0, node_y1
 
     @classmethod
     def computeLinkBreadths(cls, graph):
-        for node in graph['nodes']:
-            node['sourceLinks'].sort(key=cmp_to_key(cls.ascendingTargetBreadth))
-            node['targetLinks'].sort(key=cmp_to_key(cls.ascendingSourceBreadth))
-
-        for node in graph['nodes']:
-            y0 = y1 = node['y0']
-            for link in node['sourceLinks']:
-                link['y0'] = y0
-                y0 += link['width']
-            for link in node['targetLinks']:
-                link['y1'] = y1
-                y1 += link['width']
+        """
+        Stacks the links leaving and entering each node, ordering them
+        by the vertical position of the node at the other end.
+        """
+        src, tgt, width = graph['source'], graph['target'], graph['width']
+        indices = np.arange(len(src))
+        for key, (node, other) in (('link_y0', (src, tgt)), ('link_y1', (tgt, src))):
+            order = np.lexsort((indices, graph['y0'][other], node))
+            widths = width[order]
+            offsets = np.cumsum(widths) - widths
+            starts = np.flatnonzero(np.diff(node[order], prepend=-1))
+            counts = np.diff(np.append(starts, len(order)))
+            offsets -= np.repeat(offsets[starts], counts)
+            breadths = np.empty(len(order))
+            breadths[order] = graph['y0'][node[order]] + offsets
+            graph[key] = breadths
 
 
 
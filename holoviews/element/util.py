@@ -9,7 +9,8 @@ from ..core.data import default_datatype
 from ..core.operation import Operation
 from ..core.sheetcoords import Slice
 from ..core.util import (is_nan, sort_topologically, one_to_one,
-                         cartesian_product, is_cyclic, datetime_types)
+                         cartesian_product, is_cyclic, datetime_types,
+                         factorize)
 
 try:
     import pandas as pd
@@ -232,7 +233,9 @@ def circular_layout(nodes):
 def quadratic_bezier(start, end, c0=(0, 0), c1=(0, 0), steps=50):
     """
     Compute quadratic bezier spline given start and end coordinate and
-    two control points.
+    two control points. The coordinates may also be supplied as arrays
+    of shape (N, 1) to compute N splines at once, returned as an array
+    of shape (N, steps, 2).
     """
     steps = np.linspace(0, 1, steps)
     sx, sy = start
@@ -243,52 +246,89 @@ def quadratic_bezier(start, end, c0=(0, 0), c1=(0, 0), steps=50):
           3*(1-steps)*steps**2*cx1 + steps**3*ex)
     ys = ((1-steps)**3*sy + 3*((1-steps)**2)*steps*cy0 +
           3*(1-steps)*steps**2*cy1 + steps**3*ey)
-    return np.column_stack([xs, ys])
+    return np.stack([xs, ys], axis=-1)
 
 
-def connect_edges_pd(graph):
+def index_nodes(node_ids, sources, targets):
     """
-    Given a Graph element containing abstract edges compute edge
-    segments directly connecting the source and target nodes. This
-    operation depends on pandas and is a lot faster than the pure
-    NumPy equivalent.
+    Encodes each node as an integer given by the position of the first
+    node sharing its index and looks up the codes of the supplied
+    source and target nodes, assigning -1 to nodes that cannot be
+    found. Avoids Python level lookups of each node by using a
+    pandas.Index or a sorted search to match the nodes.
+
+    Args:
+       node_ids (np.ndarray): The index of each node
+       sources (np.ndarray): The source node of each edge
+       targets (np.ndarray): The target node of each edge
+
+    Returns:
+       Tuple of the node, source and target codes
+    """
+    node_ids = np.asarray(node_ids)
+    if not len(node_ids):
+        missing = np.full(len(sources), -1)
+        return np.array([], dtype=int), missing, missing
+    codes, _ = factorize(node_ids)
+    _, first = np.unique(codes, return_index=True)
+    unique_ids = node_ids[first]
+    if pd is not None:
+        index = pd.Index(unique_ids)
+        indices = [index.get_indexer(values) for values in (sources, targets)]
+    else:
+        order = np.argsort(unique_ids, kind='mergesort')
+        sorted_ids = unique_ids[order]
+        indices = []
+        for values in (sources, targets):
+            idx = np.searchsorted(sorted_ids, values).clip(0, len(order)-1)
+            indices.append(np.where(sorted_ids[idx] == values, order[idx], -1))
+    src_idx, tgt_idx = (np.where(idx >= 0, first[idx], -1) for idx in indices)
+    return first[codes], src_idx, tgt_idx
+
+
+def edge_segments(graph):
     """
-    edges = graph.dframe()
-    edges.index.name = 'graph_edge_index'
-    edges = edges.reset_index()
-    nodes = graph.nodes.dframe()
-    src, tgt = graph.kdims
-    x, y, idx = graph.nodes.kdims[:3]
+    Given a Graph element containing abstract edges compute the start
+    and end coordinates of the segments directly connecting the source
+    and target nodes, returned as an array of shape (N, 2, 2). The
+    node positions of all edges are looked up at once using the
+    node indices cached on the Graph and edges whose nodes cannot be
+    found are dropped.
+    """
+    positions = graph.nodes.array([0, 1])
+    _, src_idx, tgt_idx = graph._node_indices()
+    found = (src_idx >= 0) & (tgt_idx >= 0)
+    return np.stack([positions[src_idx[found]], positions[tgt_idx[found]]], axis=1)
 
-    df = pd.merge(edges, nodes, left_on=[src.name], right_on=[idx.name])
-    df = df.rename(columns={x.name: 'src_x', y.name: 'src_y'})
 
-    df = pd.merge(df, nodes, left_on=[tgt.name], right_on=[idx.name])
-    df = df.rename(columns={x.name: 'dst_x', y.name: 'dst_y'})
-    df = df.sort_values('graph_edge_index').drop(['graph_edge_index'], axis=1)
+def connect_edges_buffer(graph):
+    """
+    Given a Graph element containing abstract edges compute a single
+    NaN separated path of the segments directly connecting the source
+    and target nodes, avoiding the construction of an array per edge.
+    """
+    segments = edge_segments(graph)
+    buffer = np.full((len(segments), 3, 2), np.NaN)
+    buffer[:, :2] = segments
+    return buffer.reshape(-1, 2)[:-1]
 
-    edge_segments = []
-    for i, edge in df.iterrows():
-        start = edge['src_x'], edge['src_y']
-        end = edge['dst_x'], edge['dst_y']
-        edge_segments.append(np.array([start, end]))
-    return edge_segments
+
+def connect_edges_pd(graph):
+    """
+    Given a Graph element containing abstract edges compute edge
+    segments directly connecting the source and target nodes,
+    dropping edges whose nodes cannot be found. Retained for
+    backward compatibility, see edge_segments.
+    """
+    return list(edge_segments(graph))
 
 
 def connect_edges(graph):
     """
     Given a Graph element containing abstract edges compute edge
-    segments directly connecting the source and target nodes.  This
-    operation just uses internal HoloViews operations and will be a
-    lot slower than the pandas equivalent.
+    segments directly connecting the source and target nodes.
     """
-    paths = []
-    for start, end in graph.array(graph.kdims):
-        start_ds = graph.nodes[:, :, start]
-        end_ds = graph.nodes[:, :, end]
-        if not len(start_ds) or not len(end_ds):
-            raise ValueError('Could not find node positions for all edges')
-        start = start_ds.array(start_ds.kdims[:2])
-        end = end_ds.array(end_ds.kdims[:2])
-        paths.append(np.array([start[0], end[0]]))
-    return paths
+    segments = edge_segments(graph)
+    if len(segments) != len(graph):
+        raise ValueError('Could not find node positions for all edges')
+    return list(segments)
@@ -32,6 +32,78 @@ from ..streams import RangeXY, PlotSize
 ds_version = LooseVersion(ds.__version__)
 
 
+def _morton_code(ix, iy):
+    """
+    Interleaves the bits of integer tile indices along x and y (each
+    below 2**16) to compute their position along a Z-order curve.
+    """
+    codes = []
+    for v in (ix, iy):
+        v = np.asarray(v, dtype='uint32')
+        v = (v | (v << 8)) & 0x00FF00FF
+        v = (v | (v << 4)) & 0x0F0F0F0F
+        v = (v | (v << 2)) & 0x33333333
+        v = (v | (v << 1)) & 0x55555555
+        codes.append(v)
+    return codes[0] | (codes[1] << 1)
+
+
+class _TileIndex(object):
+    """
+    Coarse spatial index over a set of points, which are assigned to
+    tiles on a regular grid spanning their extent. Ordering the points
+    by the Z-order (Morton) code of their tile places nearby points
+    close together, so the points falling within any viewport can be
+    looked up as a small number of contiguous runs of rows.
+    """
+
+    def __init__(self, xs, ys, level=8):
+        xs, ys = np.asarray(xs, dtype='float64'), np.asarray(ys, dtype='float64')
+        self.ntiles = 2**level
+        self.extents = ((np.nanmin(xs), np.nanmax(xs)),
+                        (np.nanmin(ys), np.nanmax(ys)))
+        ix, iy = self._tiles(xs, 0), self._tiles(ys, 1)
+        ncodes = self.ntiles**2
+        codes = np.where((ix < 0) | (iy < 0), ncodes, _morton_code(ix, iy))
+        self.order = np.argsort(codes, kind='mergesort')
+        self.offsets = np.searchsorted(codes[self.order], np.arange(ncodes+2))
+
+    def _tiles(self, values, axis):
+        """
+        Returns the tile index of the values along an axis, assigning
+        -1 to NaNs.
+        """
+        low, high = self.extents[axis]
+        span = (high - low) or 1
+        with np.errstate(invalid='ignore'):
+            tiles = np.floor((values - low) / span * self.ntiles)
+        tiles[np.isnan(tiles)] = -1
+        return np.clip(tiles, -1, self.ntiles-1).astype('int64')
+
+    def rows(self, x_range, y_range):
+        """
+        Returns the indices of the sorted rows in all tiles overlapping
+        the supplied ranges or None if all tiles overlap the ranges.
+        """
+        bounds = []
+        for axis, (low, high) in enumerate((x_range, y_range)):
+            emin, emax = self.extents[axis]
+            if high < emin or low > emax:
+                return np.array([], dtype='int64')
+            t0, t1 = self._tiles(np.array([max(low, emin), min(high, emax)]), axis)
+            bounds.append((t0, t1))
+        (ix0, ix1), (iy0, iy1) = bounds
+        if (ix0, iy0) == (0, 0) and ix1 == iy1 == self.ntiles-1:
+            return None
+        ix, iy = np.meshgrid(np.arange(ix0, ix1+1), np.arange(iy0, iy1+1))
+        codes = np.sort(_morton_code(ix.flatten(), iy.flatten()))
+        starts, ends = self.offsets[codes], self.offsets[codes+1]
+        lengths = ends - starts
+        cumulative = np.cumsum(lengths)
+        return (np.arange(cumulative[-1], dtype='int64') +
+                np.repeat(starts - cumulative + lengths, lengths))
+
+
 class LinkableOperation(Operation):
     """
     Abstract baseclass for operations supporting linked inputs.
@@ -102,7 +174,9 @@ class ResamplingOperation(LinkableOperation):
         Whether to apply precomputing operations. Precomputing can
         speed up resampling operations by avoiding unnecessary
         recomputation if the supplied element does not change between
-        calls. The cost of enabling this option is that the memory
+        calls. Precomputed points are also sorted into a coarse spatial
+        index so that only the points within the current viewport are
+        aggregated. The cost of enabling this option is that the memory
         used to represent this internal state is not freed between
         calls.""")
 
@@ -340,6 +414,31 @@ class aggregate(AggregationOperation):
         return x, y, Dataset(df, kdims=kdims, vdims=vdims), glyph
 
 
+    @classmethod
+    def _spatial_index(cls, data, x, y, glyph, agg_fn):
+        """
+        Sorts precomputed points spatially and builds a coarse tile
+        index, which allows subsequent aggregations to only pass the
+        points within the viewport to datashader. Lines cannot be
+        subset without breaking segments crossing the viewport and
+        order dependent aggregators require the original ordering, so
+        the data is returned unchanged in those cases.
+        """
+        order_dependent = tuple(getattr(ds, r) for r in ('first', 'last')
+                                if hasattr(ds, r))
+        if (glyph != 'points' or x is None or y is None or not len(data) or
+            isinstance(data.data, dd.DataFrame) or isinstance(agg_fn, order_dependent)):
+            return data, None
+        df = PandasInterface.as_dframe(data)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            index = _TileIndex(df[x.name].values, df[y.name].values)
+        if not np.isfinite(index.extents).all():
+            return data, None
+        df = df.iloc[index.order].reset_index(drop=True)
+        return data.clone(df), index
+
+
     def _aggregate_ndoverlay(self, element, agg_fn):
         """
         Optimized aggregation for NdOverlay objects by aggregating each
@@ -434,12 +533,15 @@ class aggregate(AggregationOperation):
             return self._aggregate_ndoverlay(element, agg_fn)
 
         if element._plot_id in self._precomputed:
-            x, y, data, glyph = self._precomputed[element._plot_id]
+            x, y, data, glyph, index = self._precomputed[element._plot_id]
         else:
             x, y, data, glyph = self.get_agg_data(element, category)
+            index = None
+            if self.p.precompute:
+                data, index = self._spatial_index(data, x, y, glyph, agg_fn)
 
         if self.p.precompute:
-            self._precomputed[element._plot_id] = x, y, data, glyph
+            self._precomputed[element._plot_id] = x, y, data, glyph, index
         (x_range, y_range), (xs, ys), (width, height), (xtype, ytype) = self._get_sampling(element, x, y)
 
         (x0, x1), (y0, y1) = x_range, y_range
@@ -490,6 +592,10 @@ class aggregate(AggregationOperation):
                         x_range=x_range, y_range=y_range)
 
         dfdata = PandasInterface.as_dframe(data)
+        if index is not None:
+            rows = index.rows(x_range, y_range)
+            if rows is not None:
+                dfdata = dfdata.iloc[rows]
         agg = getattr(cvs, glyph)(dfdata, x.name, y.name, agg_fn)
         if 'x_axis' in agg.coords and 'y_axis' in agg.coords:
             agg = agg.rename({'x_axis': x, 'y_axis': y})
@@ -4,6 +4,8 @@ examples.
 """
 from __future__ import division
 
+import weakref
+
 import numpy as np
 
 import param
@@ -14,7 +16,7 @@ from ..core import (Operation, NdOverlay, Overlay, GridMatrix,
 from ..core.data import ArrayInterface, DictInterface, default_datatype
 from ..core.util import (group_sanitizer, label_sanitizer, pd,
                          basestring, datetime_types, isfinite, dt_to_int,
-                         isdatetime, is_dask_array)
+                         isdatetime, is_dask_array, histogram_counts, SlidingHistogram)
 from ..element.chart import Histogram, Scatter
 from ..element.raster import Image, RGB
 from ..element.path import Contours, Polygons
@@ -572,25 +574,23 @@ class histogram(Operation):
         else:
             data = element.dimension_values(selected_dim)
 
-        if is_dask_array(data):
-            import dask.array as da
-            histogram = da.histogram
-        else:
-            histogram = np.histogram
-
-        mask = isfinite(data)
-        if self.p.nonzero:
-            mask = mask & (data > 0)
-        data = data[mask]
         if self.p.weight_dimension:
             if hasattr(element, 'interface'):
                 weights = element.interface.values(element, self.p.weight_dimension, compute=False)
             else:
                 weights = element.dimension_values(self.p.weight_dimension)
-            if self.p.nonzero:
-                weights = weights[mask]
         else:
             weights = None
+        mask = None
+        if self.p.nonzero:
+            mask = data > 0
+
+        dask = is_dask_array(data)
+        if dask:
+            mask = isfinite(data) if mask is None else (mask & isfinite(data))
+            data = data[mask]
+            if weights is not None:
+                weights = weights[mask]
 
         hist_range = self.p.bin_range or element.range(selected_dim)
         # Avoids range issues including zero bin range and empty bins
@@ -613,24 +613,37 @@ class histogram(Operation):
         if self.p.bins:
             edges = bins
         elif self.p.log:
-            bin_min = max([abs(start), data[data>0].min()])
+            bin_min = max([abs(start), data[isfinite(data) & (data>0)].min()])
             edges = np.logspace(np.log10(bin_min), np.log10(end), steps)
         else:
             edges = np.linspace(start, end, steps)
         normed = False if self.p.mean_weighted and self.p.weight_dimension else self.p.normed
 
-        if is_dask_array(data) or len(data):
+        if dask:
+            import dask.array as da
             if normed:
                 # This covers True, 'height', 'integral'
-                hist, edges = histogram(data, density=True,
-                                        weights=weights, bins=edges)
+                hist, edges = da.histogram(data, density=True,
+                                           weights=weights, bins=edges)
                 if normed == 'height':
                     hist /= hist.max()
             else:
-                hist, edges = histogram(data, normed=normed, weights=weights, bins=edges)
+                hist, edges = da.histogram(data, normed=normed, weights=weights, bins=edges)
                 if self.p.weight_dimension and self.p.mean_weighted:
-                    hist_mean, _ = histogram(data, density=False, bins=self.p.num_bins)
+                    hist_mean, _ = da.histogram(data, density=False, bins=edges)
                     hist /= hist_mean
+        elif len(data):
+            counts, weighted = self._bin_counts(element, dim, data, weights, mask, edges)
+            hist = counts if weighted is None else weighted
+            if normed:
+                # This covers True, 'height', 'integral'
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    hist = hist/np.diff(edges)/hist.sum()
+                if normed == 'height':
+                    hist /= hist.max()
+            elif self.p.weight_dimension and self.p.mean_weighted:
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    hist = hist/counts
         else:
             hist = np.zeros(self.p.num_bins)
         hist[np.isnan(hist)] = 0
@@ -659,6 +672,45 @@ class histogram(Operation):
                          label=element.label, **params)
 
 
+    def _bin_counts(self, element, dim, data, weights, mask, edges):
+        """
+        Computes the unweighted and weighted bin counts of the data.
+        If the element was returned by a DynamicMap subscribed to a
+        streams.Buffer, which stores the position of the data in the
+        stream on the element, and the edges are unchanged since the
+        last call the counts are updated with the newly appended rows
+        only instead of rescanning all the data.
+        """
+        position = None
+        if isinstance(element, Dataset):
+            position = element._data_cache_dict().get('stream_position')
+        if position is None or len(data) != min(position[2], position[3]):
+            return histogram_counts(data, edges, weights, mask)
+
+        buffer, source, end, length = position
+        key = (dim.name, self.p.weight_dimension, self.p.nonzero)
+        trackers = getattr(self, '_histogram_trackers', None)
+        if trackers is None:
+            # Trackers are discarded along with the Buffer
+            trackers = self._histogram_trackers = weakref.WeakKeyDictionary()
+        buffer_trackers = trackers.setdefault(buffer, {})
+        state = buffer_trackers.get(key)
+        if (state is None or state[0] is not source or state[1] > end or
+            not np.array_equal(state[2].edges, edges)):
+            tracker = SlidingHistogram(edges, length, weights is not None,
+                                       self.p.nonzero)
+            tracker.update(data, weights)
+        else:
+            tracker = state[2]
+            new = min(end-state[1], len(data))
+            if new:
+                tracker.update(data[len(data)-new:], None if weights is None
+                               else weights[len(data)-new:])
+        buffer_trackers[key] = (source, end, tracker)
+        return tracker.counts.copy(), (None if tracker.weighted_counts is None
+                                       else tracker.weighted_counts.copy())
+
+
 class decimate(Operation):
     """
     Decimates any column based Element to a specified number of random
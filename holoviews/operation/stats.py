@@ -20,6 +20,51 @@ def _kde_support(bin_range, bw, gridsize, cut, clip):
     return np.linspace(kmin, kmax, gridsize)
 
 
+def _binned_kde(data, grids, covariance, tail=8):
+    """
+    Evaluates a Gaussian kernel density estimate with the supplied
+    kernel covariance on a regular grid. The samples are linearly
+    binned onto the grid, which is padded to include samples within
+    tail standard deviations of its edges, and the bin counts are
+    convolved with the kernel using an FFT.
+    """
+    from scipy.signal import fftconvolve
+
+    ndim, nsamples = data.shape
+    covariance = np.atleast_2d(covariance)
+    steps = [grid[1]-grid[0] for grid in grids]
+    sigmas = np.sqrt(np.diag(covariance))
+    pads = [min(int(np.ceil(tail*sigma/step)), 10*len(grid))
+            for sigma, step, grid in zip(sigmas, steps, grids)]
+    shape = tuple(len(grid)+2*pad for grid, pad in zip(grids, pads))
+
+    # Linearly bin the samples onto the padded grid
+    positions = np.array([(vals-(grid[0]-pad*step))/step for vals, grid, pad, step
+                          in zip(data, grids, pads, steps)])
+    inside = ((positions >= 0) & (positions < np.array(shape)[:, None]-1)).all(axis=0)
+    positions = positions[:, inside]
+    indices = np.floor(positions).astype(int)
+    fractions = positions-indices
+    counts = np.zeros(np.prod(shape))
+    for corner in np.ndindex(*(2,)*ndim):
+        weights = np.prod([frac if c else 1-frac for c, frac
+                           in zip(corner, fractions)], axis=0)
+        flat = np.ravel_multi_index(tuple(idx+c for idx, c in zip(indices, corner)), shape)
+        counts += np.bincount(flat, weights=weights, minlength=counts.size)
+    counts = counts.reshape(shape)
+
+    # Evaluate the kernel on the grid offsets and convolve
+    offsets = [np.arange(-pad, pad+1)*step for pad, step in zip(pads, steps)]
+    offsets = np.array(np.meshgrid(*offsets, indexing='ij'))
+    inverse = np.linalg.inv(covariance)
+    quadratic = np.einsum('i...,ij,j...->...', offsets, inverse, offsets)
+    norm = np.sqrt((2*np.pi)**ndim * np.linalg.det(covariance))
+    kernel = np.exp(-0.5*quadratic)/norm
+    density = fftconvolve(counts, kernel, mode='same')/nsamples
+    density = density[tuple(slice(pad, pad+len(grid)) for pad, grid in zip(pads, grids))]
+    return np.clip(density, 0, None)
+
+
 class univariate_kde(Operation):
     """
     Computes a 1D kernel density estimate (KDE) along the supplied
@@ -50,6 +95,13 @@ class univariate_kde(Operation):
     filled = param.Boolean(default=True, doc="""
         Controls whether to return filled or unfilled KDE.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'fft'], doc="""
+        Method used to evaluate the KDE, either by evaluating the
+        kernel of every sample at each grid point ('exact') or by
+        linearly binning the samples onto the grid and convolving
+        the bins with the kernel using an FFT ('fft'), which scales
+        to very large numbers of samples.""")
+
     n_samples = param.Integer(default=100, doc="""
         Number of samples to compute the KDE over.""")
 
@@ -113,7 +165,10 @@ class univariate_kde(Operation):
                 xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
             else:
                 xs = _kde_support(bin_range, bw, self.p.n_samples, self.p.cut, selected_dim.range)
-            ys = kde.evaluate(xs)
+            if self.p.method == 'fft' and len(xs) > 1:
+                ys = _binned_kde(data[np.newaxis], [xs], kde.covariance)
+            else:
+                ys = kde.evaluate(xs)
         else:
             xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
             ys = np.full_like(xs, 0)
@@ -152,6 +207,13 @@ class bivariate_kde(Operation):
     filled = param.Boolean(default=False, doc="""
         Controls whether to return filled or unfilled contours.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'fft'], doc="""
+        Method used to evaluate the KDE, either by evaluating the
+        kernel of every sample at each grid point ('exact') or by
+        linearly binning the samples onto the grid and convolving
+        the bins with the kernel using an FFT ('fft'), which scales
+        to very large numbers of samples.""")
+
     levels = param.ClassSelector(default=10, class_=(list, int), doc="""
         A list of scalar values used to specify the contour levels.""")
 
@@ -211,9 +273,12 @@ class bivariate_kde(Operation):
                 ys = np.linspace(ymin, ymax, self.p.n_samples)
             else:
                 ys = _kde_support((ymin, ymax), bw, self.p.n_samples, self.p.cut, ydim.range)
-            xx, yy = cartesian_product([xs, ys], False)
-            positions = np.vstack([xx.ravel(), yy.ravel()])
-            f = np.reshape(kde(positions).T, xx.shape)
+            if self.p.method == 'fft' and len(xs) > 1 and len(ys) > 1:
+                f = _binned_kde(data, [xs, ys], kde.covariance)
+            else:
+                xx, yy = cartesian_product([xs, ys], False)
+                positions = np.vstack([xx.ravel(), yy.ravel()])
+                f = np.reshape(kde(positions).T, xx.shape)
         elif self.p.contours:
             eltype = Polygons if self.p.filled else Contours
             return eltype([], kdims=[xdim, ydim], vdims=[vdim])
@@ -107,7 +107,7 @@ class LabelsPlot(ColorbarPlot, AnnotationPlot):
             mapping['x'] = dodge(xdim, self.xoffset)
         if self.yoffset is not None:
             mapping['y'] = dodge(ydim, self.yoffset)
-        data[tdim] = [dims[2].pprint_value(v) for v in element.dimension_values(2)]
+        data[tdim] = dims[2].pprint_values(element.dimension_values(2))
         self._categorize_data(data, (xdim, ydim), element.dimensions())
 
         cdim = element.get_dimension(self.color_index)
@@ -279,7 +279,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             values = np.asarray(data[dim])
             if (values.dtype.kind == 'M' or (
                     len(values) and isinstance(values[0], util.datetime_types))):
-                data[dim+'_dt_strings'] = [d.pprint_value(v) for v in values]
+                data[dim+'_dt_strings'] = d.pprint_values(values)
 
         for k, v in self.overlay_dims.items():
             dim = util.dimension_sanitizer(k.name)
@@ -932,7 +932,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         xdim, ydim = element.dimensions()[:2]
         xvals = np.asarray(xdim.values or element.dimension_values(0, False))
         yvals = np.asarray(ydim.values or element.dimension_values(1, False))
-        coords = tuple([v if vals.dtype.kind in 'SU' else dim.pprint_value(v) for v in vals]
+        coords = tuple(vals if vals.dtype.kind in 'SU' else dim.pprint_values(vals)
                        for dim, vals in [(xdim, xvals), (ydim, yvals)])
         if self.invert_axes: coords = coords[::-1]
         return coords
@@ -1733,7 +1733,7 @@ class ColorbarPlot(ElementPlot):
                                        factors, colors)
         if factors is None and isinstance(mapper, CategoricalColorMapper):
             field += '_str__'
-            cdata = [cdim.pprint_value(c) for c in cdata]
+            cdata = cdim.pprint_values(cdata)
             factors = True
 
         data[field] = cdata
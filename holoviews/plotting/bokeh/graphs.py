@@ -129,7 +129,15 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
                 factors = factors.astype(np.int32)
             if factors.dtype.kind not in 'SU':
                 field += '_str__'
-                cvals = [str(f) for f in cvals]
+                if idx in self._node_columns and cvals.dtype.kind not in 'uif':
+                    # Convert each node rather than each edge to a string
+                    codes = element._node_indices()[idx+1]
+                    nodes = element.nodes.dimension_values(2)
+                    strings = np.array([str(n) for n in nodes], dtype=object)[codes]
+                    strings[codes < 0] = [str(f) for f in cvals[codes < 0]]
+                    cvals = strings.tolist()
+                else:
+                    cvals = [str(f) for f in cvals]
                 factors = (str(f) for f in factors)
             factors = list(factors)
             if isinstance(cmap, dict):
@@ -152,7 +160,7 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         path_data, mapping = {}, {}
         xidx, yidx = (1, 0) if self.invert_axes else (0, 1)
         if element._edgepaths is not None:
-            edges = element._split_edgepaths.split(datatype='array', dimensions=element.edgepaths.kdims)
+            edges = element.split_edgepaths.split(datatype='array', dimensions=element.edgepaths.kdims)
             if len(edges) == len(element):
                 path_data['xs'] = [path[:, xidx] for path in edges]
                 path_data['ys'] = [path[:, yidx] for path in edges]
@@ -180,16 +188,14 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         # Get node data
         nodes = element.nodes.dimension_values(2)
         node_positions = element.nodes.array([0, 1])
+        if self.invert_axes:
+            node_positions = node_positions[:, ::-1]
         # Map node indices to integers
         if nodes.dtype.kind not in 'uif':
-            node_indices = {v: i for i, v in enumerate(nodes)}
-            index = np.array([node_indices[n] for n in nodes], dtype=np.int32)
-            layout = {str(node_indices[k]): (y, x) if self.invert_axes else (x, y)
-                      for k, (x, y) in zip(nodes, node_positions)}
+            index, start, end = (codes.astype(np.int32) for codes in element._node_indices())
         else:
             index = nodes.astype(np.int32)
-            layout = {str(k): (y, x) if self.invert_axes else (x, y)
-                      for k, (x, y) in zip(index, node_positions)}
+        layout = dict(zip(index.astype(str).tolist(), map(tuple, node_positions.tolist())))
         point_data = {'index': index}
 
         # Handle node colors
@@ -214,13 +220,14 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
 
         # Handle edge colors
         edge_mapping = {}
-        nan_node = index.max()+1 if len(index) else 0
-        start, end = (element.dimension_values(i) for i in range(2))
-        if nodes.dtype.kind == 'f':
-            start, end = start.astype(np.int32), end.astype(np.int32)
-        elif nodes.dtype.kind not in 'ui':
-            start = np.array([node_indices.get(x, nan_node) for x in start], dtype=np.int32)
-            end = np.array([node_indices.get(y, nan_node) for y in end], dtype=np.int32)
+        if nodes.dtype.kind in 'uif':
+            start, end = (element.dimension_values(i) for i in range(2))
+            if nodes.dtype.kind == 'f':
+                start, end = start.astype(np.int32), end.astype(np.int32)
+        else:
+            nan_node = index.max()+1 if len(index) else 0
+            start[start < 0] = nan_node
+            end[end < 0] = nan_node
         path_data = dict(start=start, end=end)
         self._get_edge_colors(element, ranges, path_data, edge_mapping, style)
         if not static:
@@ -232,7 +239,7 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         if 'hover' in self.handles:
             if self.inspection_policy == 'nodes':
                 index_dim = element.nodes.get_dimension(2)
-                point_data['index_hover'] = [index_dim.pprint_value(v) for v in element.nodes.dimension_values(2)]
+                point_data['index_hover'] = index_dim.pprint_values(element.nodes.dimension_values(2))
                 for d in element.nodes.dimensions()[3:]:
                     point_data[dimension_sanitizer(d.name)] = element.nodes.dimension_values(d)
             elif self.inspection_policy == 'edges':
@@ -475,7 +482,7 @@ class ChordPlot(GraphPlot):
             text = labels.apply(element, flat=True)
         else:
             text = element.nodes.dimension_values(labels)
-            text = [labels.pprint_value(v) for v in text]
+            text = labels.pprint_values(text)
         angles = np.arctan2(ys, xs)
         data['text_1'] = dict(x=xs, y=ys, text=[str(l) for l in text], angle=angles)
         mapping['text_1'] = dict(text='text', x='x', y='y', angle='angle', text_baseline='middle')
@@ -6,10 +6,11 @@ import numpy as np
 from bokeh.models import Span
 from bokeh.models.glyphs import AnnularWedge
 
-from ...core.util import is_nan, dimension_sanitizer
+from ...core.util import dimension_sanitizer
 from ...core.spaces import HoloMap
 from .element import ColorbarPlot, CompositeElementPlot
 from .styles import line_properties, fill_properties, mpl_to_bokeh, text_properties
+from .util import pprint_hover_values
 
 
 class HeatMapPlot(ColorbarPlot):
@@ -85,16 +86,15 @@ class HeatMapPlot(ColorbarPlot):
         else:
             zvals = zvals.T.flatten()
         if xvals.dtype.kind not in 'SU':
-            xvals = [xdim.pprint_value(xv) for xv in xvals]
+            xvals = xdim.pprint_values(xvals)
         if yvals.dtype.kind not in 'SU':
-            yvals = [ydim.pprint_value(yv) for yv in yvals]
+            yvals = ydim.pprint_values(yvals)
         data = {x: xvals, y: yvals, 'zvalues': zvals}
 
         if 'hover' in self.handles and not self.static_source:
             for vdim in element.vdims:
                 sanitized = dimension_sanitizer(vdim.name)
-                data[sanitized] = ['-' if is_nan(v) else vdim.pprint_value(v)
-                                   for v in aggregate.dimension_values(vdim)]
+                data[sanitized] = pprint_hover_values(vdim, aggregate.dimension_values(vdim))
 
         # Filter radial heatmap options
         style = {k: v for k, v in style.items() if not
@@ -341,7 +341,7 @@ class RadialHeatMapPlot(CompositeElementPlot, ColorbarPlot):
 
         if vals.dtype.kind not in 'SU':
             dim = element.gridded.get_dimension(dim_label)
-            return [dim.pprint_value(v) for v in vals]
+            return dim.pprint_values(vals)
 
         return vals
 
@@ -536,8 +536,7 @@ class RadialHeatMapPlot(CompositeElementPlot, ColorbarPlot):
         if 'hover' in self.handles:
             for vdim in element.vdims:
                 sanitized = dimension_sanitizer(vdim.name)
-                values = ['-' if is_nan(v) else vdim.pprint_value(v)
-                          for v in aggregate.dimension_values(vdim)]
+                values = pprint_hover_values(vdim, aggregate.dimension_values(vdim))
                 data_annular[sanitized] = values
 
         data_xmarks = self._get_xmarks_data(order_seg, bins_seg)
@@ -8,6 +8,7 @@ import numpy as np
 from ...core import util
 from ...element import Polygons
 from ...util.transform import dim
+from ..util import path_columns, segment_starts, split_path_columns
 from .callbacks import PolyDrawCallback, PolyEditCallback
 from .element import ColorbarPlot, LegendPlot
 from .styles import (expand_batched_style, line_properties, fill_properties,
@@ -70,44 +71,38 @@ class PathPlot(LegendPlot, ColorbarPlot):
             if self.static_source:
                 data = {}
             else:
-                paths = element.split(datatype='columns', dimensions=element.kdims)
-                xs, ys = ([path[kd.name] for path in paths] for kd in element.kdims)
+                columns, offsets = path_columns(element, element.kdims)
+                xs, ys = (split_path_columns(col, offsets) for col in columns)
                 if self.invert_axes:
                     xs, ys = ys, xs
                 data = dict(xs=xs, ys=ys)
             return data, mapping, style
 
         hover = 'hover' in self.handles
-        vals = defaultdict(list)
-        if hover:
-            vals.update({util.dimension_sanitizer(vd.name): [] for vd in element.vdims})
+        vals = {}
         if cdim:
             dim_name = util.dimension_sanitizer(cdim.name)
             cmapper = self._get_colormapper(cdim, element, ranges, style)
             mapping['line_color'] = {'field': dim_name, 'transform': cmapper}
-            vals[dim_name] = []
-
-        xpaths, ypaths = [], []
-        for path in element.split():
-            if cdim:
-                cvals = path.dimension_values(cdim)
-                vals[dim_name].append(cvals[:-1])
-            cols = path.columns(path.kdims)
-            xs, ys = (cols[kd.name] for kd in element.kdims)
-            alen = len(xs)
-            xpaths += [xs[s1:s2+1] for (s1, s2) in zip(range(alen-1), range(1, alen+1))]
-            ypaths += [ys[s1:s2+1] for (s1, s2) in zip(range(alen-1), range(1, alen+1))]
-            if not hover:
-                continue
-            for vd in element.vdims:
-                if vd == cdim:
-                    continue
-                values = path.dimension_values(vd)[:-1]
-                vd_name = util.dimension_sanitizer(vd.name)
-                vals[vd_name].append(values)
-                if values.dtype.kind == 'M':
-                    vals[vd_name+'_dt_strings'].append([vd.pprint_value(v) for v in values])
-        values = {d: np.concatenate(vs) if len(vs) else [] for d, vs in vals.items()}
+
+        # Split the paths into line segments taking on the values of
+        # their first vertex
+        vdims = [vd for vd in element.vdims if vd != cdim] if hover else []
+        dims = element.kdims + ([cdim] if cdim else []) + vdims
+        columns, offsets = path_columns(element, dims)
+        starts = segment_starts(offsets)
+        xs, ys = columns[:2]
+        xpaths = list(np.column_stack([xs[starts], xs[starts+1]]))
+        ypaths = list(np.column_stack([ys[starts], ys[starts+1]]))
+        if cdim:
+            vals[dim_name] = columns[2][starts]
+        for vd, column in zip(vdims, columns[-len(vdims):] if vdims else []):
+            values = column[starts]
+            vd_name = util.dimension_sanitizer(vd.name)
+            vals[vd_name] = values
+            if values.dtype.kind == 'M':
+                vals[vd_name+'_dt_strings'] = vd.pprint_values(values)
+        values = {d: vs if len(vs) else [] for d, vs in vals.items()}
         if self.invert_axes:
             xpaths, ypaths = ypaths, xpaths
         data = dict(xs=xpaths, ys=ypaths, **values)
@@ -186,7 +181,7 @@ class ContourPlot(PathPlot):
                 else:
                     data[dim] = element.split(datatype='array', dimensions=[d])
             elif isinstance(data[dim], np.ndarray) and data[dim].dtype.kind == 'M':
-                data[dim+'_dt_strings'] = [d.pprint_value(v) for v in data[dim]]
+                data[dim+'_dt_strings'] = d.pprint_values(data[dim])
 
         for k, v in self.overlay_dims.items():
             dim = util.dimension_sanitizer(k.name)
@@ -209,8 +204,8 @@ class ContourPlot(PathPlot):
             if has_holes and bokeh_version >= '1.0':
                 xs, ys = multi_polygons_data(element)
             else:
-                paths = element.split(datatype='array', dimensions=element.kdims)
-                xs, ys = ([path[:, idx] for path in paths] for idx in (0, 1))
+                columns, offsets = path_columns(element, element.kdims)
+                xs, ys = (split_path_columns(col, offsets) for col in columns)
             if self.invert_axes:
                 xs, ys = ys, xs
             data = dict(xs=xs, ys=ys)
@@ -143,7 +143,7 @@ class SankeyPlot(GraphPlot):
             text = labels.apply(element, flat=True)
         else:
             text = element.nodes.dimension_values(labels)
-            text = [labels.pprint_value(v) for v in text]
+            text = labels.pprint_values(text)
 
         value_dim = element.vdims[0]
         text_labels = []
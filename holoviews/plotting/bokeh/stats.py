@@ -31,6 +31,10 @@ class DistributionPlot(AreaPlot):
     cut = param.Number(default=3, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'fft'], doc="""
+        Method used to evaluate the density estimate, 'fft' bins the
+        samples and convolves them with the kernel using an FFT.""")
+
     filled = param.Boolean(default=True, doc="""
         Whether the bivariate contours should be filled.""")
 
@@ -49,6 +53,10 @@ class BivariatePlot(PolygonPlot):
     cut = param.Number(default=3, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'fft'], doc="""
+        Method used to evaluate the density estimate, 'fft' bins the
+        samples and convolves them with the kernel using an FFT.""")
+
     filled = param.Boolean(default=False, doc="""
         Whether the bivariate contours should be filled.""")
 
@@ -119,9 +127,7 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
             factors = [key for key in element.groupby(element.kdims).data.keys()]
             if element.ndims > 1:
                 factors = sorted(factors)
-            factors = [tuple(d.pprint_value(k) for d, k in zip(element.kdims, key))
-                       for key in factors]
-            factors = [f[0] if len(f) == 1 else f for f in factors]
+            factors = self._format_keys(element, factors)
             xfactors, yfactors = factors, []
         return (yfactors, xfactors) if self.invert_axes else (xfactors, yfactors)
 
@@ -130,6 +136,15 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
             return
         super(BoxWhiskerPlot, self)._postprocess_hover(renderer, source)
 
+    def _format_keys(self, element, keys):
+        """
+        Formats the group keys using the key dimensions, formatting
+        all the values along each dimension at once.
+        """
+        columns = [d.pprint_values([k[i] for k in keys])
+                   for i, d in enumerate(element.kdims)]
+        return [f[0] if len(f) == 1 else f for f in zip(*columns)]
+
     def _box_stats(self, vals):
         vals = vals[isfinite(vals)]
 
@@ -182,20 +197,18 @@ class BoxWhiskerPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         else:
             cdim, cidx = None, None
 
+        if element.kdims:
+            labels = self._format_keys(element, list(groups))
+        else:
+            labels = list(groups)
+
         factors = []
-        for key, g in groups.items():
-            # Compute group label
-            if element.kdims:
-                label = tuple(d.pprint_value(v) for d, v in zip(element.kdims, key))
-                if len(label) == 1:
-                    label = label[0]
-            else:
-                label = key
+        for label, (key, g) in zip(labels, groups.items()):
             hover = 'hover' in self.handles
 
             # Add color factor
             if cidx is not None and cidx<element.ndims:
-                factors.append(cdim.pprint_value(wrap_tuple(key)[cidx]))
+                factors.append(wrap_tuple(label)[cidx])
             else:
                 factors.append(label)
 
@@ -299,6 +312,10 @@ class ViolinPlot(BoxWhiskerPlot):
     cut = param.Number(default=5, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'fft'], doc="""
+        Method used to evaluate the density estimate, 'fft' bins the
+        samples and convolves them with the kernel using an FFT.""")
+
     inner = param.ObjectSelector(objects=['box', 'quartiles', 'stick', None],
                                  default='box', doc="""
         Inner visual indicator for distribution values:
@@ -412,7 +429,7 @@ class ViolinPlot(BoxWhiskerPlot):
             scatter_map = {'x': 'x', 'y': 'y'}
             bar_glyph = 'vbar'
 
-        kwargs = {'bandwidth': self.bandwidth, 'cut': self.cut}
+        kwargs = {'bandwidth': self.bandwidth, 'cut': self.cut, 'method': self.method}
         mapping, data = {}, {}
         patches_data, seg_data, bar_data, scatter_data = (defaultdict(list) for i in range(4))
         for i, (key, g) in enumerate(groups.items()):
@@ -37,7 +37,8 @@ from ...core.ndmapping import NdMapping
 from ...core.overlay import Overlay
 from ...core.util import (
     LooseVersion, _getargspec, basestring, callable_name, cftime_types,
-    cftime_to_timestamp, pd, unique_array, isnumeric, arraylike_types)
+    cftime_to_timestamp, pd, unique_array, isnumeric, arraylike_types, is_nan,
+    isnat)
 from ...core.spaces import get_nested_dmaps, DynamicMap
 from ..util import dim_axis_label
 
@@ -697,7 +698,26 @@ def categorize_array(array, dim):
     (i.e. string) values and applies escaping for colons, which bokeh
     treats as a categorical suffix.
     """
-    return np.array([dim.pprint_value(x) for x in array])
+    return np.array(dim.pprint_values(array))
+
+
+def pprint_hover_values(dim, array):
+    """
+    Uses a Dimension instance to format an array of values for display
+    in a hover tooltip, representing NaN values with a dash.
+    """
+    array = np.asarray(array)
+    if array.dtype.kind in 'fc':
+        nans = np.isnan(array)
+    elif array.dtype.kind in 'mM':
+        nans = isnat(array)
+    elif array.dtype.kind == 'O':
+        nans = np.array([bool(is_nan(v)) for v in array], dtype=bool)
+    else:
+        return dim.pprint_values(array)
+    formatted = np.full(len(array), '-', dtype=object)
+    formatted[~nans] = dim.pprint_values(array[~nans])
+    return formatted.tolist()
 
 
 class periodic(object):
@@ -8,6 +8,7 @@ from matplotlib.collections import LineCollection, PolyCollection
 from ...core.data import Dataset
 from ...core.options import Cycle, abbreviated_exception
 from ...core.util import basestring, unique_array, search_indices, max_range, is_number, isscalar
+from ...element.util import edge_segments
 from ...util.transform import dim
 from ..util import process_cmap, get_directed_graph_paths
 from .element import ColorbarPlot
@@ -136,11 +137,13 @@ class GraphPlot(ColorbarPlot):
             y_range = ranges[ydim.name]['combined']
             arrow_len = np.hypot(y_range[1]-y_range[0], x_range[1]-x_range[0])*self.arrowhead_length
             paths = get_directed_graph_paths(element, arrow_len)
+        elif element._edgepaths is None:
+            paths = edge_segments(element)
         else:
-            paths = element._split_edgepaths.split(datatype='array', dimensions=element.edgepaths.kdims)
+            paths = element.split_edgepaths.split(datatype='array', dimensions=element.edgepaths.kdims)
 
         if self.invert_axes:
-            paths = [p[:, ::-1] for p in paths]
+            paths = paths[..., ::-1] if isinstance(paths, np.ndarray) else [p[:, ::-1] for p in paths]
         return {'nodes': (pxs, pys), 'edges': paths}, style, {'dimensions': dims}
 
 
@@ -19,6 +19,7 @@ from panel.io.state import state
 
 from ..core import OrderedDict
 from ..core import util, traversal
+from ..core.data import Dataset
 from ..core.element import Element, Element3D
 from ..core.overlay import Overlay, CompositeOverlay
 from ..core.layout import Empty, NdLayout, Layout
@@ -27,6 +28,7 @@ from ..core.overlay import NdOverlay
 from ..core.spaces import HoloMap, DynamicMap
 from ..core.util import stream_parameters, isfinite
 from ..element import Table, Graph, Contours
+from ..element.stats import StatisticsElement
 from ..util.transform import dim
 from .util import (get_dynamic_mode, initialize_unbounded, dim_axis_label,
                    attach_streams, traverse_setter, get_nested_streams,
@@ -551,6 +553,45 @@ class DimensionedPlot(Plot):
         return norm_opts
 
 
+    @staticmethod
+    def _dimension_factors(element, dimension):
+        """
+        Returns the unique values along a dimension of an element,
+        caching them on Datasets until the data is replaced.
+        """
+        compute = lambda: util.unique_array(element.dimension_values(dimension, expanded=False))
+        if isinstance(element, Dataset):
+            return element._cached(('factors', dimension.name), compute)
+        return compute()
+
+
+    @staticmethod
+    def _cache_element_ranges(element):
+        """
+        Computes the ranges and factors of all dimensions of a Dataset
+        in one batched pass over the data, which lazy interfaces can
+        evaluate together rather than once per dimension.
+        """
+        if (not isinstance(element, Dataset) or isinstance(element, Graph) or
+            (isinstance(element, Contours) and element.level is not None)):
+            return
+        range_dims, factor_dims = [], []
+        for el_dim in element.dimensions('ranges'):
+            if el_dim not in element or (isinstance(element, StatisticsElement)
+                                         and el_dim in element.vdims):
+                continue
+            kind = element.interface.dtype(element, el_dim).kind
+            if kind in 'SU':
+                if el_dim.values in ([], None):
+                    factor_dims.append(el_dim)
+            elif not all(util.isfinite(r) for r in el_dim.range):
+                # Object dimensions only need factors if their range
+                # turns out to be categorical, which are then computed
+                # lazily when the group ranges are collected
+                range_dims.append(el_dim)
+        element._cache_ranges(range_dims, factor_dims)
+
+
     @classmethod
     def _compute_group_range(cls, group, elements, ranges):
         # Iterate over all elements in a normalization group
@@ -593,6 +634,7 @@ class DimensionedPlot(Plot):
                         group_ranges[dim_name]['data'].append(drange)
 
             # Compute dimension normalization
+            cls._cache_element_ranges(el)
             for el_dim in el.dimensions('ranges'):
                 if hasattr(el, 'interface'):
                     if isinstance(el, Graph) and el_dim in el.nodes.dimensions():
@@ -623,16 +665,17 @@ class DimensionedPlot(Plot):
                     if 'factors' not in group_ranges[el_dim.name]:
                         group_ranges[el_dim.name]['factors'] = []
                     if el_dim.values not in ([], None):
-                        values = el_dim.values
+                        factors = util.unique_array(el_dim.values)
                     elif el_dim in el:
                         if isinstance(el, Graph) and el_dim in el.kdims[:2]:
                             # Graph start/end normalization should include all node indices
-                            values = el.nodes.dimension_values(2, expanded=False)
+                            factors = cls._dimension_factors(el.nodes, el.nodes.get_dimension(2))
                         else:
-                            values = el.dimension_values(el_dim, expanded=False)
+                            factors = cls._dimension_factors(el, el_dim)
                     elif isinstance(el, Graph) and el_dim in el.nodes:
-                        values = el.nodes.dimension_values(el_dim, expanded=False)
-                    factors = util.unique_array(values)
+                        factors = cls._dimension_factors(el.nodes, el_dim)
+                    else:
+                        factors = []
                     group_ranges[el_dim.name]['factors'].append(factors)
 
         dim_ranges = []
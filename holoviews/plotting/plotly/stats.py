@@ -55,6 +55,10 @@ class DistributionPlot(ElementPlot):
     cut = param.Number(default=3, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='exact', objects=['exact', 'fft'], doc="""
+        Method used to evaluate the density estimate, 'fft' bins the
+        samples and convolves them with the kernel using an FFT.""")
+
     filled = param.Boolean(default=True, doc="""
         Whether the bivariate contours should be filled.""")
 
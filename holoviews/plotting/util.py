@@ -13,11 +13,13 @@ import param
 from ..core import (HoloMap, DynamicMap, CompositeOverlay, Layout,
                     Overlay, GridSpace, NdLayout, NdOverlay)
 from ..core.options import Cycle
+from ..core.data.ragged import RaggedArray
 from ..core.ndmapping import item_check
 from ..core.spaces import get_nested_streams
 from ..core.util import (match_spec, wrap_tuple, basestring, get_overlay_spec,
                          unique_iterator, closest_match, is_number, isfinite,
                          python2sort, disable_constant, arraylike_types)
+from ..element.util import edge_segments
 from ..streams import LinkedStream
 from ..util.transform import dim
 
@@ -1001,21 +1003,67 @@ def get_directed_graph_paths(element, arrow_length):
     Computes paths for a directed path which include an arrow to
     indicate the directionality of each edge.
     """
-    edgepaths = element._split_edgepaths
-    edges = edgepaths.split(datatype='array', dimensions=edgepaths.kdims)
-    arrows = []
-    for e in edges:
-        sx, sy = e[0]
-        ex, ey = e[1]
-        rad = np.arctan2(ey-sy, ex-sx)
-        xa0 = ex - np.cos(rad+np.pi/8)*arrow_length
-        ya0 = ey - np.sin(rad+np.pi/8)*arrow_length
-        xa1 = ex - np.cos(rad-np.pi/8)*arrow_length
-        ya1 = ey - np.sin(rad-np.pi/8)*arrow_length
-        arrow = np.array([(sx, sy), (ex, ey), (np.nan, np.nan),
-                          (xa0, ya0), (ex, ey), (xa1, ya1)])
-        arrows.append(arrow)
-    return arrows
+    if element._edgepaths is None:
+        segments = edge_segments(element)
+    else:
+        edgepaths = element.split_edgepaths
+        edges = edgepaths.split(datatype='array', dimensions=edgepaths.kdims)
+        segments = np.array([e[:2] for e in edges]).reshape(-1, 2, 2)
+    (sx, sy), (ex, ey) = segments[:, 0].T, segments[:, 1].T
+    rad = np.arctan2(ey-sy, ex-sx)
+    xa0 = ex - np.cos(rad+np.pi/8)*arrow_length
+    ya0 = ey - np.sin(rad+np.pi/8)*arrow_length
+    xa1 = ex - np.cos(rad-np.pi/8)*arrow_length
+    ya1 = ey - np.sin(rad-np.pi/8)*arrow_length
+    nans = np.full_like(sx, np.nan)
+    return np.stack([np.column_stack(coords) for coords in
+                     [(sx, sy), (ex, ey), (nans, nans),
+                      (xa0, ya0), (ex, ey), (xa1, ya1)]], axis=1)
+
+
+def path_columns(element, dimensions):
+    """
+    Returns flat arrays of the values along all the paths of a Path
+    type element for each of the supplied dimensions, built from the
+    values of each geometry without going through the NaN-separated
+    form, along with the offsets delimiting each path in the flat
+    arrays.
+    """
+    data = element.data
+    if isinstance(data, RaggedArray):
+        lengths = data.lengths
+        names = [element.get_dimension(d, strict=True).name for d in dimensions]
+        columns = [np.repeat(data.scalars[n], lengths) if n in data.scalars
+                   else data.columns[n] for n in names]
+    else:
+        paths = element.split() if element.interface.multi or len(element) else []
+        lengths = np.array([len(p) for p in paths], dtype='int64')
+        paths = [p for p in paths if len(p)]
+        columns = [np.concatenate([p.dimension_values(d) for p in paths])
+                   if paths else np.array([]) for d in dimensions]
+    offsets = np.zeros(len(lengths)+1, dtype='int64')
+    np.cumsum(lengths, out=offsets[1:])
+    return columns, offsets
+
+
+def split_path_columns(column, offsets):
+    """
+    Splits a flat column returned by path_columns into views of the
+    values along each path.
+    """
+    return np.split(column, offsets[1:-1]) if len(offsets) > 1 else []
+
+
+def segment_starts(offsets):
+    """
+    Given the offsets delimiting a number of paths returns the index
+    of the first vertex of each line segment along the paths, i.e.
+    the index of every vertex except the last vertex of each path.
+    """
+    mask = np.ones(offsets[-1], dtype=bool)
+    ends = offsets[1:][np.diff(offsets) > 0]-1
+    mask[ends] = False
+    return np.flatnonzero(mask)
 
 
 def rgb2hex(rgb):
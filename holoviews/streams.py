@@ -6,7 +6,7 @@ server-side or in Javascript in the Jupyter notebook (client-side).
 
 import weakref
 from numbers import Number
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from contextlib import contextmanager
 from itertools import groupby
 from types import FunctionType
@@ -484,9 +484,25 @@ class Buffer(Pipe):
     subscribed to this stream will update the axis ranges when an
     update is pushed. This makes it possible to control whether zooming
     is allowed while streaming.
+
+    By default each update concatenates the new rows with the existing
+    data. When ``ringbuffer`` is enabled the rows are instead stored in
+    preallocated per-column arrays (see util.RingBuffer), so each
+    update only copies the new rows and array and dictionary data is
+    made available as views into the storage. Since the storage is
+    reused the data of an update is only valid until the next update.
+
+    Buffer also tracks the range of each numeric column incrementally.
+    When a DynamicMap subscribed to the Buffer returns elements
+    wrapping the buffered data the ranges are stored on the elements,
+    so that they do not have to scan the data to compute their
+    ranges. Similarly the position of the data within the stream of
+    appended rows is stored on the elements, allowing operations such
+    as histogram to only process the newly appended rows.
     """
 
-    def __init__(self, data, length=1000, index=True, following=True, **params):
+    def __init__(self, data, length=1000, index=True, following=True,
+                 ringbuffer=False, **params):
         if (util.pd and isinstance(data, util.pd.DataFrame)):
             example = data
         elif isinstance(data, np.ndarray):
@@ -527,6 +543,20 @@ class Buffer(Pipe):
         self._chunk_length = 0
         self._count = 0
         self._index = index
+        self._ring = None
+        if ringbuffer:
+            self._ring = util.RingBuffer(length)
+            self._ring.append(self._columns(example))
+        self._ranges = OrderedDict(
+            (col, util.SlidingRange(length)) for col, values in self._named_columns(example)
+            if util.SlidingRange.supports(values))
+        self._update_ranges(example)
+        self._stream_token = object()
+        columns = self._named_columns(example)
+        self._rows = len(columns[0][1]) if columns else 0
+        self._row_check = None
+        if columns and self._rows <= length:
+            self._row_check = self._check_rows(example)
 
 
     def verify(self, x):
@@ -554,6 +584,12 @@ class Buffer(Pipe):
 
     def clear(self):
         "Clears the data in the stream"
+        if self._ring is not None:
+            self._ring.clear()
+        for tracker in self._ranges.values():
+            tracker.clear()
+        self._stream_token = object()
+        self._rows = 0
         if isinstance(self.data, np.ndarray):
             data = self.data[:, :0]
         elif util.pd and isinstance(self.data, util.pd.DataFrame):
@@ -600,6 +636,129 @@ class Buffer(Pipe):
         return data
 
 
+    def _named_columns(self, data):
+        """
+        Returns the columns of the accepted data types as a list of
+        name and value tuples, using indices to name array columns.
+        """
+        if isinstance(data, np.ndarray):
+            return [(i, data[:, i]) for i in range(data.shape[1])]
+        elif util.pd and isinstance(data, util.pd.DataFrame):
+            return [(c, data[c].values) for c in data.columns]
+        return list(data.items())
+
+
+    def _update_ranges(self, data):
+        "Updates the range of each column with a chunk of data."
+        columns = dict(self._named_columns(data))
+        for col, tracker in self._ranges.items():
+            tracker.update(columns[col])
+
+
+    @property
+    def ranges(self):
+        "The (min, max) range of each numeric column of the buffered data."
+        return OrderedDict((col, tracker.range) for col, tracker in self._ranges.items())
+
+
+    def _check_rows(self, data):
+        """
+        Returns the number of rows and the first and last value of
+        each tracked column, used to check cheaply that the data has
+        not been modified since it was emitted.
+        """
+        columns = self._named_columns(data)
+        rows = len(columns[0][1]) if columns else 0
+        ends = [values[[0, -1]] if rows else values[:0]
+                for col, values in columns if col in self._ranges]
+        return rows, ends
+
+
+    def _annotate(self, obj):
+        """
+        Stores the tracked column ranges on the Datasets in the
+        supplied object which wrap the data emitted by the last
+        update, so they do not have to scan the data to compute their
+        ranges. The position of the data in the stream is stored
+        along with them as a tuple of the Buffer, a token identifying
+        the stream since it was last cleared, the total number of
+        rows appended and the number of rows retained. Nothing is
+        stored if the data was modified since it was emitted.
+        """
+        from .core.data import Dataset
+        from .core.dimension import Dimensioned
+        if self._row_check is None or not isinstance(obj, Dimensioned):
+            return
+        elements = [el for el in obj.traverse(lambda x: x, [Dataset])
+                    if self._wraps_data(el)]
+        if not elements:
+            return
+        rows, ends = self._check_rows(self.data)
+        if (rows != self._row_check[0] or
+            not all(np.array_equal(e1, e2) for e1, e2 in zip(ends, self._row_check[1]))):
+            return
+        ranges = self.ranges
+        position = (self, self._stream_token, self._rows, self.length)
+        for el in elements:
+            dims = el.dimensions()
+            cache = el._data_cache_dict()
+            cache['stream_position'] = position
+            for col, drange in ranges.items():
+                if isinstance(self.data, np.ndarray):
+                    dim = dims[col] if col < len(dims) else None
+                elif isinstance(col, util.basestring):
+                    dim = el.get_dimension(col)
+                else:
+                    dim = None
+                if dim is not None:
+                    cache.setdefault(('range', dim.name), drange)
+
+
+    def _wraps_data(self, element):
+        "Whether the element holds the buffered data itself."
+        if isinstance(self.data, dict):
+            return (isinstance(element.data, dict) and
+                    all(element.data.get(k) is v for k, v in self.data.items()))
+        return element.data is self.data
+
+
+    def _columns(self, data):
+        """
+        Splits the accepted data types into a list of arrays, storing
+        2D arrays whole and the index of DataFrames as the last column.
+        """
+        if isinstance(data, np.ndarray):
+            return [data]
+        elif util.pd and isinstance(data, util.pd.DataFrame):
+            columns = [data.iloc[:, i].values for i in range(len(data.columns))]
+            return columns + [data.index.values]
+        return [data[k] for k in self.data]
+
+
+    def _append(self, data):
+        """
+        Appends the accepted data types to the ring buffer returning
+        the buffered data in the same format.
+        """
+        columns = self._columns(data)
+        self._ring.append(columns)
+        self._chunk_length = len(columns[0]) if columns else 0
+        views = self._ring.views()
+        if isinstance(data, np.ndarray):
+            return views[0]
+        elif util.pd and isinstance(data, util.pd.DataFrame):
+            index = self.data.index
+            if isinstance(index, util.pd.MultiIndex):
+                index = util.pd.MultiIndex.from_tuples(views[-1], names=index.names)
+            else:
+                index = util.pd.Index(views[-1], name=index.name)
+            df = util.pd.DataFrame(dict(enumerate(views[:-1])), index=index,
+                                   columns=list(range(len(views)-1)))
+            df.columns = data.columns
+            return df
+        return dict(zip(self.data, views))
+
+
     def update(self, **kwargs):
         """
         Overrides update to concatenate streamed data up to defined length.
@@ -610,7 +769,10 @@ class Buffer(Pipe):
                 list(data.columns) != list(self.data.columns) and self._index):
                 data = data.reset_index()
             self.verify(data)
-            kwargs['data'] = self._concat(data)
+            kwargs['data'] = self._concat(data) if self._ring is None else self._append(data)
+            self._update_ranges(data)
+            self._rows += self._chunk_length
+            self._row_check = self._check_rows(kwargs['data'])
             self._count += 1
         super(Buffer, self).update(**kwargs)
 
@@ -149,6 +149,49 @@ class HomogeneousColumnTests(object):
     def test_dataset_range(self):
         self.assertEqual(self.dataset_hm.range('y'), (0, 20))
 
+    def _count_range_calls(self, dataset):
+        "Replaces the interface of the dataset with one counting range calls"
+        calls = []
+        interface = dataset.interface
+        class CountingInterface(interface):
+            @classmethod
+            def range(cls, dataset, dim):
+                calls.append(dim.name)
+                return interface.range(dataset, dim)
+        dataset.interface = CountingInterface
+        return calls
+
+    def test_dataset_range_cached(self):
+        ds = self.dataset_hm.clone()
+        calls = self._count_range_calls(ds)
+        self.assertEqual(ds.range('y'), (0, 20))
+        self.assertEqual(ds.range('y'), (0, 20))
+        self.assertEqual(calls, ['y'])
+
+    def test_dataset_interface_ranges(self):
+        ds = self.dataset_hm
+        ranges, factors = ds.interface.ranges(ds, ['x', 'y'], ['x'])
+        self.assertEqual(ranges, [ds.range('x'), ds.range('y')])
+        self.assertEqual(factors[0], ds.dimension_values('x', expanded=False))
+
+    def test_dataset_cache_ranges(self):
+        ds = self.dataset_hm.clone()
+        calls = self._count_range_calls(ds)
+        ds._cache_ranges(['x', 'y'], ['x'])
+        del calls[:]
+        self.assertEqual(ds.range('x'), (0, 10))
+        self.assertEqual(ds.range('y'), (0, 20))
+        self.assertEqual(calls, [])
+        def compute():
+            raise AssertionError('Factors were not cached')
+        self.assertEqual(ds._cached(('factors', 'x'), compute), np.arange(11))
+
+    def test_dataset_range_cache_invalidated_by_data(self):
+        ds = self.dataset_hm.clone()
+        ds.range('y')
+        ds.data = self.dataset_hm.select(x=(0, 5)).data
+        self.assertEqual(ds.range('y'), (0, 8))
+
     def test_dataset_closest(self):
         closest = self.dataset_hm.closest([0.51, 1, 9.9])
         self.assertEqual(closest, [1., 1., 10.])
@@ -263,6 +306,12 @@ class HomogeneousColumnTests(object):
                                 kdims=['x'], vdims=['y'])
         self.assertEqual(self.dataset_hm[lambda x: (x >= 5) & (x < 9)], dataset_slice)
 
+    def test_dataset_slice_unsorted_hm(self):
+        dataset = Dataset((self.xs[::-1], self.y_ints[::-1]), kdims=['x'], vdims=['y'])
+        dataset_slice = Dataset({'x':range(8, 4, -1), 'y':[2 * i for i in range(8, 4, -1)]},
+                                kdims=['x'], vdims=['y'])
+        self.assertEqual(dataset[5:9], dataset_slice)
+
     def test_dataset_1D_reduce_hm(self):
         dataset = Dataset({'x':self.xs, 'y':self.y_ints}, kdims=['x'], vdims=['y'])
         self.assertEqual(dataset.reduce('x', np.mean), 10)
@@ -536,6 +585,23 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
                                  kdims=self.kdims, vdims=self.vdims)
         self.assertEqual(self.table.sort(), dataset_sorted)
 
+    def test_dataset_select_list_ht(self):
+        dataset_select = Dataset({'Gender':['M', 'F'], 'Age':[10, 12],
+                                  'Weight':[15, 10], 'Height':[0.8, 0.8]},
+                                 kdims=self.kdims, vdims=self.vdims)
+        self.assertEqual(self.table.select(Age=[12, 10, 20]), dataset_select)
+
+    def test_dataset_select_string_list_ht(self):
+        dataset_select = Dataset({'Gender':['F'], 'Age':[12],
+                                  'Weight':[10], 'Height':[0.8]},
+                                 kdims=self.kdims, vdims=self.vdims)
+        self.assertEqual(self.table.select(Gender=['F', 'X']), dataset_select)
+
+    def test_dataset_slice_multiple_dims_ht(self):
+        dataset_slice = Dataset({'x':self.xs[3:6], 'y':self.ys[3:6]},
+                                kdims=['x'], vdims=['y'])
+        self.assertEqual(self.dataset_ht.select(x=(2, 9), y=(0.3, 0.6)), dataset_slice)
+
     def test_dataset_sample_ht(self):
         samples = self.dataset_ht.sample([0, 5, 10]).dimension_values('y')
         self.assertEqual(samples, np.array([0, 0.5, 1]))
@@ -593,6 +659,30 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
                              kdims=self.alias_kdims[:1], vdims=self.alias_vdims)
         self.compare_dataset(self.alias_table.aggregate('Gender', np.mean), aggregated)
 
+    def test_dataset_aggregate_ht_sum(self):
+        aggregated = Dataset({'Gender':['M', 'F'], 'Weight':[33, 10], 'Height':[1.4, 0.8]},
+                             kdims=self.kdims[:1], vdims=self.vdims)
+        self.compare_dataset(self.table.aggregate(['Gender'], np.sum), aggregated)
+
+    def test_dataset_aggregate_ht_min_max(self):
+        minimum = Dataset({'Gender':['M', 'F'], 'Weight':[15, 10], 'Height':[0.6, 0.8]},
+                          kdims=self.kdims[:1], vdims=self.vdims)
+        maximum = Dataset({'Gender':['M', 'F'], 'Weight':[18, 10], 'Height':[0.8, 0.8]},
+                          kdims=self.kdims[:1], vdims=self.vdims)
+        self.compare_dataset(self.table.aggregate(['Gender'], np.min), minimum)
+        self.compare_dataset(self.table.aggregate(['Gender'], np.max), maximum)
+
+    def test_dataset_aggregate_ht_std(self):
+        aggregated = Dataset({'Gender':['M', 'F'], 'Weight':[1.5, 0], 'Height':[0.1, 0]},
+                             kdims=self.kdims[:1], vdims=self.vdims)
+        self.compare_dataset(self.table.aggregate(['Gender'], np.std), aggregated)
+
+    def test_dataset_aggregate_ht_callable(self):
+        aggregated = Dataset({'Gender':['M', 'F'], 'Weight':[16.5, 10], 'Height':[0.7, 0.8]},
+                             kdims=self.kdims[:1], vdims=self.vdims)
+        function = lambda x, **kwargs: np.median(x, **kwargs)
+        self.compare_dataset(self.table.aggregate(['Gender'], function), aggregated)
+
     def test_dataset_2D_aggregate_partial_ht(self):
         dataset = Dataset({'x':self.xs, 'y':self.ys, 'z':self.zs},
                           kdims=['x', 'y'], vdims=['z'])
@@ -55,6 +55,12 @@ class DaskDatasetTest(PandasInterfaceTests):
     def test_dataset_aggregate_string_types_size(self):
         raise SkipTest("Not supported")
 
+    def test_dataset_aggregate_ht_std(self):
+        raise SkipTest("Not supported")
+
+    def test_dataset_aggregate_ht_callable(self):
+        raise SkipTest("Not supported")
+
     def test_dataset_2D_aggregate_partial_hm(self):
         raise SkipTest("Temporarily skipped")
 
@@ -92,3 +98,59 @@ class DaskDatasetTest(PandasInterfaceTests):
         ds_range = ds.range(0)
         self.assertTrue(np.isnan(ds_range[0]))
         self.assertTrue(np.isnan(ds_range[1]))
+
+    def test_dataset_ranges_single_compute(self):
+        df = pd.DataFrame({'x': [1, 2, 3], 'y': [4., 6., 5.], 'z': ['b', 'a', 'c']})
+        ds = Dataset(dd.from_pandas(df, npartitions=2), kdims=['x'], vdims=['y', 'z'])
+        computed = []
+        original = dd.compute
+        def compute(*args, **kwargs):
+            computed.append(len(args))
+            return original(*args, **kwargs)
+        dd.compute = compute
+        try:
+            ranges, factors = ds.interface.ranges(ds, ['x', 'y', 'z'], ['z'])
+        finally:
+            dd.compute = original
+        self.assertEqual(computed, [5])
+        self.assertEqual(ranges, [(1, 3), (4., 6.), ('a', 'c')])
+        self.assertEqual(sorted(factors[0]), ['a', 'b', 'c'])
+
+    def test_multi_dimension_groupby_lazy_groups(self):
+        df = pd.DataFrame({'x': [0, 1, 0, 1, 0, np.nan], 'y': list('aabbab'),
+                           'z': np.arange(6)})
+        ds = Dataset(dd.from_pandas(df, npartitions=3), kdims=['x', 'y'], vdims=['z'])
+        grouped = ds.groupby(['x', 'y'])
+        self.assertEqual(list(grouped.keys()), [(0, 'a'), (1, 'a'), (0, 'b'), (1, 'b')])
+        self.assertIsInstance(grouped[(0, 'a')].data, dd.DataFrame)
+        self.assertEqual(grouped[(0, 'a')].dimension_values('z'), np.array([0, 4]))
+        self.assertEqual(grouped[(1, 'b')].dimension_values('z'), np.array([3]))
+
+    def test_multi_dimension_groupby_single_pass(self):
+        df = pd.DataFrame({'x': [0, 1, 0, 1, 0, 2], 'y': list('aabbab'),
+                           'z': np.arange(6)})
+        executions = []
+        def count(partition):
+            executions.append(len(partition))
+            return partition
+        ddf = dd.from_pandas(df, npartitions=3)
+        ddf = ddf.map_partitions(count, meta=ddf._meta)
+        ds = Dataset(ddf, kdims=['x', 'y'], vdims=['z'])
+        del executions[:]
+        grouped = ds.groupby(['x', 'y'])
+        # Only the unique keys are computed up front
+        self.assertEqual(len(executions), 3)
+        del executions[:]
+        computed = dd.compute(*[group.data for group in grouped])
+        self.assertEqual(len(executions), 3)
+        self.assertEqual([group['z'].values for group in computed],
+                         [np.array([0, 4]), np.array([1]), np.array([2]),
+                          np.array([3]), np.array([5])])
+
+    def test_multi_dimension_groupby_order_column(self):
+        df = pd.DataFrame({'x': [0, 0, 1], 'y': list('aab'),
+                           '__order__': [3, 2, 1]})
+        ds = Dataset(dd.from_pandas(df, npartitions=2), kdims=['x', 'y'],
+                     vdims=['__order__'])
+        grouped = ds.groupby(['x', 'y'])
+        self.assertEqual(grouped[(0, 'a')].dimension_values('__order__'), np.array([3, 2]))
@@ -49,6 +49,25 @@ class DictDatasetTest(HeterogeneousColumnTests, ScalarColumnTests, InterfaceTest
         ds = Dataset({'x': None, 'y': [0, 1]}, kdims=['x', 'y'])
         self.assertEqual(ds.dimension_values(0), np.array([None, None]))
 
+    def test_dataset_select_index_sorted_slice(self):
+        ds = self.dataset_hm
+        self.assertEqual(ds.interface.select_index(ds, {'x': (2.5, 7)}), slice(3, 7))
+
+    def test_dataset_select_index_sorted_slices_intersect(self):
+        ds = self.dataset_hm
+        index = ds.interface.select_index(ds, {'x': (2, 7), 'y': (8, None)})
+        self.assertEqual(index, slice(4, 7))
+
+    def test_dataset_select_index_unsorted_mask(self):
+        ds = Dataset((self.xs[::-1], self.y_ints), kdims=['x'], vdims=['y'])
+        index = ds.interface.select_index(ds, {'x': (2, 4)})
+        self.assertEqual(index, np.isin(self.xs[::-1], [2, 3]))
+
+    def test_dataset_select_index_mixed_mask(self):
+        ds = self.dataset_hm
+        index = ds.interface.select_index(ds, {'x': (2, 7), 'y': [2, 6, 10]})
+        self.assertEqual(np.flatnonzero(index), np.array([3, 5]))
+
     def test_dataset_ignore_non_dimensions(self):
         ds = Dataset({'x': [0, 1], 'y': [1, 2], 'ignore_scalar': 1,
                       'ignore_array': np.array([2, 3]), 'ignore_None': None},
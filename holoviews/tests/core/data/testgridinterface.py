@@ -183,6 +183,47 @@ class GridInterfaceTests(GriddedInterfaceTests, HomogeneousColumnTests, Interfac
         for c, d in keys:
             self.assertEqual(grouped[c, d], dataset.select(c=c, d=d).reindex(['a', 'b']))
 
+    def test_dataset_groupby_returns_views(self):
+        array = np.random.rand(4, 3, 2)
+        dataset = Dataset((range(2), range(3), range(4), array),
+                          kdims=['x', 'y', 'z'], vdims=['Value'])
+        group = dataset.groupby(['y', 'z'])[1, 2]
+        self.assertEqual(group.dimension_values('Value'), array[2, 1])
+        self.assertTrue(np.shares_memory(np.asarray(group.data['Value']),
+                                         np.asarray(dataset.data['Value'])))
+
+    def test_dataset_groupby_singleton_dim(self):
+        array = np.random.rand(3, 1, 4)
+        dataset = Dataset((range(4), [0], range(3), array),
+                          kdims=['x', 'y', 'z'], vdims=['Value'])
+        grouped = dataset.groupby('z')
+        self.assertEqual(grouped[1].dimension_values('Value', flat=False), array[1])
+
+    def test_dataset_groupby_inverted_coords(self):
+        array = np.random.rand(3, 4)
+        dataset = Dataset((range(4), [2, 1, 0], array),
+                          kdims=['x', 'y'], vdims=['Value'])
+        grouped = dataset.groupby('y')
+        self.assertEqual(sorted(grouped.keys()), [0, 1, 2])
+        self.assertEqual(grouped[0].dimension_values('Value'), array[2])
+
+    def test_dataset_canonical_values_cached(self):
+        array = np.random.rand(3, 4)
+        dataset = Dataset((range(4)[::-1], range(3), array),
+                          kdims=['x', 'y'], vdims=['Value'])
+        values = dataset.dimension_values('Value', flat=False)
+        self.assertEqual(values, array[:, ::-1])
+        self.assertIs(dataset.dimension_values('Value', flat=False), values)
+
+    def test_dataset_canonical_values_cache_invalidated(self):
+        array = np.random.rand(3, 4)
+        dataset = Dataset((range(4), range(3), array),
+                          kdims=['x', 'y'], vdims=['Value'])
+        dataset.dimension_values('Value', flat=False)
+        dataset.data = Dataset((range(4), range(3), array*2), kdims=['x', 'y'],
+                               vdims=['Value'], datatype=[self.datatype]).data
+        self.assertEqual(dataset.dimension_values('Value', flat=False), array*2)
+
     def test_dataset_groupby_drop_dims(self):
         array = np.random.rand(3, 20, 10)
         ds = Dataset({'x': range(10), 'y': range(20), 'z': range(3), 'Val': array},
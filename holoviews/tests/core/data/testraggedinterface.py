@@ -0,0 +1,153 @@
+"""
+Tests for the RaggedInterface.
+"""
+
+import numpy as np
+from holoviews.core.data import Dataset, RaggedArray
+from holoviews.core.data.interface import DataError
+from holoviews.element import Path, Polygons
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class RaggedInterfaceTest(ComparisonTestCase):
+    """
+    Test of the RaggedInterface.
+    """
+
+    def setUp(self):
+        self.arrays = [np.column_stack([np.arange(i, i+2), np.arange(i, i+2)])
+                       for i in range(2)]
+
+    def test_ragged_array_dataset(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertIsInstance(rds.data, RaggedArray)
+        self.assertEqual(rds.data.offsets, np.array([0, 2, 4]))
+        for i, ds in enumerate(rds.split()):
+            self.assertEqual(ds, Path(self.arrays[i], kdims=['x', 'y'], datatype=['dictionary']))
+
+    def test_ragged_dict_scalar_columns(self):
+        paths = [{'x': np.arange(i, i+2), 'y': np.arange(i, i+2), 'z': i} for i in range(2)]
+        rds = Path(paths, kdims=['x', 'y'], vdims=['z'], datatype=['ragged'])
+        self.assertEqual(rds.data.scalars['z'], np.array([0, 1]))
+        self.assertEqual(rds.dimension_values('z'), np.array([0, 0, np.NaN, 1, 1]))
+        self.assertEqual(rds.dimension_values('z', expanded=False), np.array([0, 1]))
+
+    def test_ragged_array_length(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(len(rds), 5)
+
+    def test_ragged_empty_length(self):
+        rds = Path([], kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(len(rds), 0)
+
+    def test_ragged_array_range(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.range(0), (0, 2))
+
+    def test_ragged_array_shape(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.shape, (5, 2))
+
+    def test_ragged_empty_shape(self):
+        rds = Path([], kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.shape, (0, 2))
+
+    def test_ragged_array_values(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.dimension_values(0), np.array([0., 1, np.NaN, 1, 2]))
+
+    def test_ragged_empty_values(self):
+        rds = Path([], kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.dimension_values(0), np.array([]))
+
+    def test_ragged_array_values_coordinates_nonexpanded(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.dimension_values(0, expanded=False), np.array([0., 1, 1, 2]))
+
+    def test_ragged_array_values_nonexpanded_constant_kdim(self):
+        arrays = [np.column_stack([np.arange(i, i+2), np.arange(i, i+2), np.ones(2)*i]) for i in range(2)]
+        rds = Path(arrays, kdims=['x', 'y'], vdims=['z'], datatype=['ragged'])
+        self.assertEqual(rds.dimension_values(2, expanded=False), np.array([0, 1]))
+
+    def test_ragged_values_match_multi(self):
+        arrays = [np.random.rand(n, 2) for n in (3, 1, 5)]
+        rds = Path(arrays, kdims=['x', 'y'], datatype=['ragged'])
+        mds = Path(arrays, kdims=['x', 'y'], datatype=['multitabular'])
+        self.assertEqual(rds.dimension_values('y'), mds.dimension_values('y'))
+        self.assertEqual(rds.range('y'), mds.range('y'))
+
+    def test_ragged_array_redim(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged']).redim(x='x2')
+        for i, ds in enumerate(rds.split()):
+            self.assertEqual(ds, Path(self.arrays[i], kdims=['x2', 'y']))
+
+    def test_ragged_mismatched_offsets_raises(self):
+        data = RaggedArray({'x': np.arange(3), 'y': np.arange(3)}, [0, 2, 4])
+        with self.assertRaises(DataError):
+            Path(data, kdims=['x', 'y'])
+
+    def test_ragged_missing_dimension_raises(self):
+        data = RaggedArray({'x': np.arange(4), 'z': np.arange(4)}, [0, 2, 4])
+        with self.assertRaises(DataError):
+            Path(data, kdims=['x', 'y'])
+
+    def test_ragged_split(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        for arr1, arr2 in zip(rds.split(datatype='array'), self.arrays):
+            self.assertEqual(arr1, arr2)
+
+    def test_ragged_split_start_end(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        split = rds.split(1, 2, datatype='array')
+        self.assertEqual(len(split), 1)
+        self.assertEqual(split[0], self.arrays[1])
+
+    def test_ragged_split_empty(self):
+        rds = Path([], kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(len(rds.split()), 0)
+
+    def test_ragged_select(self):
+        rds = Dataset(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        selected = rds.select(x=(1, 2))
+        self.assertEqual(selected.data.offsets, np.array([0, 1, 2]))
+        self.assertEqual(selected.dimension_values('x'), np.array([1, np.NaN, 1]))
+
+    def test_ragged_iloc_geometries(self):
+        arrays = [np.random.rand(n, 2) for n in (3, 1, 5)]
+        rds = Path(arrays, kdims=['x', 'y'], datatype=['ragged'])
+        split = rds.iloc[[2, 0]].split(datatype='array')
+        self.assertEqual(split[0], arrays[2])
+        self.assertEqual(split[1], arrays[0])
+
+    def test_ragged_iloc_scalar_value(self):
+        paths = [{'x': np.arange(i, i+2), 'y': np.arange(i, i+2), 'z': i} for i in range(3)]
+        rds = Path(paths, kdims=['x', 'y'], vdims=['z'], datatype=['ragged'])
+        self.assertEqual(rds.iloc[2, 'z'], 2)
+
+    def test_ragged_add_dimension_scalar(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        rds = rds.add_dimension('A', 0, [0, 1], True)
+        self.assertEqual(rds.data.scalars['A'], np.array([0, 1]))
+        self.assertTrue(rds.interface.isscalar(rds, 'A'))
+
+    def test_ragged_dict_groupby(self):
+        arrays = [{'x': np.arange(i, i+2), 'y': i} for i in range(2)]
+        rds = Dataset(arrays, kdims=['x', 'y'], datatype=['ragged'])
+        for i, (k, ds) in enumerate(rds.groupby('y').items()):
+            self.assertEqual(k, arrays[i]['y'])
+            self.assertEqual(ds.dimension_values('x'), arrays[i]['x'])
+
+    def test_ragged_dict_groupby_non_scalar(self):
+        arrays = [{'x': np.arange(i, i+2), 'y': i} for i in range(2)]
+        rds = Dataset(arrays, kdims=['x', 'y'], datatype=['ragged'])
+        with self.assertRaises(ValueError):
+            rds.groupby('x')
+
+    def test_ragged_polygon_holes(self):
+        hole = np.array([[0.1, 0.1], [0.2, 0.1], [0.2, 0.2]])
+        polys = [{'x': [0, 1, 1], 'y': [0, 0, 1], 'holes': [[hole]]},
+                 {'x': [2, 3, 3], 'y': [0, 0, 1]}]
+        rpolys = Polygons(polys, datatype=['ragged'])
+        self.assertTrue(rpolys.has_holes)
+        self.assertEqual(rpolys.holes(), [[[hole]], [[]]])
+        self.assertEqual(rpolys.iloc[[1, 0]].holes(), [[[]], [[hole]]])
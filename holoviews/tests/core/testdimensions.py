@@ -197,6 +197,40 @@ class DimensionValuesTest(ComparisonTestCase):
         self.assertEqual(dim.values, self.values2)
 
 
+class DimensionPprintValuesTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.values = np.array([3.14159, 2., np.NaN, 3.14159, 10])
+
+    def test_pprint_values_default(self):
+        dim = Dimension('x')
+        self.assertEqual(dim.pprint_values(self.values),
+                         [dim.pprint_value(v) for v in self.values])
+
+    def test_pprint_values_value_format(self):
+        dim = Dimension('x', value_format=lambda x: '%.1f' % x)
+        self.assertEqual(dim.pprint_values(self.values),
+                         ['3.1', '2.0', 'nan', '3.1', '10.0'])
+
+    def test_pprint_values_type_formatter(self):
+        dim = Dimension('x', type=float)
+        dim.type_formatters = {float: '%.2f'}
+        self.assertEqual(dim.pprint_values(self.values),
+                         ['3.14', '2.00', 'nan', '3.14', '10.00'])
+
+    def test_pprint_values_strings(self):
+        dim = Dimension('x')
+        self.assertEqual(dim.pprint_values(np.array(['b', 'a', 'b'])), ['b', 'a', 'b'])
+
+    def test_pprint_values_datetimes(self):
+        dim = Dimension('x')
+        dates = np.array(['2018-01-01', '2018-01-02', '2018-01-01'], dtype='datetime64[ns]')
+        self.assertEqual(dim.pprint_values(dates), [dim.pprint_value(d) for d in dates])
+
+    def test_pprint_values_empty(self):
+        self.assertEqual(Dimension('x').pprint_values([]), [])
+
+
 class DimensionCloneTest(ComparisonTestCase):
 
     def test_simple_clone(self):
@@ -388,6 +388,49 @@ class DynamicMapMethods(ComparisonTestCase):
     
         
 
+class DynamicMapCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.fn = lambda i: Image(np.zeros((10, 10)))
+        self.kdims = [Dimension('i', range=(0, 10))]
+
+    def test_dynamic_cache_evicts_least_recently_used(self):
+        dmap = DynamicMap(self.fn, kdims=self.kdims, cache_size=3)
+        for i in [0, 1, 2, 0, 3]:
+            dmap[i]
+        self.assertEqual(dmap.keys(), [0, 2, 3])
+
+    def test_dynamic_cache_memory_limit(self):
+        dmap = DynamicMap(self.fn, kdims=self.kdims, cache_memory=2000)
+        for i in [0, 1, 2, 0, 3]:
+            dmap[i]
+        self.assertEqual(dmap.keys(), [0, 3])
+
+    def test_dynamic_cache_info(self):
+        dmap = DynamicMap(self.fn, kdims=self.kdims, cache_size=2)
+        for i in [0, 1, 0, 2]:
+            dmap[i]
+        self.assertEqual(dmap.cache_info(), dict(
+            hits=1, misses=3, evictions=1, size=2, maxsize=2,
+            nbytes=1600, maxbytes=None))
+
+    def test_dynamic_cache_info_reset(self):
+        dmap = DynamicMap(self.fn, kdims=self.kdims)
+        dmap[0]
+        dmap.reset()
+        self.assertEqual(dmap.cache_info(), dict(
+            hits=0, misses=0, evictions=0, size=0, maxsize=500,
+            nbytes=0, maxbytes=None))
+
+    def test_dynamic_cache_evicts_items_added_directly_first(self):
+        dmap = DynamicMap(self.fn, kdims=self.kdims, cache_size=2)
+        dmap[1]
+        dmap.data[(0,)] = self.fn(0)
+        dmap[2]
+        self.assertEqual(dmap.keys(), [1, 2])
+
+
+
 class DynamicMapOptionsTests(CustomBackendTestCase):
 
     def test_dynamic_options(self):
@@ -702,6 +745,53 @@ class DynamicCallableMemoize(ComparisonTestCase):
         self.assertEqual(dmap[()], Curve([1, 1, 1, 2, 2, 2]))
 
 
+    def test_dynamic_callable_memoize_size(self):
+        # Recently seen stream states are served from memoized values
+        def history_callback(x, history=deque(maxlen=10)):
+            history.append(x)
+            return Curve(list(history))
+
+        x = PointerX()
+        callable_obj = Callable(history_callback, memoize_size=2)
+        dmap = DynamicMap(callable_obj, kdims=[], streams=[x])
+        x.add_subscriber(lambda **kwargs: dmap[()])
+
+        for i in [1, 2, 1, 2]:
+            x.event(x=i)
+        self.assertEqual(dmap[()], Curve([1, 2]))
+        self.assertEqual(callable_obj.memoize_info(), dict(
+            hits=3, misses=2, hit_rate=0.6, size=2, maxsize=2))
+
+    def test_dynamic_callable_memoize_size_evicts_least_recently_used(self):
+        def history_callback(x, history=deque(maxlen=10)):
+            history.append(x)
+            return Curve(list(history))
+
+        x = PointerX()
+        callable_obj = Callable(history_callback, memoize_size=2)
+        dmap = DynamicMap(callable_obj, kdims=[], streams=[x])
+        x.add_subscriber(lambda **kwargs: dmap[()])
+
+        for i in [1, 2, 1, 3, 2]:
+            x.event(x=i)
+        self.assertEqual(dmap[()], Curve([1, 2, 3, 2]))
+
+    def test_dynamic_callable_memoize_ttl(self):
+        def history_callback(x, history=deque(maxlen=10)):
+            history.append(x)
+            return Curve(list(history))
+
+        x = PointerX()
+        callable_obj = Callable(history_callback, memoize_ttl=0)
+        dmap = DynamicMap(callable_obj, kdims=[], streams=[x])
+        x.add_subscriber(lambda **kwargs: dmap[()])
+
+        x.event(x=1)
+        time.sleep(0.01)
+        x.event(x=1)
+        self.assertEqual(callable_obj.memoize_info()['misses'], 2)
+
+
 class StreamSubscribersAddandClear(ComparisonTestCase):
 
     def setUp(self):
@@ -1,3 +1,4 @@
+import pickle
 from collections import OrderedDict
 
 from holoviews.core import Dimension
@@ -120,6 +121,31 @@ class NdIndexableMappingTest(ComparisonTestCase):
         ndmap = NdMapping(self.init_item_odict, kdims=[self.dim1, self.dim2])
         self.assertEqual(ndmap[:, 0.0:3.0].keys(), [(1, 2.0)])
 
+    def test_ndmapping_slice_set_and_range(self):
+        data = [((i, j), i*j) for i in range(5) for j in range(3)]
+        ndmap = NdMapping(data, kdims=['x', 'y'])
+        self.assertEqual(ndmap[{1, 3}, 1:].keys(), [(1, 1), (1, 2), (3, 1), (3, 2)])
+
+    def test_ndmapping_slice_stepped(self):
+        ndmap = NdMapping([(i, i) for i in range(10)], kdims=['x'])
+        self.assertEqual(ndmap[1:8:3].keys(), [1, 4, 7])
+
+    def test_ndmapping_slice_categorical(self):
+        dim = Dimension('cat', values=['C', 'A', 'B'])
+        ndmap = NdMapping([(k, k) for k in 'ABC'], kdims=[dim])
+        self.assertEqual(ndmap['C':'B'].keys(), ['C', 'A'])
+
+    def test_ndmapping_slice_mixed_types(self):
+        ndmap = NdMapping([(1, 'a'), ('B', 'b'), (2, 'c')], kdims=['x'])
+        self.assertEqual(ndmap[[1, 'B']].keys(), [1, 'B'])
+
+    def test_ndmapping_slice_after_insertion(self):
+        ndmap = NdMapping([(i, i) for i in range(5)], kdims=['x'])
+        self.assertEqual(ndmap[2:].keys(), [2, 3, 4])
+        ndmap[3.5] = 3.5
+        ndmap.pop(4)
+        self.assertEqual(ndmap[2:].keys(), [2, 3, 3.5])
+
     def test_idxmapping_unsorted(self):
         data = [('B', 1), ('C', 2), ('A', 3)]
         ndmap = MultiDimensionalMapping(data, sort=False)
@@ -130,6 +156,43 @@ class NdIndexableMappingTest(ComparisonTestCase):
         ndmap = MultiDimensionalMapping(data, sort=False).clone()
         self.assertEquals(ndmap.keys(), ['B', 'C', 'A'])
 
+    def test_idxmapping_setitem_sorted_insertion(self):
+        ndmap = MultiDimensionalMapping(kdims=[self.dim1])
+        for k in [5, 1, 3, 7, 2]:
+            ndmap[k] = str(k)
+        self.assertEquals(ndmap.keys(), [1, 2, 3, 5, 7])
+
+    def test_idxmapping_setitem_sorted_insertion_interleaved_reads(self):
+        ndmap = MultiDimensionalMapping(kdims=[self.dim1])
+        inserted = []
+        for k in [5, 1, 3, 7, 2, 0, 6]:
+            ndmap[k] = str(k)
+            inserted.append(k)
+            self.assertEquals(ndmap.keys(), sorted(inserted))
+        self.assertEquals(ndmap.values(), [str(k) for k in sorted(inserted)])
+
+    def test_idxmapping_setitem_sorted_insertion_pickle(self):
+        ndmap = MultiDimensionalMapping(kdims=[self.dim1])
+        for k in [5, 1, 3]:
+            ndmap[k] = str(k)
+        unpickled = pickle.loads(pickle.dumps(ndmap))
+        self.assertEquals(unpickled.keys(), [1, 3, 5])
+        unpickled[2] = '2'
+        self.assertEquals(unpickled.keys(), [1, 2, 3, 5])
+
+    def test_idxmapping_setitem_sorted_insertion_categorical(self):
+        dim = Dimension('cat', values=['C', 'A', 'B'])
+        ndmap = MultiDimensionalMapping(kdims=[dim])
+        for k in ['B', 'C', 'A']:
+            ndmap[k] = k
+        self.assertEquals(ndmap.keys(), ['C', 'A', 'B'])
+
+    def test_idxmapping_setitem_sorted_insertion_mixed_types(self):
+        ndmap = MultiDimensionalMapping(kdims=['X'])
+        for k in [2, 'B', 1, 'A']:
+            ndmap[k] = k
+        self.assertEquals(ndmap.keys(), [1, 2, 'A', 'B'])
+
     def test_idxmapping_groupby_unsorted(self):
         data = [(('B', 2), 1), (('C', 2), 2), (('A', 1), 3)]
         grouped = NdMapping(data, sort=False, kdims=['X', 'Y']).groupby('Y')
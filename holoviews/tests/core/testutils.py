@@ -19,7 +19,10 @@ from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
     deephash, merge_dimensions, get_path, make_path_unique, compute_density,
     date_range, dt_to_int, compute_edges, isfinite, cross_index, closest_match,
-    dimension_range, tree_attribute
+    dimension_range, tree_attribute, factorize, group_indices, reduce_groups,
+    isin, is_sorted,
+    content_digest, _digest_cache, RingBuffer, SlidingRange, histogram_bins,
+    histogram_counts, SlidingHistogram
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PointerXY
@@ -86,6 +89,63 @@ class TestDeepHash(ComparisonTestCase):
         self.assertNotEqual(deephash(pd.DataFrame({'a':[1,2,3],'b':[4,5,6]})),
                             deephash(pd.DataFrame({'a':[1,2,3],'b':[4,5,8]})))
 
+    @pd_skip
+    def test_deephash_dataframe_index_inequality(self):
+        self.assertNotEqual(deephash(pd.DataFrame({'a':[1,2,3]}, index=[0, 1, 2])),
+                            deephash(pd.DataFrame({'a':[1,2,3]}, index=[0, 1, 3])))
+
+    @pd_skip
+    def test_deephash_dataframe_column_name_inequality(self):
+        self.assertNotEqual(deephash(pd.DataFrame({'a':[1,2,3]})),
+                            deephash(pd.DataFrame({'b':[1,2,3]})))
+
+    @pd_skip
+    def test_deephash_dataframe_string_equality(self):
+        self.assertEqual(deephash(pd.DataFrame({'a':['A', 'B']})),
+                         deephash(pd.DataFrame({'a':['A', 'B']})))
+
+    def test_deephash_numpy_dtype_inequality(self):
+        self.assertNotEqual(deephash(np.array([1, 2, 3], dtype='int32')),
+                            deephash(np.array([1, 2, 3], dtype='int64')))
+
+    def test_deephash_numpy_shape_inequality(self):
+        arr = np.arange(6)
+        self.assertNotEqual(deephash(arr.reshape(2, 3)), deephash(arr.reshape(3, 2)))
+
+    def test_deephash_numpy_readonly_cached(self):
+        arr = np.arange(10)
+        arr.flags.writeable = False
+        self.assertEqual(content_digest(arr), content_digest(arr))
+        self.assertIn(id(arr), _digest_cache)
+
+    def test_deephash_numpy_readonly_view_of_writeable_not_cached(self):
+        arr = np.arange(10)
+        view = arr[:]
+        view.flags.writeable = False
+        digest = content_digest(view)
+        self.assertNotIn(id(view), _digest_cache)
+        arr[0] = 10
+        self.assertNotEqual(content_digest(view), digest)
+
+    def test_deephash_numpy_readonly_view_of_readonly_cached(self):
+        arr = np.arange(10)
+        arr.flags.writeable = False
+        view = arr[2:]
+        self.assertEqual(content_digest(view), content_digest(view))
+        self.assertIn(id(view), _digest_cache)
+
+    def test_deephash_xarray_equality(self):
+        try:
+            import xarray as xr
+        except:
+            raise SkipTest('Test requires xarray')
+        arr1 = xr.DataArray(np.arange(6).reshape(2, 3), coords={'y': [0, 1], 'x': [0, 1, 2]},
+                            dims=['y', 'x'])
+        arr2 = xr.DataArray(np.arange(6).reshape(2, 3), coords={'y': [0, 1], 'x': [0, 1, 2]},
+                            dims=['y', 'x'])
+        self.assertEqual(deephash(arr1), deephash(arr2))
+        self.assertNotEqual(deephash(arr1), deephash(arr2.assign_coords(x=[0, 1, 3])))
+
     @pd_skip
     def test_deephash_series_equality(self):
         self.assertEqual(deephash(pd.Series([1,2,3])),
@@ -826,6 +886,248 @@ class TestCrossIndex(ComparisonTestCase):
         self.assertEqual(cross_index(values, 500001), ('D', 423, 'c', '1'))
 
 
+class TestGroupIndices(ComparisonTestCase):
+
+    def test_factorize_first_appearance_order(self):
+        codes, ncodes = factorize(np.array([3, 1, 3, 2, 1]))
+        self.assertEqual(codes, np.array([0, 1, 0, 2, 1]))
+        self.assertEqual(ncodes, 3)
+
+    def test_factorize_strings(self):
+        codes, ncodes = factorize(np.array(['B', 'A', 'B']))
+        self.assertEqual(codes, np.array([0, 1, 0]))
+        self.assertEqual(ncodes, 2)
+
+    def test_factorize_nans_single_code(self):
+        codes, ncodes = factorize(np.array([np.NaN, 1, np.NaN, 0]))
+        self.assertEqual(codes, np.array([0, 1, 0, 2]))
+        self.assertEqual(ncodes, 3)
+
+    def test_group_indices_single_array(self):
+        order, offsets = group_indices([np.array([2, 0, 2, 1, 0])])
+        self.assertEqual(order, np.array([0, 2, 1, 4, 3]))
+        self.assertEqual(offsets, np.array([0, 2, 4, 5]))
+
+    def test_group_indices_multiple_arrays(self):
+        arrays = [np.array(['A', 'A', 'B', 'A']), np.array([0, 1, 0, 0])]
+        order, offsets = group_indices(arrays)
+        self.assertEqual(order, np.array([0, 3, 1, 2]))
+        self.assertEqual(offsets, np.array([0, 2, 3, 4]))
+
+    def test_group_indices_empty(self):
+        order, offsets = group_indices([np.array([])])
+        self.assertEqual(order, np.array([], dtype='int64'))
+        self.assertEqual(offsets, np.array([0]))
+
+
+class TestIsin(ComparisonTestCase):
+
+    def test_isin_numeric(self):
+        self.assertEqual(isin(np.array([3, 1, 2, 1]), [1, 2.]),
+                         np.array([False, True, True, True]))
+
+    def test_isin_strings(self):
+        self.assertEqual(isin(np.array(['A', 'B', 'C']), {'C', 'A'}),
+                         np.array([True, False, True]))
+
+    def test_isin_object_strings(self):
+        self.assertEqual(isin(np.array(['A', 'B', 1], dtype=object), ['B', 'C']),
+                         np.array([False, True, False]))
+
+    def test_isin_nan_never_matches(self):
+        self.assertEqual(isin(np.array([np.NaN, 1]), [np.NaN, 1]),
+                         np.array([False, True]))
+
+    def test_isin_datetimes(self):
+        dates = np.array(['2018-01-01', '2018-01-02'], dtype='datetime64[ns]')
+        self.assertEqual(isin(dates, [np.datetime64('2018-01-02')]),
+                         np.array([False, True]))
+
+    def test_isin_empty_values(self):
+        self.assertEqual(isin(np.array([1, 2]), []), np.array([False, False]))
+
+    def test_is_sorted(self):
+        self.assertTrue(is_sorted(np.array([0, 1, 1, 3])))
+        self.assertFalse(is_sorted(np.array([0, 2, 1])))
+        self.assertFalse(is_sorted(np.array([0, np.NaN, 1])))
+
+
+class TestReduceGroups(ComparisonTestCase):
+
+    def setUp(self):
+        self.values = np.array([1, 3, 2, 4, 6, 5.])
+        self.offsets = np.array([0, 2, 3, 6])
+
+    def test_reduce_groups_sum(self):
+        self.assertEqual(reduce_groups(np.sum, self.values, self.offsets),
+                         np.array([4, 2, 15.]))
+
+    def test_reduce_groups_mean(self):
+        self.assertEqual(reduce_groups(np.mean, self.values, self.offsets),
+                         np.array([2, 2, 5.]))
+
+    def test_reduce_groups_count(self):
+        self.assertEqual(reduce_groups(len, self.values, self.offsets),
+                         np.array([2, 1, 3]))
+
+    def test_reduce_groups_min_max(self):
+        self.assertEqual(reduce_groups(np.min, self.values, self.offsets),
+                         np.array([1, 2, 4.]))
+        self.assertEqual(reduce_groups(np.max, self.values, self.offsets),
+                         np.array([3, 2, 6.]))
+
+    def test_reduce_groups_var_ddof(self):
+        expected = np.array([np.var(self.values[:2], ddof=1), np.NaN,
+                             np.var(self.values[3:], ddof=1)])
+        self.assertEqual(reduce_groups(np.var, self.values, self.offsets, ddof=1),
+                         expected)
+
+    def test_reduce_groups_std_2d(self):
+        values = np.column_stack([self.values, self.values*2])
+        expected = np.array([[np.std(values[s:e, i]) for i in range(2)]
+                             for s, e in zip(self.offsets[:-1], self.offsets[1:])])
+        self.assertEqual(reduce_groups(np.std, values, self.offsets), expected)
+
+    def test_reduce_groups_unsupported_function(self):
+        self.assertEqual(reduce_groups(np.median, self.values, self.offsets), None)
+
+    def test_reduce_groups_unsupported_dtype(self):
+        values = np.array(['A', 'B', 'C'])
+        self.assertEqual(reduce_groups(np.min, values, np.array([0, 3])), None)
+
+
+class TestRingBuffer(ComparisonTestCase):
+
+    def test_ring_buffer_append(self):
+        ring = RingBuffer(3)
+        ring.append([np.array([0, 1]), np.array(['A', 'B'])])
+        views = ring.views()
+        self.assertEqual(views[0], np.array([0, 1]))
+        self.assertEqual(views[1], np.array(['A', 'B']))
+
+    def test_ring_buffer_wraparound(self):
+        ring = RingBuffer(3)
+        for i in range(10):
+            ring.append([np.array([i])])
+        self.assertEqual(ring.views()[0], np.array([7, 8, 9]))
+        self.assertEqual(len(ring), 3)
+
+    def test_ring_buffer_chunk_larger_than_length(self):
+        ring = RingBuffer(2)
+        ring.append([np.arange(5)])
+        self.assertEqual(ring.views()[0], np.array([3, 4]))
+
+    def test_ring_buffer_upcasts_dtype(self):
+        ring = RingBuffer(3)
+        ring.append([np.array([0, 1])])
+        ring.append([np.array([1.5])])
+        self.assertEqual(ring.views()[0], np.array([0, 1, 1.5]))
+
+    def test_ring_buffer_2d_columns(self):
+        ring = RingBuffer(2)
+        ring.append([np.array([[0, 1], [1, 2], [2, 3]])])
+        self.assertEqual(ring.views()[0], np.array([[1, 2], [2, 3]]))
+
+    def test_ring_buffer_clear(self):
+        ring = RingBuffer(2)
+        ring.append([np.arange(2)])
+        ring.clear()
+        self.assertEqual(ring.views()[0], np.array([], dtype='int64'))
+
+
+class TestSlidingRange(ComparisonTestCase):
+
+    def test_sliding_range_single_chunk(self):
+        tracker = SlidingRange(10)
+        tracker.update(np.array([3, 1, 4, 1, 5]))
+        self.assertEqual(tracker.range, (1, 5))
+
+    def test_sliding_range_wraparound(self):
+        tracker = SlidingRange(3)
+        values = np.array([5, 1, 4, 2, 8, 3, 0, 7])
+        for i, v in enumerate(values):
+            tracker.update(np.array([v]))
+            window = values[max(0, i-2):i+1]
+            self.assertEqual(tracker.range, (window.min(), window.max()))
+
+    def test_sliding_range_chunk_larger_than_length(self):
+        tracker = SlidingRange(2)
+        tracker.update(np.array([0, 9]))
+        tracker.update(np.array([5, 3, 4]))
+        self.assertEqual(tracker.range, (3, 4))
+
+    def test_sliding_range_ignores_nan(self):
+        tracker = SlidingRange(3)
+        tracker.update(np.array([np.NaN, 2., 1.]))
+        tracker.update(np.array([np.NaN]))
+        self.assertEqual(tracker.range, (1., 2.))
+
+    def test_sliding_range_all_nan(self):
+        tracker = SlidingRange(3)
+        tracker.update(np.array([np.NaN]))
+        lower, upper = tracker.range
+        self.assertTrue(np.isnan(lower) and np.isnan(upper))
+
+    def test_sliding_range_datetime(self):
+        dates = np.array(['2018-01-02', 'NaT', '2018-01-01', '2018-01-03'], dtype='datetime64[ns]')
+        tracker = SlidingRange(3)
+        tracker.update(dates)
+        self.assertEqual(tracker.range, (dates[2], dates[3]))
+
+    def test_sliding_range_clear(self):
+        tracker = SlidingRange(3)
+        tracker.update(np.array([0, 1]))
+        tracker.clear()
+        tracker.update(np.array([2]))
+        self.assertEqual(tracker.range, (2, 2))
+
+
+class TestHistogramBins(ComparisonTestCase):
+
+    def test_histogram_bins_uniform(self):
+        values = np.array([0, 0.5, 1, 2.5, 3, 3.5, np.NaN])
+        edges = np.linspace(0, 3, 4)
+        self.assertEqual(histogram_bins(values, edges, uniform=True),
+                         np.array([0, 0, 1, 2, 2, -1, -1]))
+
+    def test_histogram_bins_nonuniform(self):
+        values = np.array([-1, 0, 0.5, 1, 5, 10])
+        self.assertEqual(histogram_bins(values, np.array([0, 1, 10])),
+                         np.array([-1, 0, 0, 1, 1, 1]))
+
+    def test_histogram_counts_matches_numpy(self):
+        np.random.seed(1)
+        values, weights = np.random.randn(1000), np.random.rand(1000)
+        edges = np.linspace(-2, 2, 11)
+        counts, weighted = histogram_counts(values, edges, weights, chunksize=128)
+        self.assertEqual(counts, np.histogram(values, edges)[0].astype('float64'))
+        self.assertEqual(weighted, np.histogram(values, edges, weights=weights)[0])
+
+
+class TestSlidingHistogram(ComparisonTestCase):
+
+    def test_sliding_histogram_wraparound(self):
+        edges = np.array([0, 2, 4, 6])
+        tracker = SlidingHistogram(edges, 3)
+        values = np.array([5, 1, 4, 2, 0, 3, 6, 1])
+        for i in range(0, len(values), 2):
+            tracker.update(values[i:i+2])
+            window = values[max(0, i-1):i+2]
+            self.assertEqual(tracker.counts, np.histogram(window, edges)[0].astype('float64'))
+
+    def test_sliding_histogram_chunk_larger_than_length(self):
+        tracker = SlidingHistogram(np.array([0, 1, 2]), 2)
+        tracker.update(np.array([0.5, 1.5, 1.5, 0.5]))
+        self.assertEqual(tracker.counts, np.array([1., 1.]))
+
+    def test_sliding_histogram_weighted_nonzero(self):
+        tracker = SlidingHistogram(np.array([-1, 0, 1]), 3, weighted=True, nonzero=True)
+        tracker.update(np.array([0.5, -0.5, 0.5]), np.array([1., 2., 3.]))
+        tracker.update(np.array([0.5]), np.array([4.]))
+        self.assertEqual(tracker.counts, np.array([0., 2.]))
+        self.assertEqual(tracker.weighted_counts, np.array([0., 7.]))
+
+
 class TestClosestMatch(ComparisonTestCase):
 
     def test_complete_match_overlay(self):
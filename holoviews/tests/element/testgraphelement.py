@@ -5,12 +5,13 @@ from unittest import SkipTest, skipIf
 
 import numpy as np
 
-from holoviews.core.data import Dataset
+from holoviews.core.data import Dataset, RaggedArray
 from holoviews.core import util
 from holoviews.element.chart import Points
+from holoviews.element.sankey import Sankey
 from holoviews.element.graphs import (
     Graph, Nodes, TriMesh, Chord, circular_layout, connect_edges,
-    connect_edges_pd)
+    connect_edges_pd, connect_edges_buffer)
 from holoviews.element.comparison import ComparisonTestCase
 
 pd_skip = skipIf(util.pd is None, 'Pandas not available')
@@ -77,6 +78,31 @@ class GraphTests(ComparisonTestCase):
             paths.append(np.array([start[:2], end[:2]]))
         self.assertEqual(segments, paths)
 
+    def test_graph_edge_segments_buffer(self):
+        buffer = connect_edges_buffer(self.graph)
+        nodes = np.column_stack(self.nodes)
+        expected = []
+        for start, end in zip(nodes[self.source], nodes[self.target]):
+            expected += [start[:2], end[:2], [np.nan, np.nan]]
+        self.assertEqual(buffer, np.array(expected[:-1]))
+
+    def test_graph_edgepaths_single_buffer(self):
+        paths = self.graph.edgepaths
+        self.assertEqual(len(paths.data), 1)
+        self.assertEqual(len(self.graph.split_edgepaths.split()), len(self.graph))
+
+    def test_graph_split_edgepaths(self):
+        paths = self.graph.split_edgepaths.split(datatype='array')
+        nodes = np.column_stack(self.nodes)
+        expected = [np.array([start[:2], end[:2]]) for start, end
+                    in zip(nodes[self.source], nodes[self.target])]
+        self.assertEqual(paths, expected)
+
+    def test_connect_edges_missing_node_raises(self):
+        graph = Graph(((self.source, self.target+100), self.nodes))
+        with self.assertRaisesRegexp(ValueError, 'Could not find node positions'):
+            connect_edges(graph)
+
     def test_constructor_with_nodes_and_paths(self):
         paths = Graph(((self.source, self.target), self.nodes)).edgepaths
         graph = Graph(((self.source, self.target), self.nodes, paths.data))
@@ -121,6 +147,32 @@ class GraphTests(ComparisonTestCase):
         selection = Graph(([(0, 0, 0), (0, 1, 1)], list(zip(*self.nodes))[:2]), vdims=['info'])
         self.assertEqual(graph.select(info=(0, 2)), selection)
 
+    def test_select_by_string_node_in_edges_selection_mode(self):
+        labels = np.array(['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H'])
+        nodes = Nodes((self.nodes[0], self.nodes[1], labels))
+        graph = Graph(((labels[self.source], labels[self.target]), nodes))
+        selection = graph.select(index=['B', 'C'])
+        self.assertEqual(selection.array([0, 1]), np.array([['B', 'A'], ['C', 'A']]))
+
+    def test_graph_node_indices(self):
+        labels = np.array(['C', 'A', 'B'])
+        graph = Graph(((['A', 'B', 'D'], ['C', 'C', 'A']), Nodes(([0, 1, 2], [0, 1, 2], labels))))
+        node_codes, src_idx, tgt_idx = graph._node_indices()
+        self.assertEqual(node_codes, np.array([0, 1, 2]))
+        self.assertEqual(src_idx, np.array([1, 2, -1]))
+        self.assertEqual(tgt_idx, np.array([0, 0, 1]))
+
+    def test_graph_node_indices_duplicate_nodes(self):
+        nodes = Nodes(([0, 1, 2], [0, 1, 2], ['A', 'B', 'A']))
+        graph = Graph(((['A', 'B'], ['B', 'A']), nodes))
+        node_codes, src_idx, tgt_idx = graph._node_indices()
+        self.assertEqual(node_codes, np.array([0, 1, 0]))
+        self.assertEqual(src_idx, np.array([0, 1]))
+        self.assertEqual(tgt_idx, np.array([1, 0]))
+
+    def test_graph_node_indices_cached(self):
+        self.assertIs(self.graph._node_indices()[1], self.graph._node_indices()[1])
+
     def test_graph_node_range(self):
         graph = Graph(((self.target, self.source),))
         self.assertEqual(graph.range('x'), (-1, 1))
@@ -236,6 +288,51 @@ class ChordTests(ComparisonTestCase):
         )
         self.assertEqual(chord.nodes, Nodes(nodes))
 
+    def test_chord_edgepaths_nan_separated(self):
+        chord = Chord(self.simplices, vdims=['z'])
+        self.assertIsInstance(chord.edgepaths.data, RaggedArray)
+        paths = chord.edgepaths.split(datatype='array')
+        self.assertEqual([len(p) for p in paths], [101, 152, 203])
+        self.assertEqual(np.isnan(paths[2][:, 0]).nonzero()[0], np.array([50, 101, 152]))
+
+    def test_chord_duplicate_edges(self):
+        chord = Chord([(0, 1, 2), (0, 1, 3), (1, 2, 1)], vdims=['z'])
+        paths = chord.edgepaths.split(datatype='array')
+        self.assertEqual([len(p) for p in paths], [101, 152, 50])
+
+
+class SankeyTests(ComparisonTestCase):
+
+    def setUp(self):
+        self.sankey = Sankey([
+            ('A', 'X', 5), ('A', 'Y', 7), ('A', 'Z', 6),
+            ('B', 'X', 2), ('B', 'Y', 9), ('B', 'Z', 4)]
+        )
+
+    def test_sankey_node_layout(self):
+        nodes = self.sankey._sankey['nodes']
+        self.assertEqual([n['index'] for n in nodes], ['A', 'B', 'X', 'Y', 'Z'])
+        self.assertEqual(np.array([n['value'] for n in nodes]), np.array([18, 15, 7, 16, 10]))
+        self.assertEqual(np.array([n['x0'] for n in nodes]), np.array([0, 0, 985., 985., 985.]))
+        self.assertEqual(np.array([n['y0'] for n in nodes]),
+                         np.array([10., 281.81818182, 0., 111.81818182, 354.54545455]))
+        self.assertEqual(np.array([n['y1'] for n in nodes]),
+                         np.array([271.81818182, 500., 101.81818182, 344.54545455, 500.]))
+
+    def test_sankey_link_breadths(self):
+        links = self.sankey._sankey['links']
+        for link in links:
+            self.assertEqual(link['width'], link['value']*(500-10*2)/33.)
+        self.assertEqual(np.array([l['y0'] for l in links[:3]]),
+                         np.array([10., 82.72727273, 184.54545455]))
+
+    def test_sankey_edgepaths(self):
+        edgepaths = self.sankey.edgepaths
+        self.assertIsInstance(edgepaths.data, RaggedArray)
+        paths = edgepaths.split(datatype='array')
+        self.assertEqual(len(paths), 6)
+        self.assertEqual(paths[0][0], np.array([15, 10+5*480/33.]))
+        self.assertEqual(paths[0][2], np.array([15, 10]))
 
 
 class TriMeshTests(ComparisonTestCase):
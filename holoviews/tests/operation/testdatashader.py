@@ -51,6 +51,24 @@ class DatashaderAggregateTests(ComparisonTestCase):
                         x_sampling=0.5, y_sampling=0.5)
         self.assertEqual(img, expected)
 
+    def test_aggregate_points_precompute_zoomed(self):
+        points = Points(np.random.rand(1000, 2))
+        op = aggregate.instance(precompute=True, dynamic=False, width=4, height=4)
+        op(points, x_range=(0, 1), y_range=(0, 1))
+        img = op(points, x_range=(0.2, 0.45), y_range=(0.5, 0.6))
+        expected = aggregate(points, dynamic=False, width=4, height=4,
+                             x_range=(0.2, 0.45), y_range=(0.5, 0.6))
+        self.assertEqual(img, expected)
+        self.assertIsNot(op._precomputed[points._plot_id][-1], None)
+
+    def test_aggregate_points_precompute_outside_extent(self):
+        points = Points([(0.2, 0.3), (0.4, 0.7), (0, 0.99)])
+        op = aggregate.instance(precompute=True, dynamic=False, width=2, height=2)
+        img = op(points, x_range=(2, 3), y_range=(2, 3))
+        expected = Image(([2.25, 2.75], [2.25, 2.75], [[0, 0], [0, 0]]),
+                         vdims=['Count'])
+        self.assertEqual(img, expected)
+
     def test_aggregate_points_categorical(self):
         points = Points([(0.2, 0.3, 'A'), (0.4, 0.7, 'B'), (0, 0.99, 'C')], vdims='z')
         img = aggregate(points, dynamic=False,  x_range=(0, 1), y_range=(0, 1),
@@ -512,5 +530,5 @@ class GraphBundlingTests(ComparisonTestCase):
         self.graph = Graph(((self.source, self.target),))
 
     def test_directly_connect_paths(self):
-        direct = directly_connect_edges(self.graph)._split_edgepaths
-        self.assertEqual(direct, self.graph.edgepaths)
+        direct = directly_connect_edges(self.graph).split_edgepaths
+        self.assertEqual(direct, self.graph.split_edgepaths)
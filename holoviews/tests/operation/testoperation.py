@@ -15,9 +15,10 @@ except:
 
 from holoviews import (HoloMap, NdOverlay, NdLayout, GridSpace, Image,
                        Contours, Polygons, Points, Histogram, Curve, Area,
-                       QuadMesh, Dataset)
+                       QuadMesh, Dataset, DynamicMap)
 from holoviews.core.data.grid import GridInterface
 from holoviews.core.util import pd
+from holoviews.streams import Buffer
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation.element import (operation, transform, threshold,
                                          gradient, contours, histogram,
@@ -147,6 +148,52 @@ class OperationTests(ComparisonTestCase):
                          vdims=('x_frequency', 'Frequency'))
         self.assertEqual(op_hist, hist)
 
+    def test_points_histogram_weighted_nans(self):
+        points = Points([(0, 1), (np.NaN, 2), (1, 3), (2, 4)], vdims=['y'])
+        op_hist = histogram(points, dimension='x', weight_dimension='y',
+                            num_bins=2, normed=False)
+        hist = Histogram(([0, 1, 2], [1, 7]), vdims=['y'])
+        self.assertEqual(op_hist, hist)
+
+    def test_buffer_histogram_incremental(self):
+        buff = Buffer(np.zeros((0, 2)), length=5)
+        dmap = DynamicMap(lambda data: Points(data), streams=[buff])
+        op = histogram.instance(dimension='x', bin_range=(0, 4), num_bins=4, normed=False)
+        hist = op(dmap)
+        values = []
+        for chunk in ([0.5, 1.5], [3.5], [2.5, 2.5, 0.5], [1.5]):
+            values += chunk
+            buff.send(np.column_stack([chunk, chunk]))
+            counts = np.histogram(values[-5:], np.linspace(0, 4, 5))[0]
+            self.assertEqual(hist[()].dimension_values(1), counts)
+        self.assertEqual(list(op._histogram_trackers), [buff])
+        self.assertEqual(len(op._histogram_trackers[buff]), 1)
+
+    @pd_skip
+    def test_buffer_histogram_inplace_modification(self):
+        buff = Buffer(pd.DataFrame({'y': [1.]}), length=4, index=False)
+        op = histogram.instance(dimension='y', bin_range=(0, 20), num_bins=4, normed=False)
+        buff.send(pd.DataFrame({'y': [6.]}))
+        buff.send(pd.DataFrame({'y': [11., 16.]}))
+        data = buff.data
+        data['y'] = 19.
+        hist = op(Dataset(data, vdims=['y']))
+        self.assertEqual(hist.dimension_values(1), np.array([0, 0, 0, 4]))
+
+    @pd_skip
+    def test_buffer_histogram_modified_in_callback(self):
+        buff = Buffer(pd.DataFrame({'y': [1.]}), length=4, index=False)
+        def callback(data):
+            data['y'] = 19.
+            return Dataset(data, vdims=['y'])
+        dmap = DynamicMap(callback, streams=[buff])
+        op = histogram.instance(dimension='y', bin_range=(0, 20), num_bins=4, normed=False)
+        hist = op(dmap)
+        buff.send(pd.DataFrame({'y': [6.]}))
+        hist[()]
+        buff.send(pd.DataFrame({'y': [11., 16.]}))
+        self.assertEqual(hist[()].dimension_values(1), np.array([0, 0, 0, 4]))
+
     @da_skip
     def test_dataset_histogram_dask(self):
         import dask.array as da 
@@ -76,3 +76,24 @@ class KDEOperationTests(ComparisonTestCase):
                             y_range=(0, 4), contours=False)
         img = Image(np.zeros((2, 2)), bounds=(-2, -2, 6, 6), vdims=['Density'])
         self.assertEqual(kde, img)
+
+    def test_univariate_kde_fft(self):
+        kde = univariate_kde(self.dist, n_samples=5, bin_range=(0, 4), method='fft')
+        xs = np.arange(5)
+        ys = [0.17594505, 0.23548218, 0.23548218, 0.17594505, 0.0740306]
+        area = Area((xs, ys), 'Value', ('Value_density', 'Density'))
+        self.assertEqual(kde, area)
+
+    def test_univariate_kde_fft_matches_exact(self):
+        np.random.seed(1)
+        dist = Distribution(np.random.randn(1000))
+        exact = univariate_kde(dist).dimension_values(1)
+        fft = univariate_kde(dist, method='fft').dimension_values(1)
+        self.assertLess(np.abs(exact-fft).max(), 1e-3)
+
+    def test_bivariate_kde_fft_matches_exact(self):
+        np.random.seed(1)
+        bivariate = Bivariate(np.random.randn(1000, 2))
+        exact = bivariate_kde(bivariate, contours=False).dimension_values(2)
+        fft = bivariate_kde(bivariate, contours=False, method='fft').dimension_values(2)
+        self.assertLess(np.abs(exact-fft).max(), 1e-3)
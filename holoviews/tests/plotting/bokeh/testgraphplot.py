@@ -51,7 +51,7 @@ class TestBokehGraphPlot(TestBokehPlot):
         self.assertEqual(node_source.data['index'], self.source)
         self.assertEqual(edge_source.data['start'], self.source)
         self.assertEqual(edge_source.data['end'], self.target)
-        edges = graph.edgepaths.split()
+        edges = graph.split_edgepaths.split()
         self.assertEqual(edge_source.data['xs'], [path.dimension_values(0) for path in edges])
         self.assertEqual(edge_source.data['ys'], [path.dimension_values(1) for path in edges])
         layout = {str(int(z)): (x, y) for x, y, z in self.graph.nodes.array()}
@@ -94,6 +94,19 @@ class TestPathPlot(TestBokehPlot):
         self.assertEqual(source.data['ys'], [np.array([4, 3]), np.array([3, 2]), np.array([2, 1])])
         self.assertEqual(source.data['color'], np.array([1, 1, 1]))
 
+    def test_multi_path_hover_datetime_vdim(self):
+        dates = np.array(['2019-01-01', '2019-01-02', '2019-01-03',
+                          '2019-01-04', '2019-01-05'], dtype='datetime64[ns]')
+        path = Path([{'x': [1, 2], 'y': [4, 3], 't': dates[:2]},
+                     {'x': [3, 4, 5], 'y': [2, 1, 0], 't': dates[2:]}],
+                    vdims='t').options(tools=['hover'])
+        plot = bokeh_renderer.get_plot(path)
+        source = plot.handles['source']
+        starts = dates[[0, 2, 3]]
+        self.assertEqual(source.data['xs'], [np.array([1, 2]), np.array([3, 4]), np.array([4, 5])])
+        self.assertEqual(source.data['t'], starts)
+        self.assertEqual(source.data['t_dt_strings'], path.get_dimension('t').pprint_values(starts))
+
     def test_path_colored_by_levels_single_value(self):
         xs = [1, 2, 3, 4]
         ys = xs[::-1]
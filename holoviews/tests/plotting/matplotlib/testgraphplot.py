@@ -39,7 +39,7 @@ class TestMplGraphPlot(TestMPLPlot):
         edges = plot.handles['edges']
         self.assertEqual(np.asarray(nodes.get_offsets()), self.graph.nodes.array([0, 1]))
         self.assertEqual([p.vertices for p in edges.get_paths()],
-                         [p.array() for p in self.graph.edgepaths.split()])
+                         [p.array() for p in self.graph.split_edgepaths.split()])
 
     def test_plot_graph_categorical_colored_nodes(self):
         g = self.graph2.opts(plot=dict(color_index='Label'), style=dict(cmap='Set1'))
@@ -308,7 +308,7 @@ class TestMplTriMeshPlot(TestMPLPlot):
         self.assertIsInstance(edges, LineCollection)
         self.assertEqual(np.asarray(nodes.get_offsets()), self.trimesh.nodes.array([0, 1]))
         self.assertEqual([p.vertices for p in edges.get_paths()],
-                         [p.array() for p in self.trimesh._split_edgepaths.split()])
+                         [p.array() for p in self.trimesh.split_edgepaths.split()])
 
     def test_plot_simple_trimesh_filled(self):
         plot = mpl_renderer.get_plot(self.trimesh.opts(plot=dict(filled=True)))
@@ -316,7 +316,7 @@ class TestMplTriMeshPlot(TestMPLPlot):
         edges = plot.handles['edges']
         self.assertIsInstance(edges, PolyCollection)
         self.assertEqual(np.asarray(nodes.get_offsets()), self.trimesh.nodes.array([0, 1]))
-        paths = self.trimesh._split_edgepaths.split(datatype='array')
+        paths = self.trimesh.split_edgepaths.split(datatype='array')
         self.assertEqual([p.vertices[:4] for p in edges.get_paths()],
                          paths)
 
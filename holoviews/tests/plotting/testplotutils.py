@@ -4,18 +4,20 @@ from unittest import SkipTest
 
 import numpy as np
 
-from holoviews import NdOverlay, Overlay, Dimension
+from holoviews import Dataset, NdOverlay, Overlay, Dimension
 from holoviews.core.spaces import DynamicMap, HoloMap
 from holoviews.core.options import Store, Cycle
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.element import (Image, Scatter, Curve, Points,
                                Area, VectorField, HLine, Path)
 from holoviews.operation import operation
+from holoviews.plotting.plot import DimensionedPlot
 from holoviews.plotting.util import (
     compute_overlayable_zorders, get_min_distance, process_cmap,
     initialize_dynamic, split_dmap_overlay, _get_min_distance_numpy,
     bokeh_palette_to_palette, mplcmap_to_palette, color_intervals,
-    get_range, get_axis_padding)
+    get_range, get_axis_padding, path_columns, segment_starts,
+    split_path_columns)
 from holoviews.streams import PointerX
 
 try:
@@ -612,6 +614,51 @@ class TestPlotUtils(ComparisonTestCase):
         dist = _get_min_distance_numpy(Points((X.flatten(), Y.flatten())))
         self.assertEqual(dist, 1.0)
 
+    def test_path_columns_multi(self):
+        path = Path([{'x': [0, 1, 2], 'y': [3, 4, 5]}, {'x': [6], 'y': [7]}])
+        (xs, ys), offsets = path_columns(path, ['x', 'y'])
+        self.assertEqual(xs, np.array([0, 1, 2, 6]))
+        self.assertEqual(ys, np.array([3, 4, 5, 7]))
+        self.assertEqual(offsets, np.array([0, 3, 4]))
+
+    def test_path_columns_multi_datetime(self):
+        dates = np.array(['2019-01-01', '2019-01-02', '2019-01-03'], dtype='datetime64[ns]')
+        path = Path([{'x': [0, 1], 'y': [3, 4], 't': dates[:2]},
+                     {'x': [6], 'y': [7], 't': dates[2:]}], vdims='t')
+        (xs, ts), offsets = path_columns(path, ['x', 't'])
+        self.assertEqual(xs, np.array([0, 1, 6]))
+        self.assertEqual(ts, dates)
+        self.assertEqual(offsets, np.array([0, 2, 3]))
+
+    def test_path_columns_multi_empty_path(self):
+        path = Path([{'x': [0, 1], 'y': [3, 4]}, {'x': [], 'y': []},
+                     {'x': [6], 'y': [7]}])
+        (xs,), offsets = path_columns(path, ['x'])
+        self.assertEqual(xs, np.array([0, 1, 6]))
+        self.assertEqual(offsets, np.array([0, 2, 2, 3]))
+
+    def test_path_columns_ragged_datetime(self):
+        dates = np.array(['2019-01-01', '2019-01-02', '2019-01-03'], dtype='datetime64[ns]')
+        path = Path([{'x': [0, 1], 'y': [3, 4], 't': dates[:2]},
+                     {'x': [6], 'y': [7], 't': dates[2:]}], vdims='t', datatype=['ragged'])
+        (ts,), offsets = path_columns(path, ['t'])
+        self.assertEqual(ts, dates)
+        self.assertEqual(offsets, np.array([0, 2, 3]))
+
+    def test_path_columns_single(self):
+        path = Path({'x': [0, 1, 2], 'y': [3, 4, 5]})
+        (xs,), offsets = path_columns(path, ['x'])
+        self.assertEqual(xs, np.array([0, 1, 2]))
+        self.assertEqual(offsets, np.array([0, 3]))
+
+    def test_split_path_columns(self):
+        split = split_path_columns(np.arange(5), np.array([0, 3, 3, 5]))
+        self.assertEqual(split, [np.array([0, 1, 2]), np.array([]), np.array([3, 4])])
+
+    def test_segment_starts(self):
+        starts = segment_starts(np.array([0, 3, 4, 4, 7]))
+        self.assertEqual(starts, np.array([0, 1, 4, 5]))
+
 
 class TestRangeUtilities(ComparisonTestCase):
 
@@ -644,6 +691,15 @@ class TestRangeUtilities(ComparisonTestCase):
         self.assertEqual(srange, (-1, 4))
         self.assertEqual(hrange, (-1, 3))
 
+    def test_cache_element_ranges_requests(self):
+        ds = Dataset({'x': np.array([1, 2, 3], dtype=object),
+                      'y': np.array(['A', 'B', 'A'])}, 'x', 'y')
+        requests = []
+        ds._cache_ranges = lambda dims, factors: requests.append(
+            ([d.name for d in dims], [d.name for d in factors]))
+        DimensionedPlot._cache_element_ranges(ds)
+        self.assertEqual(requests, [(['x'], ['y'])])
+
 
 
 class TestBokehUtils(ComparisonTestCase):
@@ -1,10 +1,12 @@
 """
 Unit test of the streams system
 """
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from unittest import SkipTest
 
+import numpy as np
 import param
+from holoviews.core.data import Dataset
 from holoviews.core.spaces import DynamicMap
 from holoviews.core.util import LooseVersion, pd
 from holoviews.element import Points
@@ -840,6 +842,142 @@ class TestBufferDictionaryStream(ComparisonTestCase):
             buff.send({'x': np.array([2]), 'y': np.array([3, 4])})
 
 
+class TestRingBufferStream(ComparisonTestCase):
+
+    def test_ringbuffer_array_send(self):
+        buff = Buffer(np.array([[0, 1]]), ringbuffer=True)
+        buff.send(np.array([[1, 2]]))
+        self.assertEqual(buff.data, np.array([[0, 1], [1, 2]]))
+
+    def test_ringbuffer_array_wraparound(self):
+        buff = Buffer(np.zeros((0, 2)), length=3, ringbuffer=True)
+        for i in range(10):
+            buff.send(np.array([[i, i*2]]))
+        self.assertEqual(buff.data, np.array([[7, 14], [8, 16], [9, 18]]))
+
+    def test_ringbuffer_array_patch_larger_than_length(self):
+        buff = Buffer(np.array([[0, 1]]), length=1, ringbuffer=True)
+        buff.send(np.array([[1, 2], [2, 3]]))
+        self.assertEqual(buff.data, np.array([[2, 3]]))
+
+    def test_ringbuffer_dict_wraparound(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array([1])}, length=2, ringbuffer=True)
+        for i in range(1, 6):
+            buff.send({'x': np.array([i]), 'y': np.array([i+1])})
+        self.assertEqual(buff.data, {'x': np.array([4, 5]), 'y': np.array([5, 6])})
+
+    def test_ringbuffer_dict_clear(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array([1])}, ringbuffer=True)
+        buff.clear()
+        buff.send({'x': np.array([1]), 'y': np.array([2])})
+        self.assertEqual(buff.data, {'x': np.array([1]), 'y': np.array([2])})
+
+    def test_ringbuffer_dframe_wraparound(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        data = pd.DataFrame({'x': np.array([0]), 'y': np.array([1])})
+        buff = Buffer(data, length=2, index=False, ringbuffer=True)
+        for i in range(1, 6):
+            buff.send(pd.DataFrame({'x': np.array([i]), 'y': np.array([i+1])}, index=[i]))
+        dframe = pd.DataFrame({'x': np.array([4, 5]), 'y': np.array([5, 6])}, index=[4, 5])
+        self.assertEqual(buff.data, dframe)
+
+    def test_ringbuffer_dframe_send_with_index(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        data = pd.DataFrame({'x': np.array([0]), 'y': np.array([1])})
+        buff = Buffer(data, ringbuffer=True)
+        buff.send(pd.DataFrame({'x': np.array([1]), 'y': np.array([2])}))
+        dframe = pd.DataFrame({'x': np.array([0, 1]), 'y': np.array([1, 2])}, index=[0, 0])
+        self.assertEqual(buff.data.values, dframe.reset_index().values)
+        self.assertEqual(list(buff.data.columns), ['index', 'x', 'y'])
+
+
+class TestBufferRanges(ComparisonTestCase):
+
+    def test_buffer_array_ranges(self):
+        buff = Buffer(np.array([[0, 5]]), length=2)
+        buff.send(np.array([[1, 3], [2, 4]]))
+        self.assertEqual(buff.ranges, OrderedDict([(0, (1, 2)), (1, (3, 4))]))
+
+    def test_buffer_dict_ranges_clear(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array([1])})
+        buff.clear()
+        buff.send({'x': np.array([2]), 'y': np.array([3])})
+        self.assertEqual(buff.ranges, OrderedDict([('x', (2, 2)), ('y', (3, 3))]))
+
+    def test_buffer_dframe_ranges_skip_strings(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        buff = Buffer(pd.DataFrame({'x': [0, 1], 'y': ['a', 'b']}))
+        self.assertEqual(buff.ranges, OrderedDict([('index', (0, 1)), ('x', (0, 1))]))
+
+    def test_buffer_ringbuffer_ranges(self):
+        buff = Buffer(np.zeros((0, 2)), length=3, ringbuffer=True)
+        for i in range(10):
+            buff.send(np.array([[i, -i]]))
+        self.assertEqual(buff.ranges, OrderedDict([(0, (7, 9)), (1, (-9, -7))]))
+
+    def _disable_range(self, dataset):
+        "Ensures ranges are not computed from the data of the dataset"
+        def range(cls, dataset, dim):
+            raise AssertionError('Range of %s was computed from the data' % dim)
+        dataset.interface = type('NoRange', (dataset.interface,),
+                                 {'range': classmethod(range)})
+
+    def test_buffer_ranges_used_by_dynamicmap_elements(self):
+        buff = Buffer(np.array([[0, 5]]), length=2)
+        dmap = DynamicMap(lambda data: Dataset(data, kdims=['x'], vdims=['y'],
+                                               datatype=['array']), streams=[buff])
+        buff.send(np.array([[1, 3]]))
+        ds = dmap[()]
+        self.assertIs(ds.data, buff.data)
+        self._disable_range(ds)
+        self.assertEqual(ds.range('x'), (0, 1))
+        self.assertEqual(ds.range('y'), (3, 5))
+
+    def test_buffer_dict_ranges_used_by_dynamicmap_elements(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array([1])})
+        dmap = DynamicMap(lambda data: Dataset(data, kdims=['x'], vdims=['y'],
+                                               datatype=['dictionary']), streams=[buff])
+        buff.send({'x': np.array([2]), 'y': np.array([-1])})
+        ds = dmap[()]
+        self.assertIs(ds.data['x'], buff.data['x'])
+        self._disable_range(ds)
+        self.assertEqual(ds.range('x'), (0, 2))
+        self.assertEqual(ds.range('y'), (-1, 1))
+
+    def test_buffer_ranges_not_used_after_inplace_modification(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        buff = Buffer(pd.DataFrame({'x': np.arange(11.), 'y': np.arange(11.)}), index=False)
+        def callback(data):
+            data['y'] = data['y']*100
+            return Dataset(data, kdims=['x'], vdims=['y'])
+        dmap = DynamicMap(callback, streams=[buff])
+        buff.send(pd.DataFrame({'x': [11.], 'y': [10.]}))
+        self.assertEqual(dmap[()].range('y'), (0, 1000))
+
+    def test_buffer_ranges_not_used_for_unsubscribed_elements(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        buff = Buffer(pd.DataFrame({'x': np.arange(11.), 'y': np.arange(11.)}), index=False)
+        buff.send(pd.DataFrame({'x': [11.], 'y': [10.]}))
+        data = buff.data
+        data['y'] = data['y']*100
+        self.assertEqual(Dataset(data, kdims=['x'], vdims=['y']).range('y'), (0, 1000))
+
+    def test_buffer_stream_position(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array([5])}, length=2)
+        dmap = DynamicMap(lambda data: Dataset(data, kdims=['x'], vdims=['y'],
+                                               datatype=['dictionary']), streams=[buff])
+        buff.send({'x': np.array([1, 2]), 'y': np.array([3, 4])})
+        stream, source, end, length = dmap[()]._data_cache_dict()['stream_position']
+        self.assertIs(stream, buff)
+        self.assertEqual((end, length), (3, 2))
+        buff.clear()
+        self.assertIsNot(dmap[()]._data_cache_dict()['stream_position'][1], source)
+
 class TestBufferDataFrameStream(ComparisonTestCase):
 
     def setUp(self):